@@ -0,0 +1,128 @@
+from typing import Callable, Dict, List
+
+from algotrader_com.domain.market_data import Bar, MarketDataEvent, Tick, Trade
+from algotrader_com.domain.resampling import bar_size_to_millis
+
+
+class _BarBuffers:
+    """Open bar of each security for one bar size, one slot per security in preallocated lists."""
+
+    def __init__(self, bar_size, capacity):
+        # type: (str, int) -> None
+        self.bar_size = bar_size
+        self.size_millis = bar_size_to_millis(bar_size)
+        self.start = [None] * capacity  # type: List
+        self.open = [None] * capacity  # type: List
+        self.high = [None] * capacity  # type: List
+        self.low = [None] * capacity  # type: List
+        self.close = [None] * capacity  # type: List
+        self.vol = [0] * capacity  # type: List
+        self.turnover = [0] * capacity  # type: List
+
+    def grow(self, capacity):
+        # type: (int) -> None
+        added = capacity - len(self.start)
+        for field in (self.start, self.open, self.high, self.low, self.close):
+            field.extend([None] * added)
+        self.vol.extend([0] * added)
+        self.turnover.extend([0] * added)
+
+
+class BarAggregator:
+    """Builds bars of several bar sizes at once from ticks and trades as they arrive, with constant work per event
+       and bar size. A bar closes when the first event of a later bar of the same security arrives, or on close_bars.
+       Bars start at multiples of their bar size since the epoch, their date_time is the bar start.
+       Trades add their size to vol and vwap, ticks carry no trade size and only move the prices.
+
+       Attach to a strategy with StrategyService.add_bar_aggregator to receive the bars in on_bar.
+
+       Attributes:
+           bar_sizes (List of str): MSEC_1 to DAY_2, see algotrader_com.domain.resampling.bar_size_to_millis
+           on_bar (Callable[[Bar], None]): called with each closed bar
+           price (str): tick price used: "last", "bid", "ask" or "mid" (average of bid and ask)
+    """
+
+    def __init__(self, bar_sizes, on_bar, price="last", capacity=16):
+        # type: (List[str], Callable[[Bar], None], str, int) -> None
+        self.bar_sizes = bar_sizes
+        self.on_bar = on_bar
+        self.price = price
+        self._slots = {}  # type: Dict[int, int]
+        self._connector_descriptors = [None] * capacity  # type: List[str]
+        self._buffers = [_BarBuffers(bar_size, capacity) for bar_size in bar_sizes]
+
+    def on_tick(self, tick):
+        # type: (Tick) -> None
+        if self.price == "mid":
+            if tick.bid is None or tick.ask is None:
+                return
+            price = (tick.bid + tick.ask) / 2
+        else:
+            price = getattr(tick, self.price)
+        if price is not None:
+            self._add(tick, price, 0)
+
+    def on_trade(self, trade):
+        # type: (Trade) -> None
+        if trade.last_price is not None:
+            self._add(trade, trade.last_price, trade.last_size or 0)
+
+    def close_bars(self, until_millis):
+        # type: (int) -> None
+        """Closes the open bars ending at or before until_millis, e.g. from a timer when events stop arriving.
+
+           Arguments:
+               until_millis (int): epoch milliseconds
+        """
+        for security_id, slot in self._slots.items():
+            for buffers in self._buffers:
+                start = buffers.start[slot]
+                if start is not None and start + buffers.size_millis <= until_millis:
+                    self._fire(buffers, slot, security_id)
+                    buffers.start[slot] = None
+
+    def _slot(self, event):
+        # type: (MarketDataEvent) -> int
+        slot = self._slots[event.security_id] = len(self._slots)
+        if slot == len(self._connector_descriptors):
+            capacity = max(2 * slot, 1)
+            self._connector_descriptors.extend([None] * (capacity - slot))
+            for buffers in self._buffers:
+                buffers.grow(capacity)
+        self._connector_descriptors[slot] = event.connector_descriptor
+        return slot
+
+    def _add(self, event, price, size):
+        # type: (MarketDataEvent, object, object) -> None
+        slot = self._slots.get(event.security_id)
+        if slot is None:
+            slot = self._slot(event)
+        millis = event.date_time_millis
+        for buffers in self._buffers:
+            start = millis - millis % buffers.size_millis
+            current = buffers.start[slot]
+            if current is not None and start > current:
+                self._fire(buffers, slot, event.security_id)
+                current = None
+            if current is None:
+                buffers.start[slot] = start
+                buffers.open[slot] = buffers.high[slot] = buffers.low[slot] = price
+                buffers.vol[slot] = size
+                buffers.turnover[slot] = price * size
+            else:
+                if price > buffers.high[slot]:
+                    buffers.high[slot] = price
+                elif price < buffers.low[slot]:
+                    buffers.low[slot] = price
+                buffers.vol[slot] += size
+                buffers.turnover[slot] += price * size
+            buffers.close[slot] = price
+
+    def _fire(self, buffers, slot, security_id):
+        # type: (_BarBuffers, int, int) -> None
+        vol = buffers.vol[slot]
+        vwap = buffers.turnover[slot] / vol if vol else buffers.close[slot]
+        bar = Bar(None, self._connector_descriptors[slot], security_id, buffers.bar_size, buffers.open[slot],
+                  buffers.high[slot], buffers.low[slot], buffers.close[slot], vol, vwap)
+        bar.date_time_millis = buffers.start[slot]
+        self.on_bar(bar)
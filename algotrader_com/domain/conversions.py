@@ -1,7 +1,8 @@
+import json
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Union
 
 import jsonpickle
 import pytz
@@ -14,6 +15,11 @@ from tzlocal import get_localzone
 from py4j.java_gateway import JavaObject
 from pytz import tzinfo  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # noinspection PyAbstractClass
 class _DecimalHandler(jsonpickle.handlers.BaseHandler):
@@ -38,6 +44,67 @@ jsonpickle.handlers.registry.register(Decimal, _DecimalHandler)
 jsonpickle.handlers.registry.register(datetime, _DatetimeHandler)
 
 
+def _orjson_loads(json_str):
+    # type: (str) -> Any
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        # NaN/Infinity literals and integers beyond 64 bits are rejected by orjson but accepted by the stdlib parser
+        return json.loads(json_str)
+
+
+# JSON decoder backends for Conversions.unmarshall, the fastest available one is selected at import time
+_JSON_DECODERS = {"json": json.loads}
+if orjson is not None:
+    _JSON_DECODERS["orjson"] = _orjson_loads
+_json_decoder_name = "orjson" if orjson is not None else "json"
+_json_decoder = _JSON_DECODERS[_json_decoder_name]
+
+# per class snake_case attribute name to camelCase JSON field name maps used by Conversions.marshall,
+#  filled in on first use of each attribute
+_field_maps = {}  # type: Dict[type, Dict[str, str]]
+
+# time zone of datetimes converted from epoch milliseconds by Conversions.epoch_millis_to_python_datetime,
+#  the local zone is resolved once instead of on every event, see Conversions.set_time_zone_mode
+_TIME_ZONE_MODES = ("local", "utc")
+_time_zone_mode = "local"
+_event_time_zone = get_localzone()
+# see Conversions.set_lazy_date_times
+_lazy_date_times = False
+# see Conversions.set_lazy_market_data_events
+_lazy_market_data_events = False
+# pytz zones by UTC offset in hours, see Conversions.get_local_time_zone
+_local_time_zones = {}  # type: Dict[float, tzinfo]
+
+# number type of market data prices and volumes, see Conversions.set_numeric_mode
+_NUMERIC_MODES = ("decimal", "float", "scaled")
+_numeric_mode = "decimal"
+_numeric_scale = 8
+_scale_factor = 10 ** _numeric_scale
+# scaled values above this are computed from the decimal digits of the float, the float product is not exact
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _float_to_float(float_number):
+    # type: (float) -> float
+    if float_number is None:
+        # noinspection PyTypeChecker
+        return None
+    return float(float_number)
+
+
+def _float_to_scaled_int(float_number):
+    # type: (float) -> int
+    if float_number is None:
+        # noinspection PyTypeChecker
+        return None
+    scaled = float_number * _scale_factor
+    if -_MAX_EXACT_FLOAT_INT < scaled < _MAX_EXACT_FLOAT_INT:
+        return round(scaled)
+    # e.g. large volumes: the product of floats has no integer precision above 2 ** 53
+    return int(Decimal(repr(float_number)).scaleb(_numeric_scale).to_integral_value())
+
+
 class Conversions:
     """Internal class with convenience methods."""
 
@@ -56,7 +123,30 @@ class Conversions:
         if json is None:
             # noinspection PyTypeChecker
             return None
-        return jsonpickle.decode(json)
+        return _json_decoder(json)
+
+    @staticmethod
+    def get_json_decoder():
+        # type: () -> str
+        """
+           Returns:
+               str: Name of the JSON decoder backend used by unmarshall, "orjson" or "json"
+        """
+        return _json_decoder_name
+
+    @staticmethod
+    def set_json_decoder(name):
+        # type: (str) -> None
+        """Overrides the JSON decoder backend selected at import time.
+
+           Args:
+               name (str): "json" (Python standard library) or "orjson" (if installed)
+        """
+        if name not in _JSON_DECODERS:
+            raise Exception("Unsupported JSON decoder '" + name + "', available: " + ", ".join(_JSON_DECODERS) + ".")
+        global _json_decoder_name, _json_decoder
+        _json_decoder_name = name
+        _json_decoder = _JSON_DECODERS[name]
 
     @staticmethod
     def marshall(obj, class_name=None):
@@ -68,18 +158,42 @@ class Conversions:
            Returns:
                str: JSON string
         """
+        json_object = Conversions._to_json_value(obj)
         if class_name is not None:
-            obj._class_name = class_name
-        json_value = jsonpickle.dumps(obj, unpicklable=False)
-        if class_name is not None:
-            delattr(obj, "_class_name")
-        if class_name is not None:
-            json_value = json_value.replace("_class_name", "@class")
-        if hasattr(obj, "__dict__"):
-            for _property in obj.__dict__:
-                camel_cased = stringcase.camelcase(_property)
-                json_value = json_value.replace("\"" + _property + "\"", "\"" + camel_cased + "\"")
-        return json_value
+            json_object["@class"] = class_name
+        return json.dumps(json_object)
+
+    @staticmethod
+    def _to_json_value(value):
+        # type: (Any) -> Any
+        """Converts a value to its JSON friendly form: objects to dictionaries with camelCase keys,
+           Decimals to strings and datetimes to epoch milliseconds. Does not modify the value."""
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if isinstance(value, Decimal):
+            return value.__str__()
+        if isinstance(value, datetime):
+            return Conversions.python_datetime_to_millis(value)
+        if isinstance(value, (list, tuple, set)):
+            return [Conversions._to_json_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: Conversions._to_json_value(item) for key, item in value.items()}
+        if hasattr(value, "__dict__"):
+            field_map = _field_maps.get(value.__class__)
+            if field_map is None:
+                field_map = _field_maps[value.__class__] = {}
+            # scaled int market data prices set as order prices are sent as their Decimal value
+            price_fields = getattr(value.__class__, "_price_fields", ()) if _numeric_mode == "scaled" else ()
+            json_object = {}
+            for _property, item in value.__dict__.items():
+                camel_cased = field_map.get(_property)
+                if camel_cased is None:
+                    camel_cased = field_map[_property] = stringcase.camelcase(_property)
+                if _property in price_fields and isinstance(item, int) and not isinstance(item, bool):
+                    item = Conversions.scaled_int_to_decimal(item)
+                json_object[camel_cased] = Conversions._to_json_value(item)
+            return json_object
+        return value
 
     @staticmethod
     def float_to_decimal(float_number):
@@ -95,6 +209,79 @@ class Conversions:
             return None
         return Decimal(str(float_number))
 
+    @staticmethod
+    def to_market_data_number(float_number):
+        # type: (float) -> Union[Decimal, float, int]
+        """Converts a market data price or volume received as JSON number according to the numeric mode,
+           see set_numeric_mode. Replaced by the converter of the selected mode.
+
+           Args:
+               float_number (float): &nbsp;
+           Returns:
+               Union[Decimal, float, int]
+        """
+        return Conversions.float_to_decimal(float_number)
+
+    @staticmethod
+    def set_numeric_mode(mode, scale=8):
+        # type: (str, int) -> None
+        """Sets the number type of prices and volumes of market data events (Tick, Bar, Trade, quotes, ...)
+           converted from JSON. Orders, transactions and other entities always use Decimal. In the "scaled" mode
+           int order prices (limit, stop, ...) are marshalled as scaled values, quantities are not converted.
+
+           Args:
+               mode (str): "decimal" (default, exact), "float" (fastest, for float arithmetic in strategies) or
+                           "scaled" (fixed-point int, the value multiplied by 10 ** scale)
+               scale (int): number of decimal places kept by the "scaled" mode. Scaled values up to 2 ** 53
+                            (about 9e7 with the default scale 8) are computed with float arithmetic, larger ones,
+                            e.g. large volumes, from the decimal digits of the value at a higher cost
+        """
+        if mode not in _NUMERIC_MODES:
+            raise Exception("Unsupported numeric mode '" + mode + "', available: " + ", ".join(_NUMERIC_MODES) + ".")
+        global _numeric_mode, _numeric_scale, _scale_factor
+        _numeric_mode = mode
+        _numeric_scale = scale
+        _scale_factor = 10 ** scale
+        if mode == "decimal":
+            Conversions.to_market_data_number = staticmethod(Conversions.float_to_decimal)
+        elif mode == "float":
+            Conversions.to_market_data_number = staticmethod(_float_to_float)
+        else:
+            Conversions.to_market_data_number = staticmethod(_float_to_scaled_int)
+
+    @staticmethod
+    def get_numeric_mode():
+        # type: () -> str
+        """
+           Returns:
+               str: "decimal", "float" or "scaled", see set_numeric_mode
+        """
+        return _numeric_mode
+
+    @staticmethod
+    def get_numeric_scale():
+        # type: () -> int
+        """
+           Returns:
+               int: number of decimal places of "scaled" numeric mode values
+        """
+        return _numeric_scale
+
+    @staticmethod
+    def scaled_int_to_decimal(scaled_int):
+        # type: (int) -> Decimal
+        """Converts a "scaled" numeric mode value back to an exact Decimal, e.g. for an order limit price.
+
+           Args:
+               scaled_int (int): &nbsp;
+           Returns:
+               Decimal
+        """
+        if scaled_int is None:
+            # noinspection PyTypeChecker
+            return None
+        return Decimal(scaled_int).scaleb(-_numeric_scale)
+
     @staticmethod
     def epoch_millis_to_python_datetime(millis):
         # type: (int) -> datetime
@@ -102,13 +289,81 @@ class Conversions:
            Args:
                millis (int): epoch time in milliseconds
            Returns:
-               datetime
+               datetime: in the local time zone or UTC, see set_time_zone_mode
         """
         if millis is None:
             # noinspection PyTypeChecker
             return None
-        _datetime = datetime.fromtimestamp(millis // 1000).replace(microsecond=millis % 1000 * 1000)
-        return get_localzone().localize(_datetime)
+        return datetime.fromtimestamp(millis // 1000, _event_time_zone).replace(microsecond=millis % 1000 * 1000)
+
+    @staticmethod
+    def set_time_zone_mode(mode):
+        # type: (str) -> None
+        """Sets the time zone of datetimes converted from epoch milliseconds (market data and other event times).
+
+           Args:
+               mode (str): "local" (default) for the local time zone, resolved once when set, or "utc"
+        """
+        if mode not in _TIME_ZONE_MODES:
+            raise Exception("Unsupported time zone mode '" + mode + "', available: " + ", ".join(_TIME_ZONE_MODES) + ".")
+        global _time_zone_mode, _event_time_zone
+        _time_zone_mode = mode
+        _event_time_zone = get_localzone() if mode == "local" else pytz.utc
+
+    @staticmethod
+    def get_time_zone_mode():
+        # type: () -> str
+        """
+           Returns:
+               str: "local" or "utc"
+        """
+        return _time_zone_mode
+
+    @staticmethod
+    def set_lazy_date_times(lazy):
+        # type: (bool) -> None
+        """Enables or disables lazy datetimes on market data events. When enabled, events converted from JSON keep
+           only the epoch milliseconds (e.g. Tick.date_time_millis) and build the datetime on first read of the
+           corresponding attribute (e.g. Tick.date_time). Strategies only comparing timestamps should use the
+           *_millis attributes.
+
+           Args:
+               lazy (bool): &nbsp;
+        """
+        global _lazy_date_times
+        _lazy_date_times = lazy
+
+    @staticmethod
+    def is_lazy_date_times():
+        # type: () -> bool
+        """
+           Returns:
+               bool: True if market data events build their datetimes lazily, see set_lazy_date_times
+        """
+        return _lazy_date_times
+
+    @staticmethod
+    def set_lazy_market_data_events(lazy):
+        # type: (bool) -> None
+        """Enables or disables lazy Tick, Bar, Trade, Bid, Ask and BidAskQuote events. When enabled, events converted
+           from JSON wrap the decoded dictionary and convert each attribute on its first access, caching the result.
+           Handlers reading only a few fields of each event skip converting the rest, handlers reading every field
+           are slower than with eager events. Implies lazy datetimes.
+
+           Args:
+               lazy (bool): &nbsp;
+        """
+        global _lazy_market_data_events
+        _lazy_market_data_events = lazy
+
+    @staticmethod
+    def is_lazy_market_data_events():
+        # type: () -> bool
+        """
+           Returns:
+               bool: True if market data events are converted lazily, see set_lazy_market_data_events
+        """
+        return _lazy_market_data_events
 
     @staticmethod
     def zoned_date_time_to_python_datetime(java_zoned_date_time):
@@ -171,8 +426,10 @@ class Conversions:
         """
 
         offset_hour = int(time.localtime().tm_gmtoff) / 3600
-
-        return pytz.timezone('Etc/GMT%+d' % -offset_hour)
+        time_zone = _local_time_zones.get(offset_hour)
+        if time_zone is None:
+            time_zone = _local_time_zones[offset_hour] = pytz.timezone('Etc/GMT%+d' % -offset_hour)
+        return time_zone
 
     @staticmethod
     def local_date_to_python_datetime(java_local_date, py4jgateway):
@@ -195,6 +452,27 @@ class Conversions:
         with_timezone = local_tz.localize(_datetime)
         return with_timezone
 
+    @staticmethod
+    def local_date_json_to_python_datetime(local_date):
+        # type: (Union[str, list]) -> datetime
+        """Converts a JSON serialized java.time.LocalDate like local_date_to_python_datetime, assuming the JVM runs
+           in the local time zone.
+
+           Args:
+               local_date: "yyyy-MM-dd" string or [year, month, day] list
+           Returns:
+               datetime: start of the day in the local time zone or UTC, see set_time_zone_mode
+        """
+        if local_date is None:
+            # noinspection PyTypeChecker
+            return None
+        if isinstance(local_date, str):
+            local_date = local_date.split("-")
+        _datetime = datetime(int(local_date[0]), int(local_date[1]), int(local_date[2]))
+        if hasattr(_event_time_zone, "localize"):
+            return _event_time_zone.localize(_datetime)
+        return _datetime.replace(tzinfo=_event_time_zone)
+
     @staticmethod
     def python_datetime_to_localdate(date_time, py4jgateway):
         # type: (datetime, ClientServer) -> JavaObject
@@ -9,24 +9,113 @@ from py4j.java_gateway import JavaObject
 from algotrader_com.domain.conversions import Conversions
 
 
+def _json_value(key):
+    return lambda vo_dict: vo_dict[key]
+
+
+def _json_number(key):
+    return lambda vo_dict: Conversions.to_market_data_number(vo_dict[key])
+
+
 class MarketDataEvent:
     """Mirrors ch.algotrader.entity.marketData.MarketDataEventVO. AlgoTrader Java
     class with fields using Python types. Any type of market data related to a
     particular security.
+    Prices and volumes of events converted from JSON are Decimal, float or scaled int values
+    depending on the numeric mode, see Conversions.set_numeric_mode.
+    Events use __slots__ to keep many of them in memory, so only the documented attributes can be set
+    unless the event class is subclassed.
+
     Attributes:
         date_time (datetime): &nbsp;
+        date_time_millis (int): date_time as epoch milliseconds
         .. include:: ../adapter_types.txt
         security_id (int): &nbsp;
     """
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.MarketDataEventVO"
 
+    # _vo_dict is only set on lazy events, see Conversions.set_lazy_market_data_events
+    __slots__ = ("_date_time", "_date_time_millis", "connector_descriptor", "security_id", "_vo_dict")
+
+    # attribute name to converter from the JSON dictionary for lazy events, see Conversions.set_lazy_market_data_events
+    _LAZY_FIELDS = {
+        "_date_time": lambda vo_dict: None,
+        "_date_time_millis": _json_value("dateTime"),
+        "connector_descriptor": lambda vo_dict: vo_dict["connectorDescriptor"]["descriptor"],
+        "security_id": _json_value("securityId"),
+    }
+
+    # subclasses by Java value object class name and by JSON objectType, filled as subclasses are defined
+    _subclasses_by_java_class = {}  # type: Dict[str, type]
+    _subclasses_by_object_type = {}  # type: Dict[str, type]
+
     def __init__(self, date_time=None, connector_descriptor=None, security_id=None):
         # type: (datetime, str, int) -> None
         self.date_time = date_time
         self.connector_descriptor = connector_descriptor  # "IB", "BMX" etc.
         self.security_id = security_id
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # only concrete events defining their own JAVA_CLASS are registered, the object type is the class name
+        if "JAVA_CLASS" in cls.__dict__:
+            if "convert_from_vo" in cls.__dict__:
+                MarketDataEvent._subclasses_by_java_class[cls.JAVA_CLASS] = cls
+            if "convert_from_json_object" in cls.__dict__:
+                MarketDataEvent._subclasses_by_object_type[cls.__name__] = cls
+
+    def __getattr__(self, name):
+        # only called for attributes not set, i.e. fields of a lazy event not converted yet
+        converter = self._LAZY_FIELDS.get(name)
+        if converter is None:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        value = converter(self._vo_dict)
+        object.__setattr__(self, name, value)
+        return value
+
+    @classmethod
+    def _create_lazy(cls, vo_dict):
+        # type: (Dict) -> MarketDataEvent
+        """Creates an event wrapping the JSON dictionary, its attributes are converted on first access."""
+        event = cls.__new__(cls)
+        event._vo_dict = vo_dict
+        return event
+
+    @property
+    def date_time(self):
+        # type: () -> datetime
+        if self._date_time is None and self._date_time_millis is not None:
+            self._date_time = Conversions.epoch_millis_to_python_datetime(self._date_time_millis)
+        return self._date_time
+
+    @date_time.setter
+    def date_time(self, date_time):
+        # type: (datetime) -> None
+        self._date_time = date_time
+        self._date_time_millis = None
+
+    @property
+    def date_time_millis(self):
+        # type: () -> int
+        if self._date_time_millis is None and self._date_time is not None:
+            self._date_time_millis = Conversions.python_datetime_to_millis(self._date_time)
+        return self._date_time_millis
+
+    @date_time_millis.setter
+    def date_time_millis(self, millis):
+        # type: (int) -> None
+        self._date_time_millis = millis
+        self._date_time = None
+
+    def _set_date_time_from_json(self, millis):
+        # type: (int) -> None
+        """Sets the event time from the epoch milliseconds of a JSON value object. The datetime is built right away
+           unless lazy datetimes are enabled, see Conversions.set_lazy_date_times."""
+        self._date_time_millis = millis
+        if not Conversions.is_lazy_date_times():
+            self._date_time = Conversions.epoch_millis_to_python_datetime(millis)
+
     @staticmethod
     def convert_from_vo(vo):
         # type: (JavaObject) -> MarketDataEvent
@@ -38,23 +127,11 @@ class MarketDataEvent:
         """
         if vo is None:
             return None
-        if vo.getClass().getCanonicalName() == Tick.JAVA_CLASS:
-            event = Tick.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == Bar.JAVA_CLASS:
-            event = Bar.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == Trade.JAVA_CLASS:
-            event = Trade.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == Bid.JAVA_CLASS:
-            event = Bid.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == Ask.JAVA_CLASS:
-            event = Ask.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == BidAskQuote.JAVA_CLASS:
-            event = BidAskQuote.convert_from_vo(vo)  # type: ignore
-        elif vo.getClass().getCanonicalName() == GenericTick.JAVA_CLASS:
-            event = GenericTick.convert_from_vo(vo)  # type: ignore
-        else:
-            raise Exception("Unsupported market data event type " + vo.getClass().getSimpleName() + ".")
-        return event
+        java_class = vo.getClass().getCanonicalName()
+        event_class = MarketDataEvent._subclasses_by_java_class.get(java_class)
+        if event_class is None:
+            raise Exception("Unsupported market data event type " + java_class + ".")
+        return event_class.convert_from_vo(vo)
 
     @staticmethod
     def convert_from_json_object(vo_dict):
@@ -66,23 +143,10 @@ class MarketDataEvent:
            Returns:
                MarketDataEvent
         """
-        if vo_dict["objectType"] == "Tick":
-            event = Tick.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "Bar":
-            event = Bar.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "Trade":
-            event = Trade.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "Bid":
-            event = Bid.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "Ask":
-            event = Ask.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "BidAskQuote":
-            event = BidAskQuote.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "GenericTick":
-            event = GenericTick.convert_from_json(vo_dict)  # type: ignore
-        else:
+        event_class = MarketDataEvent._subclasses_by_object_type.get(vo_dict["objectType"])
+        if event_class is None:
             raise Exception("Unsupported market data event type " + vo_dict["objectType"] + ".")
-        return event
+        return event_class.convert_from_json_object(vo_dict)
 
 
 class Tick(MarketDataEvent):
@@ -94,6 +158,7 @@ class Tick(MarketDataEvent):
         security_id (int): &nbsp;
         last (Decimal): The last trade price.
         last_date_time (datetime): The dateTime of the last trade.
+        last_date_time_millis (int): last_date_time as epoch milliseconds
         bid (Decimal): The bid price.
         ask (Decimal): The ask price
         vol_bid (Decimal): The volume on the bid side.
@@ -102,6 +167,19 @@ class Tick(MarketDataEvent):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.TickVO"
 
+    __slots__ = ("last", "_last_date_time", "_last_date_time_millis", "bid", "ask", "vol_bid", "vol_ask", "vol")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "last": _json_number("last"),
+        "_last_date_time": lambda vo_dict: None,
+        "_last_date_time_millis": _json_value("lastDateTime"),
+        "bid": _json_number("bid"),
+        "ask": _json_number("ask"),
+        "vol_bid": _json_number("volBid"),
+        "vol_ask": _json_number("volAsk"),
+        "vol": _json_number("vol")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -122,6 +200,39 @@ class Tick(MarketDataEvent):
         self.vol_ask = vol_ask
         self.vol = vol
 
+    @property
+    def last_date_time(self):
+        # type: () -> datetime
+        if self._last_date_time is None and self._last_date_time_millis is not None:
+            self._last_date_time = Conversions.epoch_millis_to_python_datetime(self._last_date_time_millis)
+        return self._last_date_time
+
+    @last_date_time.setter
+    def last_date_time(self, last_date_time):
+        # type: (datetime) -> None
+        self._last_date_time = last_date_time
+        self._last_date_time_millis = None
+
+    @property
+    def last_date_time_millis(self):
+        # type: () -> int
+        if self._last_date_time_millis is None and self._last_date_time is not None:
+            self._last_date_time_millis = Conversions.python_datetime_to_millis(self._last_date_time)
+        return self._last_date_time_millis
+
+    @last_date_time_millis.setter
+    def last_date_time_millis(self, millis):
+        # type: (int) -> None
+        self._last_date_time_millis = millis
+        self._last_date_time = None
+
+    def _set_last_date_time_from_json(self, millis):
+        # type: (int) -> None
+        """See MarketDataEvent._set_date_time_from_json."""
+        self._last_date_time_millis = millis
+        if not Conversions.is_lazy_date_times():
+            self._last_date_time = Conversions.epoch_millis_to_python_datetime(millis)
+
     @staticmethod
     def convert_from_vo(tick_vo):
         # type: (JavaObject) -> Tick
@@ -154,16 +265,18 @@ class Tick(MarketDataEvent):
            Returns:
                Tick
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        last_date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['lastDateTime'])
-        tick = Tick(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
-                    Conversions.float_to_decimal(vo_dict['last']),
-                    last_date_time,
-                    Conversions.float_to_decimal(vo_dict['bid']),
-                    Conversions.float_to_decimal(vo_dict['ask']),
-                    Conversions.float_to_decimal(vo_dict['volBid']),
-                    Conversions.float_to_decimal(vo_dict['volAsk']),
-                    Conversions.float_to_decimal(vo_dict['vol']))
+        if Conversions.is_lazy_market_data_events():
+            return Tick._create_lazy(vo_dict)  # type: ignore
+        tick = Tick(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
+                    Conversions.to_market_data_number(vo_dict['last']),
+                    None,
+                    Conversions.to_market_data_number(vo_dict['bid']),
+                    Conversions.to_market_data_number(vo_dict['ask']),
+                    Conversions.to_market_data_number(vo_dict['volBid']),
+                    Conversions.to_market_data_number(vo_dict['volAsk']),
+                    Conversions.to_market_data_number(vo_dict['vol']))
+        tick._set_date_time_from_json(vo_dict['dateTime'])
+        tick._set_last_date_time_from_json(vo_dict['lastDateTime'])
         return tick
 
     def convert_to_vo(self, py4jgateway):
@@ -213,6 +326,18 @@ class Bar(MarketDataEvent):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.BarVO"
 
+    __slots__ = ("bar_size", "open", "high", "low", "close", "vol", "vwap")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "bar_size": _json_value("barSize"),
+        "open": _json_number("open"),
+        "high": _json_number("high"),
+        "low": _json_number("low"),
+        "close": _json_number("close"),
+        "vol": _json_number("vol"),
+        "vwap": _json_number("vwap")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -254,14 +379,16 @@ class Bar(MarketDataEvent):
            Returns:
                Bar
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        bar = Bar(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'], vo_dict['barSize'],
-                  Conversions.float_to_decimal(vo_dict['open']),
-                  Conversions.float_to_decimal(vo_dict['high']),
-                  Conversions.float_to_decimal(vo_dict['low']),
-                  Conversions.float_to_decimal(vo_dict['close']),
-                  Conversions.float_to_decimal(vo_dict['vol']),
-                  Conversions.float_to_decimal(vo_dict['vwap']))
+        if Conversions.is_lazy_market_data_events():
+            return Bar._create_lazy(vo_dict)  # type: ignore
+        bar = Bar(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'], vo_dict['barSize'],
+                  Conversions.to_market_data_number(vo_dict['open']),
+                  Conversions.to_market_data_number(vo_dict['high']),
+                  Conversions.to_market_data_number(vo_dict['low']),
+                  Conversions.to_market_data_number(vo_dict['close']),
+                  Conversions.to_market_data_number(vo_dict['vol']),
+                  Conversions.to_market_data_number(vo_dict['vwap']))
+        bar._set_date_time_from_json(vo_dict['dateTime'])
         return bar
 
 
@@ -282,6 +409,15 @@ class Trade(MarketDataEvent):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.TradeVO"
 
+    __slots__ = ("last_price", "last_size", "vol", "side")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "last_price": _json_number("lastPrice"),
+        "last_size": _json_number("lastSize"),
+        "vol": _json_number("vol"),
+        "side": _json_value("side")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -328,12 +464,14 @@ class Trade(MarketDataEvent):
            Returns:
                Trade
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        trade = Trade(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
-                      Conversions.float_to_decimal(vo_dict['lastPrice']),
-                      Conversions.float_to_decimal(vo_dict['lastSize']),
-                      Conversions.float_to_decimal(vo_dict['vol']),
+        if Conversions.is_lazy_market_data_events():
+            return Trade._create_lazy(vo_dict)  # type: ignore
+        trade = Trade(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
+                      Conversions.to_market_data_number(vo_dict['lastPrice']),
+                      Conversions.to_market_data_number(vo_dict['lastSize']),
+                      Conversions.to_market_data_number(vo_dict['vol']),
                       vo_dict['side'])
+        trade._set_date_time_from_json(vo_dict['dateTime'])
         return trade
 
 
@@ -347,6 +485,8 @@ class Quote(MarketDataEvent):
         security_id (int): &nbsp;
     """
 
+    __slots__ = ()
+
     def __init__(self, date_time=None, adapter_type=None, security_id=None):
         # type: (datetime, str, int) -> None
         MarketDataEvent.__init__(self, date_time, adapter_type, security_id)
@@ -365,15 +505,11 @@ class Quote(MarketDataEvent):
            Returns:
                Quote
         """
-        if quote_vo.getObjectType() == "Bid":
-            quote = Bid.convert_from_vo(quote_vo)  # type: ignore
-        elif quote_vo.getObjectType() == "Ask":
-            quote = Ask.convert_from_vo(quote_vo)  # type: ignore
-        elif quote_vo.getObjectType() == "BidAskQuote":
-            quote = BidAskQuote.convert_from_vo(quote_vo)  # type: ignore
-        else:
-            raise Exception("Unexpected object type '" + quote_vo.getObjectType() + "'.")
-        return quote
+        object_type = quote_vo.getObjectType()
+        quote_class = MarketDataEvent._subclasses_by_object_type.get(object_type)
+        if quote_class is None or not issubclass(quote_class, Quote):
+            raise Exception("Unexpected object type '" + object_type + "'.")
+        return quote_class.convert_from_vo(quote_vo)
 
     @staticmethod
     def convert_from_json_object(vo_dict):
@@ -384,16 +520,10 @@ class Quote(MarketDataEvent):
            Returns:
                Quote
         """
-
-        if vo_dict["objectType"] == "Bid":
-            quote = Bid.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "Ask":
-            quote = Ask.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["objectType"] == "BidAskQuote":
-            quote = BidAskQuote.convert_from_json_object(vo_dict)  # type: ignore
-        else:
+        quote_class = MarketDataEvent._subclasses_by_object_type.get(vo_dict["objectType"])
+        if quote_class is None or not issubclass(quote_class, Quote):
             raise Exception("Unknown quote type: " + vo_dict["objectType"])
-        return quote
+        return quote_class.convert_from_json_object(vo_dict)
 
 
 class Bid(Quote):
@@ -410,6 +540,13 @@ class Bid(Quote):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.BidVO"
 
+    __slots__ = ("price", "size")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "price": _json_number("price"),
+        "size": _json_number("size")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -437,10 +574,12 @@ class Bid(Quote):
            Returns:
                Bid
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        bid = Bid(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
-                  Conversions.float_to_decimal(vo_dict['price']),
-                  Conversions.float_to_decimal(vo_dict['size']))
+        if Conversions.is_lazy_market_data_events():
+            return Bid._create_lazy(vo_dict)  # type: ignore
+        bid = Bid(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
+                  Conversions.to_market_data_number(vo_dict['price']),
+                  Conversions.to_market_data_number(vo_dict['size']))
+        bid._set_date_time_from_json(vo_dict['dateTime'])
         return bid
 
     @staticmethod
@@ -473,6 +612,13 @@ class Ask(Quote):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.AskVO"
 
+    __slots__ = ("price", "size")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "price": _json_number("price"),
+        "size": _json_number("size")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -500,10 +646,12 @@ class Ask(Quote):
            Returns:
                Ask
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        ask = Ask(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
-                  Conversions.float_to_decimal(vo_dict['price']),
-                  Conversions.float_to_decimal(vo_dict['size']))
+        if Conversions.is_lazy_market_data_events():
+            return Ask._create_lazy(vo_dict)  # type: ignore
+        ask = Ask(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
+                  Conversions.to_market_data_number(vo_dict['price']),
+                  Conversions.to_market_data_number(vo_dict['size']))
+        ask._set_date_time_from_json(vo_dict['dateTime'])
         return ask
 
     @staticmethod
@@ -538,6 +686,15 @@ class BidAskQuote(Quote):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.BidAskQuoteVO"
 
+    __slots__ = ("bid_price", "bid_size", "ask_price", "ask_size")
+
+    _LAZY_FIELDS = dict(MarketDataEvent._LAZY_FIELDS, **{
+        "bid_price": _json_number("bidPrice"),
+        "bid_size": _json_number("bidSize"),
+        "ask_price": _json_number("askPrice"),
+        "ask_size": _json_number("askSize")
+    })
+
     def get_java_class(self):
         # type: () -> str
         """
@@ -568,12 +725,14 @@ class BidAskQuote(Quote):
            Returns:
                BidAskQuote
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
-        bid_ask = BidAskQuote(date_time, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
-                              Conversions.float_to_decimal(vo_dict['bidPrice']),
-                              Conversions.float_to_decimal(vo_dict['bidSize']),
-                              Conversions.float_to_decimal(vo_dict['askPrice']),
-                              Conversions.float_to_decimal(vo_dict['askSize']))
+        if Conversions.is_lazy_market_data_events():
+            return BidAskQuote._create_lazy(vo_dict)  # type: ignore
+        bid_ask = BidAskQuote(None, vo_dict['connectorDescriptor']['descriptor'], vo_dict['securityId'],
+                              Conversions.to_market_data_number(vo_dict['bidPrice']),
+                              Conversions.to_market_data_number(vo_dict['bidSize']),
+                              Conversions.to_market_data_number(vo_dict['askPrice']),
+                              Conversions.to_market_data_number(vo_dict['askSize']))
+        bid_ask._set_date_time_from_json(vo_dict['dateTime'])
         return bid_ask
 
     @staticmethod
@@ -610,6 +769,8 @@ class GenericTick(MarketDataEvent):
 
     JAVA_CLASS = "ch.algotrader.entity.marketData.GenericTickVO"
 
+    __slots__ = ("id", "tick_type", "money_value", "double_value", "int_value")
+
     def __init__(self, id=None, date_time=None, connector_descriptor=None, security_id=None, tick_type=None, money_value=None,
                  double_value=None, int_value=None):
         # type: (int, datetime, str, int, str, Decimal, float, int) -> None
@@ -654,17 +815,17 @@ class GenericTick(MarketDataEvent):
                GenericTick
         """
         id = vo_dict["id"]
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
         connector_descriptor = vo_dict['connectorDescriptor']['descriptor']
         security_id = vo_dict['securityId']
         tick_type = vo_dict["tickType"]
         money_value = None
         if vo_dict['moneyValue'] is not None:
-            money_value = Conversions.float_to_decimal(vo_dict['moneyValue'])
+            money_value = Conversions.to_market_data_number(vo_dict['moneyValue'])
         double_value = vo_dict["doubleValue"]
         int_value = vo_dict["intValue"]
-        generic_tick = GenericTick(id, date_time, connector_descriptor, security_id, tick_type, money_value,
+        generic_tick = GenericTick(id, None, connector_descriptor, security_id, tick_type, money_value,
                                      double_value, int_value)
+        generic_tick._set_date_time_from_json(vo_dict['dateTime'])
         return generic_tick
 
     def convert_to_vo(self, py4jgateway):
@@ -703,6 +864,9 @@ class OrderBookLevel:
         amount (Decimal):  &nbsp;
         count (int):  &nbsp;
     """
+
+    __slots__ = ("price", "amount", "count")
+
     def __init__(self, price=None, amount=None, count=None):
         # type: (Decimal, Decimal, int) -> None
         self.price = price
@@ -779,7 +943,6 @@ class OrderBook(MarketDataEvent):
            Returns:
                OrderBook
         """
-        date_time = Conversions.epoch_millis_to_python_datetime(vo_dict['dateTime'])
         connector_descriptor = vo_dict['connectorDescriptor']
         descriptor = connector_descriptor['descriptor']
         security_id = vo_dict['securityId']
@@ -798,7 +961,8 @@ class OrderBook(MarketDataEvent):
             asks.append(ask)
         asks.sort(key=lambda x: x.price, reverse=False)
 
-        order_book = OrderBook(date_time, descriptor, security_id, bids, asks)
+        order_book = OrderBook(None, descriptor, security_id, bids, asks)
+        order_book._set_date_time_from_json(vo_dict['dateTime'])
         return order_book
 
 
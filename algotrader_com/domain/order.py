@@ -32,8 +32,14 @@ class Order(PropertyHolder):
            account_id (int): Represents an actual Account / AccountGroup / AllocationProfile with an external Broker / Bank
            portfolio_id (int): Represents a portfolio within the system. In addition the AlgoTrader Server is also represented by an instance of this class.
            last_status (str): The last known status of the order ( OPEN, SUBMITTED, PARTIALLY_EXECUTED, EXECUTED, CANCELED, REJECTED, CANCEL_FAILED, TARGET_REACHED)
+
+       In the "scaled" numeric mode (see Conversions.set_numeric_mode) int values of the price fields, e.g. a limit
+       set to tick.bid, are scaled market data prices and are marshalled as their Decimal value.
        """
 
+    # attributes holding prices, see Conversions.marshall
+    _price_fields = ("limit", "stop")
+
     def __init__(self, _id=None, int_id=None, ext_id=None, parent_int_id=None, date_time=None, side=None, quantity=None,
                  tif=None, tif_date_time=None, exchange_order=None, exchange_id=None, parent_order_id=None,
                  security_id=None, account_id=None, portfolio_id=None, last_status=None):
@@ -55,6 +61,15 @@ class Order(PropertyHolder):
         self.portfolio_id = portfolio_id
         self.last_status = last_status
 
+    # Java class name to Order subclass, filled as subclasses are defined
+    _subclasses_by_java_class = {}  # type: Dict[str, type]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # abstract orders (SimpleOrder, AlgoOrder, AdaptiveOrder) inherit get_java_class and are not registered
+        if "get_java_class" in cls.__dict__:
+            Order._subclasses_by_java_class[cls.get_java_class()] = cls
+
     @abstractmethod
     def convert_to_order_vo(self, _gateway):
         # type: (ClientServer) -> JavaObject
@@ -81,43 +96,11 @@ class Order(PropertyHolder):
         """
         if order_vo is None:
             return None
-        if order_vo.getClass().getCanonicalName() == MarketOrder.get_java_class():
-            order = MarketOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == LimitOrder.get_java_class():
-            order = LimitOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == StopOrder.get_java_class():
-            order = StopOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == StopLimitOrder.get_java_class():
-            order = StopLimitOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == PreviouslyIndicatedOrder.get_java_class():
-            order = PreviouslyIndicatedOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == TargetPositionOrder.get_java_class():
-            order = TargetPositionOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == TrailingLimitOrder.get_java_class():
-            order = TrailingLimitOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == TWAPOrder.get_java_class():
-            order = TWAPOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == VWAPOrder.get_java_class():
-            order = VWAPOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == POVOrder.get_java_class():
-            order = POVOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == IcebergOrder.get_java_class():
-            order = IcebergOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == SniperOrder.get_java_class():
-            order = SniperOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == MarketSweepOrder.get_java_class():
-            order = MarketSweepOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == SmartMarketOrder.get_java_class():
-            order = SmartMarketOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == SmartLimitOrder.get_java_class():
-            order = SmartLimitOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == SmartStopOrder.get_java_class():
-            order = SmartStopOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        elif order_vo.getClass().getCanonicalName() == SmartStopLimitOrder.get_java_class():
-            order = SmartStopLimitOrder.convert_to_order(order_vo, py4jgateway)  # type: ignore
-        else:
-            raise Exception("Unsupported order type " + order_vo.getClass().getSimpleName() + ".")
-        return order
+        java_class = order_vo.getClass().getCanonicalName()
+        order_class = Order._subclasses_by_java_class.get(java_class)
+        if order_class is None:
+            raise Exception("Unsupported order type " + java_class + ".")
+        return order_class.convert_to_order(order_vo, py4jgateway)
 
     @staticmethod
     def convert_from_json_object(vo_dict):
@@ -128,43 +111,10 @@ class Order(PropertyHolder):
            Returns:
                Order
         """
-        if vo_dict["@class"] == MarketOrder.get_java_class():
-            order = MarketOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == LimitOrder.get_java_class():
-            order = LimitOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == StopOrder.get_java_class():
-            order = StopOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == StopLimitOrder.get_java_class():
-            order = StopLimitOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == PreviouslyIndicatedOrder.get_java_class():
-            order = PreviouslyIndicatedOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == TrailingLimitOrder.get_java_class():
-            order = TrailingLimitOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == TargetPositionOrder.get_java_class():
-            order = TargetPositionOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == TWAPOrder.get_java_class():
-            order = TWAPOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == VWAPOrder.get_java_class():
-            order = VWAPOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == POVOrder.get_java_class():
-            order = POVOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == IcebergOrder.get_java_class():
-            order = IcebergOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == SniperOrder.get_java_class():
-            order = SniperOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == MarketSweepOrder.get_java_class():
-            order = MarketSweepOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == SmartMarketOrder.get_java_class():
-            order = SmartMarketOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == SmartLimitOrder.get_java_class():
-            order = SmartLimitOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == SmartStopOrder.get_java_class():
-            order = SmartStopOrder.convert_from_json_object(vo_dict)  # type: ignore
-        elif vo_dict["@class"] == SmartStopLimitOrder.get_java_class():
-            order = SmartStopLimitOrder.convert_from_json_object(vo_dict)  # type: ignore
-        else:
-            raise Exception("Unknown quote type: " + vo_dict["objectType"])
-        return order
+        order_class = Order._subclasses_by_java_class.get(vo_dict["@class"])
+        if order_class is None:
+            raise Exception("Unsupported order type " + vo_dict["@class"] + ".")
+        return order_class.convert_from_json_object(vo_dict)
 
 
 class SimpleOrder(Order):
@@ -188,8 +138,14 @@ class SimpleOrder(Order):
            account_id (int): Represents an actual Account / AccountGroup / AllocationProfile with an external Broker / Bank
            portfolio_id (int): Represents a portfolio within the system. In addition the AlgoTrader Server is also represented by an instance of this class.
            last_status (str): The last known status of the order ( OPEN, SUBMITTED, PARTIALLY_EXECUTED, EXECUTED, CANCELED, REJECTED, CANCEL_FAILED, TARGET_REACHED)
+
+       In the "scaled" numeric mode (see Conversions.set_numeric_mode) int values of the price fields, e.g. a limit
+       set to tick.bid, are scaled market data prices and are marshalled as their Decimal value.
        """
 
+    # attributes holding prices, see Conversions.marshall
+    _price_fields = ("limit", "stop")
+
     def __init__(self, _id=None, int_id=None, ext_id=None, parent_int_id=None, date_time=None, side=None, quantity=None,
                  tif=None, tif_date_time=None, exchange_order=None, exchange_id=None, parent_order_id=None,
                  security_id=None, account_id=None, portfolio_id=None, last_status=None):
@@ -1051,6 +1007,8 @@ class TrailingLimitOrder(AlgoOrder):
            increment (Decimal): For BUY orders (SELL orders) in case the market price rises (falls), the limit price is increased once it exceeds this amount
     """
 
+    _price_fields = ("trailing_amount", "increment")
+
     # this constructor is the same as TrailingLimitOrderVO constructor, no parent_order_id, no routing_candidates
     def __init__(self, _id=None, int_id=None, ext_id=None, parent_int_id=None, date_time=None, side=None, quantity=None,
                  tif=None, tif_date_time=None, exchange_order=None, exchange_id=None,
@@ -0,0 +1,140 @@
+from typing import Optional
+
+from algotrader_com.domain.series import BarSeries, TickSeries
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_UNIT_MILLIS = {"MSEC": 1, "SEC": 1000, "MIN": 60000, "HOUR": 3600000, "DAY": 86400000}
+
+
+def bar_size_to_millis(bar_size):
+    # type: (str) -> int
+    """
+       Arguments:
+           bar_size (str): MSEC_1 to DAY_2, calendar based sizes (WEEK_1, MONTH_1, YEAR_1, ...) are not supported
+       Returns:
+           int: duration of the bar size in milliseconds
+    """
+    unit, _, count = bar_size.partition("_")
+    if unit not in _UNIT_MILLIS or not count.isdigit():
+        raise Exception("Unsupported bar size " + bar_size + " for resampling.")
+    return _UNIT_MILLIS[unit] * int(count)
+
+
+def _bucket_starts(timestamps, size_millis, session_opens):
+    # type: (numpy.ndarray, int, Optional[numpy.ndarray]) -> numpy.ndarray
+    """Start of the resampled bar of each timestamp, counted from the latest session open or from the epoch."""
+    if session_opens is None or len(session_opens) == 0:
+        origins = numpy.zeros(len(timestamps), dtype="int64")
+    else:
+        session = numpy.searchsorted(session_opens, timestamps, "right") - 1
+        # events before the first session open are aligned to the epoch
+        origins = numpy.where(session >= 0, session_opens[numpy.maximum(session, 0)], 0)
+    return origins + (timestamps - origins) // size_millis * size_millis
+
+
+def resample_bars(bars, bar_size, session_opens=None):
+    # type: (BarSeries, str, numpy.ndarray) -> BarSeries
+    """Aggregates bars into bars of a coarser bar size: first open, highest high, lowest low, last close, summed
+       volume and volume weighted vwap. timestamp_ms of the bars is taken as the bar start. Resampled bars start at a
+       multiple of bar_size after the latest session open, they never span two sessions.
+
+       Arguments:
+           bars (algotrader_com.domain.series.BarSeries): finer bars sorted by time
+           bar_size (str): bar size of the result, see bar_size_to_millis
+           session_opens (numpy.ndarray of int64): sorted session open times as epoch milliseconds, see
+               CalendarService.get_session_opens, None to align bars to the epoch
+       Returns:
+           algotrader_com.domain.series.BarSeries
+    """
+    if len(bars) == 0:
+        return BarSeries(bars.security_id, bar_size)
+    starts = _bucket_starts(bars.timestamp_ms, bar_size_to_millis(bar_size), session_opens)
+    first = numpy.flatnonzero(numpy.r_[True, starts[1:] != starts[:-1]])
+    last = numpy.r_[first[1:], len(starts)] - 1
+    vol = numpy.add.reduceat(bars.vol, first)
+    turnover = numpy.add.reduceat(numpy.nan_to_num(bars.vwap) * bars.vol, first)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        vwap = numpy.where(vol > 0, turnover / vol, bars.close[last])
+    return BarSeries(bars.security_id, bar_size,
+                     timestamp_ms=starts[first],
+                     open=bars.open[first],
+                     high=numpy.maximum.reduceat(bars.high, first),
+                     low=numpy.minimum.reduceat(bars.low, first),
+                     close=bars.close[last],
+                     vol=vol,
+                     vwap=vwap)
+
+
+def resample_ticks(ticks, bar_size, session_opens=None, price="last"):
+    # type: (TickSeries, str, numpy.ndarray, str) -> BarSeries
+    """Builds bars from ticks. Ticks carry no trade size, so vol of the bars is 0 and vwap is the close.
+
+       Arguments:
+           ticks (algotrader_com.domain.series.TickSeries): ticks sorted by time
+           bar_size (str): bar size of the result, see bar_size_to_millis
+           session_opens (numpy.ndarray of int64): see resample_bars
+           price (str): "last", "bid", "ask" or "mid" (average of bid and ask)
+       Returns:
+           algotrader_com.domain.series.BarSeries
+    """
+    prices = (ticks.bid + ticks.ask) / 2 if price == "mid" else getattr(ticks, price)
+    # ticks without a price are skipped
+    valid = ~numpy.isnan(prices)
+    prices = prices[valid]
+    zeros = numpy.zeros(len(prices))
+    as_bars = BarSeries(ticks.security_id, None, timestamp_ms=ticks.timestamp_ms[valid], open=prices, high=prices,
+                        low=prices, close=prices, vol=zeros, vwap=prices)
+    return resample_bars(as_bars, bar_size, session_opens)
+
+
+class BarResampler:
+    """Incrementally resamples bars of a finer bar size as they arrive. The last resampled bar stays open until a bar
+       of a later resampled bar arrives.
+
+       Attributes:
+           bar_size (str): bar size of the resampled bars
+           session_opens (numpy.ndarray of int64): see resample_bars
+    """
+
+    def __init__(self, bar_size, session_opens=None):
+        # type: (str, numpy.ndarray) -> None
+        if numpy is None:
+            raise Exception("NumPy is required for BarResampler.")
+        self.bar_size = bar_size
+        self.session_opens = session_opens
+        self._pending = None  # type: Optional[BarSeries]
+
+    def update(self, bars):
+        # type: (BarSeries) -> BarSeries
+        """Adds finer bars following the bars added before.
+
+           Arguments:
+               bars (algotrader_com.domain.series.BarSeries): &nbsp;
+           Returns:
+               algotrader_com.domain.series.BarSeries: the resampled bars completed by these bars
+        """
+        if self._pending is not None and len(self._pending):
+            columns = {name: numpy.concatenate([getattr(self._pending, name), getattr(bars, name)])
+                       for name, _key, _dtype in BarSeries.COLUMNS}
+            bars = BarSeries(bars.security_id, bars.bar_size, **columns)
+        if len(bars) == 0:
+            return BarSeries(bars.security_id, self.bar_size)
+        starts = _bucket_starts(bars.timestamp_ms, bar_size_to_millis(self.bar_size), self.session_opens)
+        # the finer bars of the last resampled bar are kept until it is complete
+        open_from = int(numpy.searchsorted(starts, starts[-1], "left"))
+        self._pending = bars[open_from:]
+        return resample_bars(bars[:open_from], self.bar_size, self.session_opens)
+
+    def current(self):
+        # type: () -> Optional[BarSeries]
+        """
+           Returns:
+               algotrader_com.domain.series.BarSeries: the open resampled bar, None if there is none
+        """
+        if self._pending is None or len(self._pending) == 0:
+            return None
+        return resample_bars(self._pending, self.bar_size, self.session_opens)
@@ -0,0 +1,168 @@
+from typing import Dict, List, Sequence, Union
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import MarketDataEvent
+from algotrader_com.domain.series import BarSeries, MarketDataSeries, TickSeries
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RingBuffer:
+    """Fixed-capacity window of the last appended rows, one preallocated NumPy array per column.
+       Each array has twice the capacity and every value is written at its position and at position + capacity,
+       so the window of a column is always a contiguous slice: column views never copy.
+       A view shows the window at the time it is taken, later appends overwrite the buffer below it.
+
+       Attributes:
+           capacity (int): &nbsp;
+           columns (List of str): &nbsp;
+    """
+
+    def __init__(self, capacity, columns=("value",), dtypes="float64"):
+        # type: (int, Sequence[str], Union[str, Sequence[str]]) -> None
+        if numpy is None:
+            raise Exception("NumPy is required for RingBuffer.")
+        if isinstance(dtypes, str):
+            dtypes = [dtypes] * len(columns)
+        self.capacity = capacity
+        self.columns = list(columns)
+        self._arrays = [numpy.zeros(2 * capacity, dtype=dtype) for dtype in dtypes]
+        self._index = 0
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def full(self):
+        # type: () -> bool
+        return self._length == self.capacity
+
+    def append(self, *values):
+        # type: (float) -> None
+        """Appends a row, one value per column, overwriting the oldest row when full."""
+        index = self._index
+        mirror = index + self.capacity
+        for array, value in zip(self._arrays, values):
+            array[index] = array[mirror] = value
+        self._index = index + 1 if index + 1 < self.capacity else 0
+        if self._length < self.capacity:
+            self._length += 1
+
+    def extend(self, *columns):
+        # type: (numpy.ndarray) -> None
+        """Appends many rows given as one array per column, e.g. for warmup."""
+        rows = len(columns[0])
+        if rows >= self.capacity:
+            for array, column in zip(self._arrays, columns):
+                array[:self.capacity] = array[self.capacity:] = column[-self.capacity:]
+            self._index = 0
+            self._length = self.capacity
+            return
+        for array, column in zip(self._arrays, columns):
+            positions = (self._index + numpy.arange(rows)) % self.capacity
+            array[positions] = array[positions + self.capacity] = column
+        self._index = (self._index + rows) % self.capacity
+        self._length = min(self._length + rows, self.capacity)
+
+    def view(self, column=None):
+        # type: (str) -> numpy.ndarray
+        """
+           Arguments:
+               column (str): column name, None for the first column
+           Returns:
+               numpy.ndarray: the values of the column in the window, oldest first, without copying
+        """
+        array = self._arrays[0 if column is None else self.columns.index(column)]
+        start = self._index - self._length + (self.capacity if self._index < self._length else 0)
+        return array[start:start + self._length]
+
+    def views(self):
+        # type: () -> Dict[str, numpy.ndarray]
+        return {column: self.view(column) for column in self.columns}
+
+    def last(self, column=None):
+        # type: (str) -> float
+        """
+           Returns:
+               the last value of the column, None if the buffer is empty
+        """
+        if self._length == 0:
+            return None
+        array = self._arrays[0 if column is None else self.columns.index(column)]
+        return array[self._index - 1 + self.capacity]
+
+
+class MarketDataRingBuffer(RingBuffer):
+    """Ring buffer with the columns of a MarketDataSeries, written directly from market data events or their JSON.
+       Lazy events (see Conversions.set_lazy_market_data_events) are read from their JSON values without converting
+       any attribute.
+
+       Attributes:
+           capacity (int): &nbsp;
+           columns (List of str): the MarketDataSeries columns
+    """
+
+    SERIES_CLASS = MarketDataSeries
+
+    # column name to event attribute where they differ
+    _EVENT_ATTRIBUTES = {"timestamp_ms": "date_time_millis", "last_timestamp_ms": "last_date_time_millis"}
+
+    def __init__(self, capacity):
+        # type: (int) -> None
+        columns = self.SERIES_CLASS.COLUMNS
+        RingBuffer.__init__(self, capacity, [name for name, _key, _dtype in columns],
+                            [dtype for _name, _key, dtype in columns])
+        self._json_keys = [key for _name, key, _dtype in columns]
+        self._attributes = [self._EVENT_ATTRIBUTES.get(name, name) for name, _key, _dtype in columns]
+        self._int_columns = [dtype == "int64" for _name, _key, dtype in columns]
+
+    def append_json_object(self, vo_dict):
+        # type: (Dict) -> None
+        """Appends the values of a deserialized value object, e.g. from Conversions.unmarshall."""
+        self.append(*[0 if value is None and is_int else value
+                      for value, is_int in zip([vo_dict[key] for key in self._json_keys], self._int_columns)])
+
+    def append_event(self, event):
+        # type: (MarketDataEvent) -> None
+        """Appends the fields of a market data event, e.g. from on_tick or on_bar. Prices and volumes are stored as
+           plain values in every numeric mode, "scaled" values are divided by 10 ** scale."""
+        try:
+            vo_dict = event._vo_dict
+        except AttributeError:
+            vo_dict = None
+        if vo_dict is not None:
+            self.append_json_object(vo_dict)
+            return
+        # prices and volumes of events in the "scaled" numeric mode are integers, the buffer holds plain values
+        #  like the JSON values of lazy events
+        divisor = 10 ** Conversions.get_numeric_scale() if Conversions.get_numeric_mode() == "scaled" else 1
+        values = []
+        for attribute, is_int in zip(self._attributes, self._int_columns):
+            value = getattr(event, attribute)
+            values.append((0 if is_int else None) if value is None else (value if is_int else float(value) / divisor))
+        self.append(*values)
+
+    def to_series(self, security_id=None):
+        # type: (int) -> MarketDataSeries
+        """
+           Returns:
+               MarketDataSeries subtype: the window as a series whose columns are views of the buffer
+        """
+        return self.SERIES_CLASS(security_id, **self.views())
+
+
+class TickRingBuffer(MarketDataRingBuffer):
+    """Ring buffer with the columns of TickSeries: timestamp_ms, last, last_timestamp_ms, bid, ask, vol_bid, vol_ask
+       and vol."""
+
+    SERIES_CLASS = TickSeries
+
+
+class BarRingBuffer(MarketDataRingBuffer):
+    """Ring buffer with the columns of BarSeries: timestamp_ms, open, high, low, close, vol and vwap."""
+
+    SERIES_CLASS = BarSeries
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from datetime import datetime
 from decimal import Decimal
+from typing import Dict
 
 from py4j.clientserver import ClientServer
 from py4j.java_gateway import JavaObject
@@ -88,6 +89,14 @@ class Security(PropertyHolder):
         self.max_gap = max_gap  # The Maximum Market Data Gap (in minutes) that is expected in normal Market Conditions. An exception is thrown if no market data arrives for a period longer than this value which might indicate a problem with the external Market Data Provider.
         self.exchange_id = exchange_id  # Exchange where securities are traded
 
+    # simple name of the Java value object class (e.g. "StockVO") to Security subclass, filled as subclasses are defined
+    _subclasses_by_vo_name = {}  # type: Dict[str, type]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "convert_from_vo" in cls.__dict__:
+            Security._subclasses_by_vo_name[cls.__name__ + "VO"] = cls
+
     @staticmethod
     def get_java_class():
         # type: () -> str
@@ -109,33 +118,66 @@ class Security(PropertyHolder):
         """
         if security_vo is None:
             return None
-        if security_vo.getClass().getSimpleName() == "IndexVO":
-            security = Index.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "StockVO":
-            security = Stock.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "ForexVO":
-            security = Forex.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "CombinationVO":
-            security = Combination.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "BondVO":
-            security = Bond.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "FutureVO":
-            security = Future.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "GenericFutureVO":
-            security = GenericFuture.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "OptionVO":
-            security = Option.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "PerpetualSwapVO":
-            security = PerpetualSwap.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "FundVO":
-            security = Fund.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "CommodityVO":
-            security = Commodity.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        elif security_vo.getClass().getSimpleName() == "IntrestRateVO":
-            security = IntrestRate.convert_from_vo(security_vo, py4jgateway)  # type: ignore
-        else:
-            raise Exception("Unsupported order type " + security_vo.getClass().getSimpleName() + ".")
-        return security
+        simple_name = security_vo.getClass().getSimpleName()
+        security_class = Security._subclasses_by_vo_name.get(simple_name)
+        if security_class is None:
+            raise Exception("Unsupported security type " + simple_name + ".")
+        return security_class.convert_from_vo(security_vo, py4jgateway)
+
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Security
+        """Converts a deserialized JSON value object, a single string crossing the bridge instead of one call per
+           field as with convert_from_vo.
+
+           Arguments:
+               vo_dict (deserialized SecurityVO subtype): &nbsp;
+           Returns:
+               Security subtype
+        """
+        if vo_dict is None:
+            return None
+        simple_name = vo_dict["@class"].rsplit(".", 1)[-1]
+        security_class = Security._subclasses_by_vo_name.get(simple_name)
+        if security_class is None:
+            raise Exception("Unsupported security type " + simple_name + ".")
+        return security_class.convert_from_json_object(vo_dict)
+
+    @staticmethod
+    def _fields_from_json(vo_dict):
+        # type: (Dict) -> Dict
+        """Returns the Security constructor arguments of a deserialized JSON value object."""
+        return dict(_id=vo_dict["id"],
+                    symbol=vo_dict["symbol"],
+                    description=vo_dict["description"],
+                    isin=vo_dict["isin"],
+                    bbgid=vo_dict["bbgid"],
+                    ric=vo_dict["ric"],
+                    conid=vo_dict["conid"],
+                    lmaxid=vo_dict["lmaxid"],
+                    ttid=vo_dict["ttid"],
+                    cnpid=vo_dict["cnpid"],
+                    xntid=vo_dict["xntid"],
+                    adapter_ticker=vo_dict["adapterTicker"],
+                    quandl_database=vo_dict["quandlDatabase"],
+                    quandl_dataset=vo_dict["quandlDataset"],
+                    cfi_code=vo_dict["cfiCode"],
+                    underlying_id=vo_dict["underlyingId"],
+                    security_family_id=vo_dict["securityFamilyId"],
+                    quote_currency=vo_dict["quoteCurrency"],
+                    contract_size=vo_dict["contractSize"],
+                    inverse_contract=vo_dict["inverseContract"],
+                    min_qty=Conversions.float_to_decimal(vo_dict["minQty"]),
+                    max_qty=Conversions.float_to_decimal(vo_dict["maxQty"]),
+                    qty_incr=Conversions.float_to_decimal(vo_dict["qtyIncr"]),
+                    min_price=Conversions.float_to_decimal(vo_dict["minPrice"]),
+                    max_price=Conversions.float_to_decimal(vo_dict["maxPrice"]),
+                    price_incr=Conversions.float_to_decimal(vo_dict["priceIncr"]),
+                    min_notional=Conversions.float_to_decimal(vo_dict["minNotional"]),
+                    tradeable=vo_dict["tradeable"],
+                    synthetic=vo_dict["synthetic"],
+                    max_gap=vo_dict["maxGap"],
+                    exchange_id=vo_dict["exchangeId"])
 
     @abstractmethod
     def convert_to_vo(self, _gateway):
@@ -311,6 +353,19 @@ class Index(Security):
                       exchange_id, asset_class)
         return index
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Index
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized IndexVO): &nbsp;
+           Returns:
+               Index
+        """
+        return Index(**Security._fields_from_json(vo_dict),
+                     asset_class=vo_dict["assetClass"])
+
 
 class Stock(Security):
     """
@@ -472,6 +527,19 @@ class Stock(Security):
                          exchange_id, gics)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Stock
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized StockVO): &nbsp;
+           Returns:
+               Stock
+        """
+        return Stock(**Security._fields_from_json(vo_dict),
+                     gics=vo_dict["gics"])
+
 
 class Forex(Security):
     """
@@ -635,6 +703,19 @@ class Forex(Security):
                          exchange_id, base_currency)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Forex
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized ForexVO): &nbsp;
+           Returns:
+               Forex
+        """
+        return Forex(**Security._fields_from_json(vo_dict),
+                     base_currency=vo_dict["baseCurrency"])
+
 
 class PerpetualSwap(Security):
     """
@@ -793,6 +874,18 @@ class PerpetualSwap(Security):
                                  synthetic, max_gap, exchange_id)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> PerpetualSwap
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized PerpetualSwapVO): &nbsp;
+           Returns:
+               PerpetualSwap
+        """
+        return PerpetualSwap(**Security._fields_from_json(vo_dict))
+
 
 class Commodity(Security):
     """
@@ -960,6 +1053,19 @@ class Commodity(Security):
                              synthetic, max_gap, exchange_id, commodity_type)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Commodity
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized CommodityVO): &nbsp;
+           Returns:
+               Commodity
+        """
+        return Commodity(**Security._fields_from_json(vo_dict),
+                         commodity_type=vo_dict["commodityType"])
+
 
 class Bond(Security):
     """
@@ -1159,6 +1265,25 @@ class Bond(Security):
                         rating_sp, rating_moodys, rating_fitch)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Bond
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized BondVO): &nbsp;
+           Returns:
+               Bond
+        """
+        return Bond(**Security._fields_from_json(vo_dict),
+                    maturity=Conversions.local_date_json_to_python_datetime(vo_dict["maturity"]),
+                    issue_date=Conversions.local_date_json_to_python_datetime(vo_dict["issueDate"]),
+                    coupon=Conversions.float_to_decimal(vo_dict["coupon"]),
+                    coupon_frequency=vo_dict["couponFrequency"],
+                    rating_sp=vo_dict["ratingSP"],
+                    rating_moodys=vo_dict["ratingMoodys"],
+                    rating_fitch=vo_dict["ratingFitch"])
+
 
 class Fund(Security):
     """
@@ -1318,6 +1443,18 @@ class Fund(Security):
                         synthetic, max_gap, exchange_id)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Fund
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized FundVO): &nbsp;
+           Returns:
+               Fund
+        """
+        return Fund(**Security._fields_from_json(vo_dict))
+
 
 class GenericFuture(Security):
     """
@@ -1494,6 +1631,20 @@ class GenericFuture(Security):
                                  synthetic, max_gap, exchange_id, duration, asset_class)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> GenericFuture
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized GenericFutureVO): &nbsp;
+           Returns:
+               GenericFuture
+        """
+        return GenericFuture(**Security._fields_from_json(vo_dict),
+                             duration=vo_dict["duration"],
+                             asset_class=vo_dict["assetClass"])
+
 
 class IntrestRate(Security):
     """
@@ -1662,6 +1813,19 @@ class IntrestRate(Security):
                                synthetic, max_gap, exchange_id, duration)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> IntrestRate
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized IntrestRateVO): &nbsp;
+           Returns:
+               IntrestRate
+        """
+        return IntrestRate(**Security._fields_from_json(vo_dict),
+                           duration=vo_dict["duration"])
+
 
 class Option(Security):
     """
@@ -1842,6 +2006,21 @@ class Option(Security):
                           synthetic, max_gap, exchange_id, expiration, strike, option_type)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Option
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized OptionVO): &nbsp;
+           Returns:
+               Option
+        """
+        return Option(**Security._fields_from_json(vo_dict),
+                      expiration=Conversions.local_date_json_to_python_datetime(vo_dict["expiration"]),
+                      strike=Conversions.float_to_decimal(vo_dict["strike"]),
+                      option_type=vo_dict["optionType"])
+
 
 class Combination(Security):
     """
@@ -2012,6 +2191,20 @@ class Combination(Security):
                                synthetic, max_gap, exchange_id, uuid, combination_type)
         return security
 
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Combination
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized CombinationVO): &nbsp;
+           Returns:
+               Combination
+        """
+        return Combination(**Security._fields_from_json(vo_dict),
+                           uuid=vo_dict["uuid"],
+                           combination_type=vo_dict["combinationType"])
+
 
 class Future(Security):
     """
@@ -2190,3 +2383,18 @@ class Future(Security):
                           max_qty, qty_incr, min_price, max_price, price_incr, min_notional, tradeable,
                           synthetic, max_gap, exchange_id, expiration, month_year, first_notice)
         return security
+
+    @staticmethod
+    def convert_from_json_object(vo_dict):
+        # type: (Dict) -> Future
+        """Converts a deserialized JSON value object to the Python object.
+
+           Arguments:
+               vo_dict (deserialized FutureVO): &nbsp;
+           Returns:
+               Future
+        """
+        return Future(**Security._fields_from_json(vo_dict),
+                      expiration=Conversions.local_date_json_to_python_datetime(vo_dict["expiration"]),
+                      month_year=vo_dict["monthYear"],
+                      first_notice=Conversions.local_date_json_to_python_datetime(vo_dict["firstNotice"]))
@@ -0,0 +1,319 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple, Union
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import MarketDataEvent
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _column(vo_dicts, key, dtype):
+    # type: (List[Dict], str, str) -> numpy.ndarray
+    values = [vo_dict[key] for vo_dict in vo_dicts]
+    if dtype == "int64" and None in values:
+        values = [0 if value is None else value for value in values]
+    # None becomes nan in float columns
+    return numpy.array(values, dtype=dtype)
+
+
+def _to_millis(date_time):
+    # type: (Union[datetime, int]) -> int
+    if isinstance(date_time, datetime):
+        return Conversions.python_datetime_to_millis(date_time)
+    return date_time
+
+
+class MarketDataSeries:
+    """Base class of columnar market data of a single security. Each column is a NumPy array with one element per
+       event, sorted by timestamp_ms. Prices and volumes are float64 columns regardless of the numeric mode.
+       Requires NumPy.
+
+       Attributes:
+           security_id (int): &nbsp;
+           timestamp_ms (numpy.ndarray of int64): event times as epoch milliseconds
+    """
+
+    # column attribute name, JSON key, NumPy dtype
+    COLUMNS = (("timestamp_ms", "dateTime", "int64"),)  # type: Tuple[Tuple[str, str, str], ...]
+
+    def __init__(self, security_id=None, **columns):
+        # type: (int, numpy.ndarray) -> None
+        if numpy is None:
+            raise Exception("NumPy is required for " + type(self).__name__ + ".")
+        self.security_id = security_id
+        for name, _key, dtype in self.COLUMNS:
+            setattr(self, name, columns[name] if name in columns else numpy.empty(0, dtype))
+
+    @classmethod
+    def from_json(cls, vo_jsons):
+        # type: (Iterable[str]) -> MarketDataSeries
+        """Builds the series from JSON value objects, decoded as a single JSON array.
+
+           Arguments:
+               vo_jsons (Iterable of str): JSON value objects, e.g. as returned by the historical data service
+           Returns:
+               MarketDataSeries subtype
+        """
+        return cls.from_json_objects(Conversions.unmarshall("[" + ",".join(vo_jsons) + "]"))
+
+    @classmethod
+    def from_json_objects(cls, vo_dicts):
+        # type: (List[Dict]) -> MarketDataSeries
+        """Builds the series column by column from deserialized JSON value objects without creating event objects.
+
+           Arguments:
+               vo_dicts (List of Dict): deserialized value objects of a single security
+           Returns:
+               MarketDataSeries subtype
+        """
+        if numpy is None:
+            raise Exception("NumPy is required for " + cls.__name__ + ".")
+        columns = {name: _column(vo_dicts, key, dtype) for name, key, dtype in cls.COLUMNS}
+        timestamps = columns["timestamp_ms"]
+        if len(timestamps) > 1 and (timestamps[1:] < timestamps[:-1]).any():
+            order = numpy.argsort(timestamps, kind="stable")
+            columns = {name: column[order] for name, column in columns.items()}
+        return cls(vo_dicts[0]["securityId"] if vo_dicts else None, **cls._attributes_from_json(vo_dicts), **columns)
+
+    @classmethod
+    def _attributes_from_json(cls, vo_dicts):
+        # type: (List[Dict]) -> Dict
+        return {}
+
+    def __len__(self):
+        return len(self.timestamp_ms)
+
+    def __getitem__(self, index):
+        # type: (slice) -> MarketDataSeries
+        """Returns the events in the slice of positions, the columns are views of the columns of this series."""
+        if not isinstance(index, slice):
+            raise TypeError(type(self).__name__ + " indices must be slices.")
+        series = type(self).__new__(type(self))
+        series.__dict__.update(self.__dict__)
+        for name, _key, _dtype in self.COLUMNS:
+            setattr(series, name, getattr(self, name)[index])
+        return series
+
+    def between(self, min_date, max_date):
+        # type: (Union[datetime, int], Union[datetime, int]) -> MarketDataSeries
+        """Returns the events with min_date <= time < max_date without copying the columns.
+
+           Arguments:
+               min_date (datetime or int): datetime or epoch milliseconds, None for no lower bound
+               max_date (datetime or int): datetime or epoch milliseconds, None for no upper bound
+           Returns:
+               MarketDataSeries subtype
+        """
+        start = 0 if min_date is None else int(numpy.searchsorted(self.timestamp_ms, _to_millis(min_date), "left"))
+        end = len(self) if max_date is None else int(numpy.searchsorted(self.timestamp_ms, _to_millis(max_date), "left"))
+        return self[start:end]
+
+    def date_times(self):
+        # type: () -> numpy.ndarray
+        """
+           Returns:
+               numpy.ndarray of datetime64[ms]: UTC view of timestamp_ms
+        """
+        return self.timestamp_ms.view("datetime64[ms]")
+
+    def to_records(self):
+        # type: () -> numpy.ndarray
+        """
+           Returns:
+               numpy.ndarray: a structured array with one field per column (a copy of the columns)
+        """
+        records = numpy.empty(len(self), dtype=[(name, dtype) for name, _key, dtype in self.COLUMNS])
+        for name, _key, _dtype in self.COLUMNS:
+            records[name] = getattr(self, name)
+        return records
+
+
+class TickSeries(MarketDataSeries):
+    """Columnar ticks of a single security, see algotrader_com.domain.market_data.Tick.
+
+       Attributes:
+           security_id (int): &nbsp;
+           timestamp_ms (numpy.ndarray of int64): tick times as epoch milliseconds
+           last (numpy.ndarray of float64): &nbsp;
+           last_timestamp_ms (numpy.ndarray of int64): last trade times as epoch milliseconds, 0 if not known
+           bid (numpy.ndarray of float64): &nbsp;
+           ask (numpy.ndarray of float64): &nbsp;
+           vol_bid (numpy.ndarray of float64): &nbsp;
+           vol_ask (numpy.ndarray of float64): &nbsp;
+           vol (numpy.ndarray of float64): &nbsp;
+    """
+
+    COLUMNS = (("timestamp_ms", "dateTime", "int64"),
+               ("last", "last", "float64"),
+               ("last_timestamp_ms", "lastDateTime", "int64"),
+               ("bid", "bid", "float64"),
+               ("ask", "ask", "float64"),
+               ("vol_bid", "volBid", "float64"),
+               ("vol_ask", "volAsk", "float64"),
+               ("vol", "vol", "float64"))
+
+
+class BarSeries(MarketDataSeries):
+    """Columnar bars of a single security and bar size, see algotrader_com.domain.market_data.Bar.
+
+       Attributes:
+           security_id (int): &nbsp;
+           bar_size (str): &nbsp;
+           timestamp_ms (numpy.ndarray of int64): bar times as epoch milliseconds
+           open (numpy.ndarray of float64): &nbsp;
+           high (numpy.ndarray of float64): &nbsp;
+           low (numpy.ndarray of float64): &nbsp;
+           close (numpy.ndarray of float64): &nbsp;
+           vol (numpy.ndarray of float64): &nbsp;
+           vwap (numpy.ndarray of float64): &nbsp;
+    """
+
+    COLUMNS = (("timestamp_ms", "dateTime", "int64"),
+               ("open", "open", "float64"),
+               ("high", "high", "float64"),
+               ("low", "low", "float64"),
+               ("close", "close", "float64"),
+               ("vol", "vol", "float64"),
+               ("vwap", "vwap", "float64"))
+
+    def __init__(self, security_id=None, bar_size=None, **columns):
+        # type: (int, str, numpy.ndarray) -> None
+        MarketDataSeries.__init__(self, security_id, **columns)
+        self.bar_size = bar_size
+
+    @classmethod
+    def _attributes_from_json(cls, vo_dicts):
+        # type: (List[Dict]) -> Dict
+        return {"bar_size": vo_dicts[0]["barSize"] if vo_dicts else None}
+
+
+# snapshot field to (JSON key, event attribute) by event type, value defaults to the mid price or else the last price
+_SNAPSHOT_SOURCES = {
+    "Tick": {"bid": ("bid", "bid"), "ask": ("ask", "ask"), "bid_volume": ("volBid", "vol_bid"),
+             "ask_volume": ("volAsk", "vol_ask"), "last": ("last", "last")},
+    "Bar": {"last": ("close", "close"), "value": ("close", "close")},
+    "Trade": {"last": ("lastPrice", "last_price"), "value": ("lastPrice", "last_price")},
+    "Bid": {"bid": ("price", "price"), "bid_volume": ("size", "size"), "value": ("price", "price")},
+    "Ask": {"ask": ("price", "price"), "ask_volume": ("size", "size"), "value": ("price", "price")},
+    "BidAskQuote": {"bid": ("bidPrice", "bid_price"), "ask": ("askPrice", "ask_price"),
+                    "bid_volume": ("bidSize", "bid_size"), "ask_volume": ("askSize", "ask_size")},
+}
+
+
+class MarketDataSnapshot:
+    """Current market data of many securities in columns, one row per requested security in the requested order.
+       Built from the last market data event of each security, securities without an event have nan values and
+       timestamp_ms 0. The current value is the mid price of ticks and bid/ask quotes with both sides (the last
+       price of ticks otherwise), the close of bars, the last price of trades and the price of bid or ask quotes.
+       Requires NumPy.
+
+       Attributes:
+           security_ids (numpy.ndarray of int64): &nbsp;
+           available (numpy.ndarray of bool): whether an event of the security was found
+           timestamp_ms (numpy.ndarray of int64): event times as epoch milliseconds
+           bid (numpy.ndarray of float64): &nbsp;
+           ask (numpy.ndarray of float64): &nbsp;
+           bid_volume (numpy.ndarray of float64): &nbsp;
+           ask_volume (numpy.ndarray of float64): &nbsp;
+           last (numpy.ndarray of float64): last price of ticks and trades, close of bars
+           value (numpy.ndarray of float64): current value
+    """
+
+    FIELDS = ("timestamp_ms", "bid", "ask", "bid_volume", "ask_volume", "last", "value")
+
+    def __init__(self, security_ids, available, **columns):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> None
+        self.security_ids = security_ids
+        self.available = available
+        self.fields = list(columns)
+        for name, column in columns.items():
+            setattr(self, name, column)
+        self._rows = {security_id: row for row, security_id in enumerate(security_ids.tolist())}
+
+    def __len__(self):
+        return len(self.security_ids)
+
+    def __getitem__(self, field):
+        # type: (str) -> numpy.ndarray
+        return getattr(self, field)
+
+    def row(self, security_id):
+        # type: (int) -> int
+        """
+           Returns:
+               int: position of the security in the columns
+        """
+        return self._rows[security_id]
+
+    def get(self, field, security_id):
+        # type: (str, int) -> float
+        return getattr(self, field)[self._rows[security_id]]
+
+    @classmethod
+    def from_json_objects(cls, security_ids, vo_dicts, fields=None):
+        # type: (List[int], List[Dict], List[str]) -> MarketDataSnapshot
+        """
+           Arguments:
+               security_ids (List of int): securities of the rows
+               vo_dicts (List of Dict): deserialized market data event value objects, others than of security_ids
+                   are ignored
+               fields (List of str): columns to build from FIELDS, None for all
+           Returns:
+               MarketDataSnapshot
+        """
+        by_security_id = {vo_dict["securityId"]: vo_dict for vo_dict in vo_dicts}
+        sources = [by_security_id.get(security_id) for security_id in security_ids]
+        return cls._build(security_ids, sources, [vo_dict and vo_dict["objectType"] for vo_dict in sources],
+                          lambda vo_dict, key, attribute: vo_dict[key], "dateTime", fields, 1)
+
+    @classmethod
+    def from_events(cls, security_ids, events, fields=None):
+        # type: (List[int], Dict[int, MarketDataEvent], List[str]) -> MarketDataSnapshot
+        """
+           Arguments:
+               security_ids (List of int): securities of the rows
+               events (Dict of int to algotrader_com.domain.market_data.MarketDataEvent): last event by security id
+               fields (List of str): columns to build from FIELDS, None for all
+           Returns:
+               MarketDataSnapshot
+        """
+        sources = [events.get(security_id) for security_id in security_ids]
+        # prices of events in the "scaled" numeric mode are integers
+        divisor = 10 ** Conversions.get_numeric_scale() if Conversions.get_numeric_mode() == "scaled" else 1
+        return cls._build(security_ids, sources, [event and type(event).__name__ for event in sources],
+                          lambda event, key, attribute: getattr(event, attribute), "date_time_millis", fields,
+                          divisor)
+
+    @classmethod
+    def _build(cls, security_ids, sources, object_types, read, timestamp_name, fields, divisor):
+        if numpy is None:
+            raise Exception("NumPy is required for " + cls.__name__ + ".")
+        fields = cls.FIELDS if fields is None else fields
+        for field in fields:
+            if field not in cls.FIELDS:
+                raise Exception("Unknown snapshot field '" + field + "', available: " + ", ".join(cls.FIELDS) + ".")
+        price_fields = cls.FIELDS[1:]
+        values = {field: [None] * len(sources) for field in price_fields}
+        timestamps = [0] * len(sources)
+        for row, (source, object_type) in enumerate(zip(sources, object_types)):
+            if source is None:
+                continue
+            timestamps[row] = read(source, timestamp_name, timestamp_name) or 0
+            for field, (key, attribute) in _SNAPSHOT_SOURCES.get(object_type, {}).items():
+                values[field][row] = read(source, key, attribute)
+        columns = {field: numpy.array(column, dtype="float64") for field, column in values.items()}
+        if divisor != 1:
+            for column in columns.values():
+                column /= divisor
+        with numpy.errstate(invalid="ignore"):
+            mid = (columns["bid"] + columns["ask"]) / 2
+        # value not given by the event type: mid price, else last price
+        derived = numpy.isnan(columns["value"])
+        columns["value"][derived] = numpy.where(numpy.isnan(mid), columns["last"], mid)[derived]
+        columns["timestamp_ms"] = numpy.array(timestamps, dtype="int64")
+        available = numpy.array([source is not None for source in sources], dtype=bool)
+        return cls(numpy.array(security_ids, dtype="int64"), available,
+                   **{field: columns[field] for field in fields})
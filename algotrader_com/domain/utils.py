@@ -1,6 +1,20 @@
+from py4j.protocol import Py4JError, Py4JJavaError
+
 from algotrader_com.domain.conversions import Conversions
 
 
+def is_missing_java_method(error):
+    # type: (Py4JError) -> bool
+    """
+       Arguments:
+           error (py4j.protocol.Py4JError): error raised by a call of a Java method
+       Returns:
+           bool: True if the Java object has no such method, e.g. in an AlgoTrader version older than the Python side,
+               False if the method itself raised the error
+    """
+    return not isinstance(error, Py4JJavaError) and "does not exist" in str(error)
+
+
 class JsonPredicate:
     """Class representing java.util.function.Predicate<String> for JSON objects
     Converts the incoming JSON to dictionary and applies given function to it.
@@ -0,0 +1,492 @@
+"""Streaming technical indicators updated in constant time per value.
+
+   Each indicator keeps its state in floats: update converts its arguments with float() and returns the current value,
+   None until the indicator has a value. update_many takes NumPy arrays, e.g. the columns of a BarSeries for warmup,
+   updates the state as if update was called for each element and returns the value after each element, nan where
+   there is none yet. update_many computes the values with NumPy array operations, they may differ from the values of
+   update in the last bits. ready tells whether the indicator has seen a full period.
+"""
+from abc import abstractmethod
+from collections import deque
+from math import log, sqrt
+from typing import Deque, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# largest power of 1 / (1 - alpha) used by _smooth, its inverse stays a normal float
+_MAX_SMOOTHING_SCALE_EXPONENT = 150 * log(10)
+
+
+def _smooth(values, alpha, initial):
+    # type: (numpy.ndarray, float, float) -> numpy.ndarray
+    """Returns y with y[i] = y[i - 1] + alpha * (values[i] - y[i - 1]) and y[-1] = initial, computed per block as
+       y[j] = d ** j * (initial + alpha * sum(values[i] / d ** i for i <= j)) with d = 1 - alpha. Blocks are short
+       enough for the powers of d to stay finite."""
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        return values.copy()
+    result = numpy.empty(len(values), dtype="float64")
+    block = max(1, int(_MAX_SMOOTHING_SCALE_EXPONENT / -log(decay)))
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** numpy.arange(1, len(chunk) + 1, dtype="float64")
+        result[start:start + block] = powers * (initial + alpha * numpy.cumsum(chunk / powers))
+        initial = result[start + len(chunk) - 1]
+    return result
+
+
+def _window_sums(joined, first, period):
+    # type: (numpy.ndarray, int, int) -> Tuple[numpy.ndarray, numpy.ndarray]
+    """Returns the sums of the last period elements of joined up to each position from first on, and the number of
+       elements summed. The sums are taken within blocks of period elements forward and backward, a window spans
+       the end of one block and the start of the next, so rounding errors don't accumulate over the whole array."""
+    padded = numpy.concatenate([numpy.zeros(period - 1), joined])
+    blocks = numpy.concatenate([padded, numpy.zeros(-len(padded) % period)]).reshape(-1, period)
+    forward = numpy.cumsum(blocks, axis=1).ravel()
+    backward = numpy.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    ends = numpy.arange(first + period - 1, len(padded))
+    starts = ends + 1 - period
+    sums = numpy.where(starts % period == 0, forward[ends], backward[starts] + forward[ends])
+    return sums, numpy.minimum(numpy.arange(first, len(joined)) + 1, period)
+
+
+class EMA:
+    """Exponential moving average with alpha = 2 / (period + 1), starting at the first value.
+
+       Attributes:
+           period (int): &nbsp;
+           alpha (float): &nbsp;
+           value (float): &nbsp;
+    """
+
+    def __init__(self, period):
+        # type: (int) -> None
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = None  # type: Optional[float]
+        self._count = 0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return self._count >= self.period
+
+    def update(self, value):
+        # type: (float) -> float
+        value = float(value)
+        self._count += 1
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def update_many(self, values):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        values = numpy.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return values.copy()
+        if self.value is None:
+            # the average starts at the first value
+            result = numpy.concatenate([values[:1], _smooth(values[1:], self.alpha, values[0])])
+        else:
+            result = _smooth(values, self.alpha, self.value)
+        self._count += len(values)
+        self.value = float(result[-1])
+        return result
+
+
+class SMA:
+    """Simple moving average over the last period values.
+
+       Attributes:
+           period (int): &nbsp;
+           value (float): average of the values in the window, also before the window is full
+    """
+
+    def __init__(self, period):
+        # type: (int) -> None
+        self.period = period
+        self.value = None  # type: Optional[float]
+        self._window = deque(maxlen=period)  # type: Deque[float]
+        self._sum = 0.0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return len(self._window) == self.period
+
+    def update(self, value):
+        # type: (float) -> float
+        value = float(value)
+        window = self._window
+        if len(window) == self.period:
+            self._sum -= window[0]
+        window.append(value)
+        self._sum += value
+        self.value = self._sum / len(window)
+        return self.value
+
+    def update_many(self, values):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        values = numpy.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return values.copy()
+        previous = numpy.array(self._window, dtype="float64")
+        window_sums, counts = _window_sums(numpy.concatenate([previous, values]), len(previous), self.period)
+        result = window_sums / counts
+        self._window.extend(values[-self.period:].tolist())
+        self._sum = float(numpy.sum(self._window))
+        self.value = float(result[-1])
+        return result
+
+
+class RollingVariance:
+    """Sample variance, standard deviation and z-score over the last period values (sliding Welford update).
+
+       Attributes:
+           period (int): &nbsp;
+           mean (float): &nbsp;
+           value (float): sample variance, None until two values
+    """
+
+    def __init__(self, period):
+        # type: (int) -> None
+        self.period = period
+        self.mean = None  # type: Optional[float]
+        self.value = None  # type: Optional[float]
+        self._window = deque(maxlen=period)  # type: Deque[float]
+        self._m2 = 0.0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return len(self._window) == self.period
+
+    @property
+    def std(self):
+        # type: () -> Optional[float]
+        return None if self.value is None else sqrt(self.value)
+
+    def z_score(self, value):
+        # type: (float) -> Optional[float]
+        """
+           Returns:
+               float: distance of value from the mean in standard deviations, None without a non-zero deviation
+        """
+        std = self.std
+        if not std:
+            return None
+        return (float(value) - self.mean) / std
+
+    def update(self, value):
+        # type: (float) -> Optional[float]
+        value = float(value)
+        window = self._window
+        if len(window) == self.period:
+            removed = window[0]
+            window.append(value)
+            old_mean = self.mean
+            self.mean += (value - removed) / self.period
+            self._m2 += (value - removed) * (value - self.mean + removed - old_mean)
+        else:
+            window.append(value)
+            if self.mean is None:
+                self.mean = value
+            else:
+                delta = value - self.mean
+                self.mean += delta / len(window)
+                self._m2 += delta * (value - self.mean)
+        count = len(window)
+        self.value = max(self._m2, 0.0) / (count - 1) if count > 1 else None
+        return self.value
+
+    def update_many(self, values):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        values = numpy.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return values.copy()
+        return self._update_many_window_stats(values)[1]
+
+    def _update_many_window_stats(self, values):
+        # type: (numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]
+        """Returns the mean and the sample variance (nan for a single value) of the window after each value."""
+        previous = numpy.array(self._window, dtype="float64")
+        joined = numpy.concatenate([previous, values])
+        # deviations from the average of all values keep the sums of squares small against cancellation
+        shift = float(numpy.mean(joined))
+        deviations = joined - shift
+        sums, counts = _window_sums(deviations, len(previous), self.period)
+        squares, _counts = _window_sums(deviations * deviations, len(previous), self.period)
+        means = sums / counts
+        m2 = numpy.maximum(squares - sums * means, 0.0)
+        variances = numpy.where(counts > 1, m2 / numpy.maximum(counts - 1, 1), numpy.nan)
+        window = self._window
+        window.extend(values[-self.period:].tolist())
+        window_values = numpy.array(window, dtype="float64")
+        self.mean = float(numpy.mean(window_values))
+        self._m2 = float(numpy.sum((window_values - self.mean) ** 2))
+        self.value = self._m2 / (len(window) - 1) if len(window) > 1 else None
+        return means + shift, variances
+
+
+class ZScore(RollingVariance):
+    """Z-score of each value against the mean and standard deviation of the last period values including it."""
+
+    def update(self, value):
+        # type: (float) -> Optional[float]
+        RollingVariance.update(self, value)
+        return self.z_score(value)
+
+    def update_many(self, values):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        values = numpy.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return values.copy()
+        means, variances = self._update_many_window_stats(values)
+        stds = numpy.sqrt(variances)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return numpy.where(stds > 0, (values - means) / stds, numpy.nan)
+
+
+class _RollingExtreme:
+    """Maximum (or minimum) of the last period values with a monotonic deque of (index, value)."""
+
+    # NumPy ufunc name selecting the extreme of two values and the value never selected, see update_many
+    _ufunc_name = None  # type: str
+    _fill = None  # type: float
+
+    def __init__(self, period):
+        # type: (int) -> None
+        self.period = period
+        self.value = None  # type: Optional[float]
+        self._candidates = deque()  # type: Deque[Tuple[int, float]]
+        self._index = 0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return self._index >= self.period
+
+    @abstractmethod
+    def _dominates(self, value, candidate):
+        # type: (float, float) -> bool
+        """Returns whether value replaces candidate as a later maximum (or minimum)."""
+        pass
+
+    def update(self, value):
+        # type: (float) -> float
+        value = float(value)
+        candidates = self._candidates
+        while candidates and self._dominates(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._index, value))
+        if candidates[0][0] <= self._index - self.period:
+            candidates.popleft()
+        self._index += 1
+        self.value = candidates[0][1]
+        return self.value
+
+    def update_many(self, values):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        """Computes the extremes in blocks of period values from the running extremes of each block forward and
+           backward (van Herk/Gil-Werman): a window spans the end of one block and the start of the next."""
+        values = numpy.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return values.copy()
+        period = self.period
+        select = getattr(numpy, self._ufunc_name)
+        # the period - 1 values before the batch, those not candidates anymore are never the extreme again
+        previous = numpy.full(period - 1, self._fill)
+        for index, value in self._candidates:
+            position = index - self._index + period - 1
+            if position >= 0:
+                previous[position] = value
+        joined = numpy.concatenate([previous, values])
+        blocks = numpy.concatenate([joined, numpy.full(-len(joined) % period, self._fill)]).reshape(-1, period)
+        forward = select.accumulate(blocks, axis=1).ravel()
+        backward = select.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        ends = numpy.arange(period - 1, len(joined))
+        result = select(backward[ends + 1 - period], forward[ends])
+        # the candidates are rebuilt by updating with the last period values
+        self._candidates = deque()
+        self._index += len(values) - period
+        for value in joined[-period:].tolist():
+            self.update(value)
+        return result
+
+
+class RollingMax(_RollingExtreme):
+    """Maximum of the last period values.
+
+       Attributes:
+           period (int): &nbsp;
+           value (float): &nbsp;
+    """
+
+    _ufunc_name = "maximum"
+    _fill = float("-inf")
+
+    def _dominates(self, value, candidate):
+        return value >= candidate
+
+
+class RollingMin(_RollingExtreme):
+    """Minimum of the last period values.
+
+       Attributes:
+           period (int): &nbsp;
+           value (float): &nbsp;
+    """
+
+    _ufunc_name = "minimum"
+    _fill = float("inf")
+
+    def _dominates(self, value, candidate):
+        return value <= candidate
+
+
+class VWAP:
+    """Volume weighted average price since the last reset, or over the last period values if a period is given.
+
+       Attributes:
+           period (int): None for a cumulative VWAP, call reset e.g. at each session open
+           value (float): None while the volume is zero
+    """
+
+    def __init__(self, period=None):
+        # type: (Optional[int]) -> None
+        self.period = period
+        self.value = None  # type: Optional[float]
+        self._window = deque(maxlen=period) if period else None  # type: Optional[Deque[Tuple[float, float]]]
+        self._turnover = 0.0
+        self._volume = 0.0
+        self._count = 0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return self._count >= (self.period or 1)
+
+    def reset(self):
+        # type: () -> None
+        self.__init__(self.period)
+
+    def update(self, price, volume):
+        # type: (float, float) -> Optional[float]
+        price = float(price)
+        volume = float(volume)
+        window = self._window
+        if window is not None:
+            if len(window) == self.period:
+                removed_price, removed_volume = window[0]
+                self._turnover -= removed_price * removed_volume
+                self._volume -= removed_volume
+            window.append((price, volume))
+        self._count += 1
+        self._turnover += price * volume
+        self._volume += volume
+        self.value = self._turnover / self._volume if self._volume > 0 else None
+        return self.value
+
+    def update_many(self, prices, volumes):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+        prices = numpy.asarray(prices, dtype="float64")
+        volumes = numpy.asarray(volumes, dtype="float64")
+        if len(prices) == 0:
+            return prices.copy()
+        window = self._window
+        if window is None:
+            turnovers = self._turnover + numpy.cumsum(prices * volumes)
+            total_volumes = self._volume + numpy.cumsum(volumes)
+            self._turnover = float(turnovers[-1])
+            self._volume = float(total_volumes[-1])
+        else:
+            previous = numpy.array(window, dtype="float64").reshape(-1, 2)
+            joined_prices = numpy.concatenate([previous[:, 0], prices])
+            joined_volumes = numpy.concatenate([previous[:, 1], volumes])
+            turnovers, _counts = _window_sums(joined_prices * joined_volumes, len(previous), self.period)
+            total_volumes, _counts = _window_sums(joined_volumes, len(previous), self.period)
+            window.extend(zip(prices[-self.period:].tolist(), volumes[-self.period:].tolist()))
+            self._turnover = sum(price * volume for price, volume in window)
+            self._volume = sum(volume for _price, volume in window)
+        self._count += len(prices)
+        self.value = self._turnover / self._volume if self._volume > 0 else None
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return numpy.where(total_volumes > 0, turnovers / total_volumes, numpy.nan)
+
+
+class ATR:
+    """Average true range with Wilder smoothing, the first value is the average of the first period true ranges.
+
+       Attributes:
+           period (int): &nbsp;
+           value (float): None until period bars
+    """
+
+    def __init__(self, period):
+        # type: (int) -> None
+        self.period = period
+        self.value = None  # type: Optional[float]
+        self._previous_close = None  # type: Optional[float]
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return self.value is not None
+
+    def update(self, high, low, close):
+        # type: (float, float, float) -> Optional[float]
+        high = float(high)
+        low = float(low)
+        previous_close = self._previous_close
+        if previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        self._previous_close = float(close)
+        self._count += 1
+        if self.value is not None:
+            self.value += (true_range - self.value) / self.period
+        else:
+            self._sum += true_range
+            if self._count == self.period:
+                self.value = self._sum / self.period
+        return self.value
+
+    def update_many(self, highs, lows, closes):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+        highs = numpy.asarray(highs, dtype="float64")
+        lows = numpy.asarray(lows, dtype="float64")
+        closes = numpy.asarray(closes, dtype="float64")
+        count = len(highs)
+        if count == 0:
+            return highs.copy()
+        ranges = highs - lows
+        previous_closes = numpy.concatenate([[numpy.nan if self._previous_close is None else self._previous_close],
+                                             closes[:-1]])
+        # the first bar without a previous close has the high - low range
+        true_ranges = numpy.fmax(ranges, numpy.fmax(numpy.abs(highs - previous_closes),
+                                                    numpy.abs(lows - previous_closes)))
+        self._previous_close = float(closes[-1])
+        result = numpy.full(count, numpy.nan)
+        first = 0
+        if self.value is None:
+            # true ranges summed until the first value, the average of the first period true ranges
+            first = min(self.period - self._count, count)
+            self._sum += float(numpy.sum(true_ranges[:first]))
+            self._count += first
+            if self._count < self.period:
+                return result
+            self.value = self._sum / self.period
+            result[first - 1] = self.value
+        self._count += count - first
+        result[first:] = _smooth(true_ranges[first:], 1.0 / self.period, self.value)
+        self.value = float(result[-1])
+        return result
@@ -1,5 +1,6 @@
 # noinspection PyPep8Naming
 import copy
+from typing import Callable, List, Tuple
 
 from algotrader_com.domain.conversions import Conversions
 from algotrader_com.domain.entity import LifecycleEvent, OrderStatus, OrderCompletion, Fill, Transaction, \
@@ -77,6 +78,11 @@ class AlgoTraderToPythonInterface:
             # re-instantiate the strategy class in order to be able to use it several times if we are running an
             #  optimization
             _python_to_at_entry_point = self.python_to_at_entry_point
+            _python_to_at_entry_point.local_market_data_cache.flush()
+            _python_to_at_entry_point.cached_lookup_service.invalidate()
+            _python_to_at_entry_point.order_store.flush()
+            _python_to_at_entry_point.order_id_allocator.flush()
+            _python_to_at_entry_point.order_amend_coalescer.flush()
             self.strategy_service = copy.deepcopy(self.strategy_service_copy)
             self.strategy_service.python_to_at_entry_point = _python_to_at_entry_point
 
@@ -84,24 +90,80 @@ class AlgoTraderToPythonInterface:
         self._ensure_services_initialized()
         tick_dict = Conversions.unmarshall(tick_vo_json)
         tick = Tick.convert_from_json_object(tick_dict)
+        self.python_to_at_entry_point.local_market_data_cache.on_event(tick)
+        for aggregator in self.strategy_service.bar_aggregators:
+            aggregator.on_tick(tick)
         self.strategy_service.on_tick(tick)
 
+    def onTicks(self, tick_vo_jsons):
+        self._ensure_services_initialized()
+        tick_dicts = Conversions.unmarshall(tick_vo_jsons)
+        ticks = [Tick.convert_from_json_object(tick_dict) for tick_dict in tick_dicts]
+        local_market_data_cache = self.python_to_at_entry_point.local_market_data_cache
+        for tick in ticks:
+            local_market_data_cache.on_event(tick)
+        if self.strategy_service.bar_aggregators:
+            self._on_ticks_with_aggregators(ticks)
+        else:
+            self.strategy_service.on_ticks(ticks)
+
+    def _on_ticks_with_aggregators(self, ticks):
+        # type: (List[Tick]) -> None
+        """Splits the batch at the ticks closing bars, so the strategy receives ticks and bars in the order of onTick:
+           the bars closed by a tick after the ticks before it and before the tick itself."""
+        aggregators = self.strategy_service.bar_aggregators
+        closed = []  # type: List[Tuple[Callable[[Bar], None], Bar]]
+        on_bars = [aggregator.on_bar for aggregator in aggregators]
+        start = 0
+        try:
+            for aggregator, on_bar in zip(aggregators, on_bars):
+                aggregator.on_bar = lambda bar, _on_bar=on_bar: closed.append((_on_bar, bar))
+            for index, tick in enumerate(ticks):
+                for aggregator in aggregators:
+                    aggregator.on_tick(tick)
+                if closed:
+                    if index > start:
+                        self.strategy_service.on_ticks(ticks[start:index])
+                        start = index
+                    for on_bar, bar in closed:
+                        on_bar(bar)
+                    del closed[:]
+        finally:
+            for aggregator, on_bar in zip(aggregators, on_bars):
+                aggregator.on_bar = on_bar
+        if start < len(ticks) or not ticks:
+            self.strategy_service.on_ticks(ticks[start:])
+
     def onBar(self, bar_vo_json):
         self._ensure_services_initialized()
         bar_dict = Conversions.unmarshall(bar_vo_json)
         bar = Bar.convert_from_json_object(bar_dict)
+        self.python_to_at_entry_point.local_market_data_cache.on_event(bar)
         self.strategy_service.on_bar(bar)
 
+    def onBars(self, bar_vo_jsons):
+        self._ensure_services_initialized()
+        bar_dicts = Conversions.unmarshall(bar_vo_jsons)
+        bars = [Bar.convert_from_json_object(bar_dict) for bar_dict in bar_dicts]
+        local_market_data_cache = self.python_to_at_entry_point.local_market_data_cache
+        for bar in bars:
+            local_market_data_cache.on_event(bar)
+        self.strategy_service.on_bars(bars)
+
     def onTrade(self, trade_vo_json):
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(trade_vo_json)
         trade = Trade.convert_from_json_object(_dict)
+        self.python_to_at_entry_point.local_market_data_cache.on_event(trade)
+        for aggregator in self.strategy_service.bar_aggregators:
+            aggregator.on_trade(trade)
         self.strategy_service.on_trade(trade)
 
     def onQuote(self, quote_vo_json):
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(quote_vo_json)
         quote = Quote.convert_from_json_object(_dict)
+        self.python_to_at_entry_point.local_market_data_cache.on_event(quote)
         self.strategy_service.on_quote(quote)
 
     def onGenericTick(self, generic_tick_vo_json):
@@ -130,24 +192,29 @@ class AlgoTraderToPythonInterface:
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(order_vo_json)
         order = Order.convert_from_json_object(_dict)
+        self.python_to_at_entry_point.order_store.on_order(order)
         self.strategy_service.on_order(order)
 
     def onOrderStatus(self, order_vo_json):
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(order_vo_json)
         order_status = OrderStatus.convert_from_json(_dict)
+        self.python_to_at_entry_point.order_store.on_order_status(order_status)
+        self.python_to_at_entry_point.order_amend_coalescer.on_order_status(order_status)
         self.strategy_service.on_order_status(order_status)
 
     def onOrderCompletion(self, order_completion_vo):
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(order_completion_vo)
         order_completion = OrderCompletion.convert_from_json(_dict)
+        self.python_to_at_entry_point.order_store.on_order_completion(order_completion)
         self.strategy_service.on_order_completion(order_completion)
 
     def onFill(self, fill_vo):
         self._ensure_services_initialized()
         _dict = Conversions.unmarshall(fill_vo)
         fill = Fill.convert_from_json(_dict)
+        self.python_to_at_entry_point.order_store.on_fill(fill)
         self.strategy_service.on_fill(fill)
 
     def onTransaction(self, transaction_vo):
@@ -170,6 +237,7 @@ class AlgoTraderToPythonInterface:
     def onAccountEvent(self, account_event_vo):
         self._ensure_services_initialized()
         account_event = AccountEvent.convert_to_account_event(account_event_vo)
+        self.python_to_at_entry_point.cached_lookup_service.invalidate("account")
         self.strategy_service.on_account_event(account_event)
 
     def onExternalBalance(self, external_balance_vo):
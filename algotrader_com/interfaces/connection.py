@@ -4,6 +4,7 @@ from typing import List, Optional
 from py4j.clientserver import ClientServer, JavaParameters, PythonParameters
 from py4j.java_gateway import java_import, DEFAULT_PORT, DEFAULT_PYTHON_PROXY_PORT
 
+from algotrader_com.domain.conversions import Conversions
 from algotrader_com.interfaces.at2py import AlgoTraderToPythonInterface
 from algotrader_com.interfaces.py2at import PythonToAlgoTraderInterface
 from algotrader_com.services.strategy import StrategyService
@@ -12,8 +13,8 @@ gateway = None
 
 
 def connect_to_algotrader(strategy_service, only_subscribe_methods_list=None, java_port=DEFAULT_PORT,
-                          python_port=DEFAULT_PYTHON_PROXY_PORT):
-    # type: (StrategyService, Optional[List[str]], int, int) -> PythonToAlgoTraderInterface
+                          python_port=DEFAULT_PYTHON_PROXY_PORT, numeric_mode=None, numeric_scale=8):
+    # type: (StrategyService, Optional[List[str]], int, int, Optional[str], int) -> PythonToAlgoTraderInterface
     """Waits for AlgoTrader to start if it is not started already and connects to it.
        Returns entry point object of class PythonToAlgoTraderInterface to be used by strategies to make calls to AT.
 
@@ -22,10 +23,14 @@ def connect_to_algotrader(strategy_service, only_subscribe_methods_list=None, ja
            only_subscribe_methods_list (Optional[List[str]]): Optional parameter, for optimization only, None value subscribes all event handler methods. Use the names of onXYZ methods in algotrader_com.interfaces.at2py.AlgoTraderToPythonInterface.
            java_port (int): The port to connect to where Java part of AlgoTrader is running. Only to be set a custom value when multiple strategies need to be set up with StrategyStarter.
            python_port (int): The port to expose for the Java part of AlgoTrader. Only to be set a custom value when multiple strategies need to be set up with StrategyStarter..
+           numeric_mode (Optional[str]): Number type of market data prices and volumes: "decimal", "float" or "scaled" (fixed-point int). None keeps the current mode, "decimal" unless set before connecting. See algotrader_com.domain.conversions.Conversions.set_numeric_mode.
+           numeric_scale (int): Number of decimal places kept by the "scaled" numeric mode.
        Returns:
            PythonToAlgoTraderInterface: Entry point object to be used by strategies to make calls to AT.
     """
 
+    if numeric_mode is not None:
+        Conversions.set_numeric_mode(numeric_mode, numeric_scale)
     at_to_python_entry_point = AlgoTraderToPythonInterface(strategy_service)
     global gateway
     gateway = ClientServer(java_parameters=JavaParameters(port=java_port),
@@ -8,12 +8,16 @@ from algotrader_com.services.generic_events import GenericEventsService
 from algotrader_com.services.health import HealthService
 from algotrader_com.services.historical_data import HistoricalDataService
 from algotrader_com.services.lookup import LookupService
+from algotrader_com.services.lookup_cache import CachedLookupService
 from algotrader_com.services.market_data import MarketDataService
-from algotrader_com.services.market_data_cache import MarketDataCacheService
+from algotrader_com.services.market_data_cache import LocalMarketDataCache, MarketDataCacheService
 from algotrader_com.services.measurement import MeasurementService
 from algotrader_com.services.option import OptionService
 from algotrader_com.services.order import OrderService
+from algotrader_com.services.order_amend import OrderAmendCoalescer
+from algotrader_com.services.order_ids import OrderIdAllocator
 from algotrader_com.services.order_lookup import OrderLookupService
+from algotrader_com.services.order_store import LocalOrderStore
 from algotrader_com.services.portfolio import PortfolioService
 from algotrader_com.services.portfolio_value import PortfolioValueService
 from algotrader_com.services.position import PositionService
@@ -42,13 +46,23 @@ class PythonToAlgoTraderInterface:
            market_data_service (algotrader_com.services.market_data.MarketDataService): &nbsp;
            position_service (algotrader_com.services.position.PositionService): &nbsp;
            order_lookup_service (algotrader_com.services.order_lookup.OrderLookupService): &nbsp;
+           order_store (algotrader_com.services.order_store.LocalOrderStore): state of the orders of the strategy,
+               answers active order queries without calling AlgoTrader
+           order_id_allocator (algotrader_com.services.order_ids.OrderIdAllocator): order ids reserved in blocks,
+               used by order_service
+           order_amend_coalescer (algotrader_com.services.order_amend.OrderAmendCoalescer): modifies orders at most
+               once per acknowledgement, sending only the newest modification
            lookup_service (algotrader_com.services.lookup.LookupService): &nbsp;
+           cached_lookup_service (algotrader_com.services.lookup_cache.CachedLookupService): lookup_service with
+               cached reference data
            account_service (algotrader_com.services.account.AccountService): &nbsp;
            reference_data_service (algotrader_com.services.reference.ReferenceDataService): &nbsp;
            calendar_service (algotrader_com.services.calendar.CalendarService): &nbsp;
            future_service (algotrader_com.services.future.FutureService): &nbsp;
            combination_service (algotrader_com.services.combination.CombinationService): &nbsp;
            market_data_cache_service (algotrader_com.services.market_data_cache.MarketDataCacheService): &nbsp;
+           local_market_data_cache (algotrader_com.services.market_data_cache.LocalMarketDataCache): last market data
+               events received by the strategy, answers market data cache getters without calling AlgoTrader
            common_config (algotrader_com.services.common_config.CommonConfig): &nbsp;
            measurement_service (algotrader_com.services.measurement.MeasurementService): &nbsp;
            rfq_service (algotrader_com.services.rfq.RfqService): &nbsp;
@@ -62,6 +76,12 @@ class PythonToAlgoTraderInterface:
     def __init__(self, gateway):
         # type: (ClientServer) -> None
         self._gateway = gateway
+        # updated by the AlgoTraderToPythonInterface callbacks, which don't depend on prepare_services
+        self.local_market_data_cache = LocalMarketDataCache(None)
+        self.cached_lookup_service = CachedLookupService(None)
+        self.order_store = LocalOrderStore()
+        self.order_id_allocator = OrderIdAllocator(None)
+        self.order_amend_coalescer = OrderAmendCoalescer(None)
 
     # noinspection PyAttributeOutsideInit
     def prepare_services(self):
@@ -73,13 +93,19 @@ class PythonToAlgoTraderInterface:
         self.market_data_service = self._load_service(MarketDataService)  # type: MarketDataService
         self.position_service = self._load_service(PositionService)  # type: PositionService
         self.order_lookup_service = self._load_service(OrderLookupService)  # type: OrderLookupService
+        self.order_service.order_store = self.order_store
+        self.order_id_allocator.order_service = self.order_service
+        self.order_service.order_id_allocator = self.order_id_allocator
+        self.order_amend_coalescer.order_service = self.order_service
         self.lookup_service = self._load_service(LookupService)  # type: LookupService
+        self.cached_lookup_service.lookup_service = self.lookup_service
         self.account_service = self._load_service(AccountService)  # type: AccountService
         self.reference_data_service = self._load_service(ReferenceDataService)  # type: ReferenceDataService
         self.calendar_service = self._load_service(CalendarService)  # type: CalendarService
         self.future_service = self._load_service(FutureService)  # type: FutureService
         self.combination_service = self._load_service(CombinationService)  # type: CombinationService
         self.market_data_cache_service = self._load_service(MarketDataCacheService)  # type: MarketDataCacheService
+        self.local_market_data_cache.market_data_cache_service = self.market_data_cache_service
         self.common_config = self._load_service(CommonConfig)  # type: CommonConfig
         self.measurement_service = self._load_service(MeasurementService)  # type: MeasurementService
         self.rfq_service = self._load_service(RfqService)  # type: RfqService
@@ -0,0 +1,240 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.series import BarSeries
+from algotrader_com.services.historical_data import HistoricalDataService
+from algotrader_com.services.rate_limit import RateLimitService
+
+
+class DownloadJob:
+    """Historical bars of one security and time range to download.
+
+       Attributes:
+           security_id (int): &nbsp;
+           min_date (datetime): &nbsp;
+           max_date (datetime): &nbsp;
+           .. include:: ../bar_sizes.txt
+           historical_data_type (str): One of the values: TRADES, MIDPOINT, BID, ASK, BID_ASK, BEST_BID, BEST_ASK.
+           properties (Dict[str]): Arbitrary properties that should be added to the request.
+           persist (bool): store the bars in the AlgoTrader database (download_and_persist_historical_bars)
+               instead of passing them to the on_chunk callback
+    """
+
+    def __init__(self, security_id, min_date, max_date, bar_size, historical_data_type="TRADES", properties=None,
+                 persist=True):
+        # type: (int, datetime, datetime, str, str, Dict[str,str], bool) -> None
+        self.security_id = security_id
+        self.min_date = min_date
+        self.max_date = max_date
+        self.bar_size = bar_size
+        self.historical_data_type = historical_data_type
+        self.properties = properties or {}
+        self.persist = persist
+
+
+class DownloadProgress:
+    """Progress of a BulkHistoricalDownloader run.
+
+       Attributes:
+           completed_chunks (int): chunks downloaded in this run or skipped as already checkpointed
+           total_chunks (int): &nbsp;
+           bars (int): bars passed to on_chunk in this run
+           elapsed_seconds (float): &nbsp;
+    """
+
+    def __init__(self, total_chunks):
+        # type: (int) -> None
+        self.completed_chunks = 0
+        self.total_chunks = total_chunks
+        self.bars = 0
+        self.elapsed_seconds = 0.0
+        self._downloaded_chunks = 0
+
+    def chunks_per_second(self):
+        # type: () -> float
+        return self._downloaded_chunks / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def bars_per_second(self):
+        # type: () -> float
+        return self.bars / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def __str__(self):
+        return "%d/%d chunks, %d bars, %.2f chunks/s, %.0f bars/s" % (
+            self.completed_chunks, self.total_chunks, self.bars, self.chunks_per_second(), self.bars_per_second())
+
+
+class BulkHistoricalDownloader:
+    """Downloads historical bars of many jobs in parallel. Each job range is split into chunks downloaded on a thread
+       pool. Calls wait while the rate limit of the account has no calls available. Completed chunks are recorded in
+       the checkpoint file, so running the same jobs again after an interruption skips them.
+
+       Attributes:
+           historical_data_service (algotrader_com.services.historical_data.HistoricalDataService): &nbsp;
+           rate_limit_service (algotrader_com.services.rate_limit.RateLimitService): None to not throttle
+           account_id (str): account whose rate limit throttles the downloads
+           max_workers (int): number of parallel downloads
+           chunk (timedelta): maximum time span downloaded per call
+           checkpoint_file (str): JSON file of completed chunks, None to not checkpoint
+           progress_callback (Callable[[DownloadProgress], None]): called after each chunk, e.g. print, None to not
+               report the progress
+    """
+
+    def __init__(self, historical_data_service, rate_limit_service=None, account_id=None, max_workers=4,
+                 chunk=timedelta(days=30), checkpoint_file=None, progress_callback=None):
+        # type: (HistoricalDataService, Optional[RateLimitService], str, int, timedelta, str, Optional[Callable[[DownloadProgress], None]]) -> None
+        self.historical_data_service = historical_data_service
+        self.rate_limit_service = rate_limit_service
+        self.account_id = account_id
+        self.max_workers = max_workers
+        self.chunk = chunk
+        self.checkpoint_file = checkpoint_file
+        self.progress_callback = progress_callback
+        self._rate_limit_condition = threading.Condition()
+        # calls left of the available calls last read from the rate limit, taken by the workers one by one
+        self._rate_limit_budget = 0
+        # downloads started from the budget and not completed, AlgoTrader may not count them yet
+        self._unsettled_calls = 0
+        self._checkpoint_lock = threading.Lock()
+
+    def run(self, jobs, on_chunk=None):
+        # type: (List[DownloadJob], Callable[[DownloadJob, BarSeries], None]) -> DownloadProgress
+        """Downloads all chunks of the jobs not checkpointed yet and returns the final progress.
+           After the first failing chunk no more chunks are started and it is raised once the running downloads
+           finish, completed chunks stay checkpointed.
+
+           Arguments:
+               jobs (List of DownloadJob): &nbsp;
+               on_chunk (Callable[[DownloadJob, BarSeries], None]): receives the bars of each chunk of jobs
+                   not persisted, called from the worker threads
+           Returns:
+               DownloadProgress
+        """
+        chunks = [(job, start, end) for job in jobs for start, end in self._split(job)]
+        completed = self._read_checkpoint()
+        progress = DownloadProgress(len(chunks))
+        started = time.time()
+        pending = []
+        for job, start, end in chunks:
+            if self._chunk_key(job, start, end) in completed:
+                progress.completed_chunks += 1
+            else:
+                pending.append((job, start, end))
+        progress_lock = threading.Lock()
+
+        failed = threading.Event()
+
+        def download(job, start, end):
+            if failed.is_set():
+                # a chunk taken by a worker before it was canceled
+                return
+            try:
+                bars = self._download(job, start, end, on_chunk)
+            except Exception:
+                failed.set()
+                raise
+            with progress_lock:
+                self._checkpoint(completed, self._chunk_key(job, start, end))
+                progress.completed_chunks += 1
+                progress._downloaded_chunks += 1
+                progress.bars += bars
+                progress.elapsed_seconds = time.time() - started
+                if self.progress_callback is not None:
+                    self.progress_callback(progress)
+
+        self._rate_limit_budget = 0
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="HistoricalDownload") as executor:
+            futures = [executor.submit(download, job, start, end) for job, start, end in pending]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            # after a failure the chunks not started are not downloaded, the running ones finish
+            for future in not_done:
+                future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+        progress.elapsed_seconds = time.time() - started
+        return progress
+
+    def _split(self, job):
+        # type: (DownloadJob) -> List[Tuple[datetime, datetime]]
+        chunks = []
+        start = job.min_date
+        while start < job.max_date:
+            end = min(start + self.chunk, job.max_date)
+            chunks.append((start, end))
+            start = end
+        return chunks
+
+    def _download(self, job, start, end, on_chunk):
+        # type: (DownloadJob, datetime, datetime, Callable[[DownloadJob, BarSeries], None]) -> int
+        throttled = self._wait_for_rate_limit()
+        try:
+            return self._download_chunk(job, start, end, on_chunk)
+        finally:
+            if throttled:
+                with self._rate_limit_condition:
+                    self._unsettled_calls -= 1
+                    self._rate_limit_condition.notify_all()
+
+    def _download_chunk(self, job, start, end, on_chunk):
+        # type: (DownloadJob, datetime, datetime, Callable[[DownloadJob, BarSeries], None]) -> int
+        if job.persist:
+            self.historical_data_service.download_and_persist_historical_bars(
+                job.security_id, start, end, job.bar_size, job.historical_data_type, job.properties)
+            return 0
+        series = self.historical_data_service.download_historical_bar_series(
+            job.security_id, start, end, job.bar_size, job.historical_data_type, job.properties)
+        if on_chunk is not None:
+            on_chunk(job, series)
+        return len(series)
+
+    def _wait_for_rate_limit(self):
+        # type: () -> bool
+        """Takes a call from the budget shared by all workers, waiting while the rate limit has none available.
+           Returns False if the account has no rate limit."""
+        if self.rate_limit_service is None or not self.rate_limit_service.is_rate_limit_available(self.account_id):
+            return False
+        with self._rate_limit_condition:
+            while self._rate_limit_budget <= 0:
+                # the calls taken from the last budget are counted by AlgoTrader before it is read again
+                while self._unsettled_calls > 0:
+                    self._rate_limit_condition.wait()
+                available_calls = self.rate_limit_service.get_available_calls(self.account_id)
+                if available_calls > 0:
+                    self._rate_limit_budget = available_calls
+                else:
+                    wait_millis = self.rate_limit_service.get_time_to_wait_for_next_call(self.account_id)
+                    time.sleep(max(wait_millis, 10) / 1000.0)
+            self._rate_limit_budget -= 1
+            self._unsettled_calls += 1
+        return True
+
+    @staticmethod
+    def _chunk_key(job, start, end):
+        # type: (DownloadJob, datetime, datetime) -> str
+        return "%d|%s|%s|%d|%d|%s" % (job.security_id, job.bar_size, job.historical_data_type,
+                                      Conversions.python_datetime_to_millis(start),
+                                      Conversions.python_datetime_to_millis(end), "persist" if job.persist else "")
+
+    def _read_checkpoint(self):
+        # type: () -> Set[str]
+        if self.checkpoint_file is None or not os.path.exists(self.checkpoint_file):
+            return set()
+        with open(self.checkpoint_file) as f:
+            return set(json.load(f))
+
+    def _checkpoint(self, completed, chunk_key):
+        # type: (Set[str], str) -> None
+        completed.add(chunk_key)
+        if self.checkpoint_file is None:
+            return
+        with self._checkpoint_lock:
+            temporary_file = self.checkpoint_file + ".tmp"
+            with open(temporary_file, "w") as f:
+                json.dump(sorted(completed), f)
+            os.replace(temporary_file, self.checkpoint_file)
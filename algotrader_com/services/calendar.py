@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from py4j.java_collections import JavaIterator
 from py4j.clientserver import ClientServer
@@ -7,6 +7,11 @@ from typing import List
 from algotrader_com.domain.conversions import Conversions
 from algotrader_com.domain.entity import TradingHours
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class CalendarService:
     """Delegates to pythonCalendarService object in PythonStrategyService on the Java side.
@@ -115,6 +120,27 @@ class CalendarService:
         result = Conversions.epoch_millis_to_python_datetime(zd)
         return result
 
+    def get_session_opens(self, exchange_id, min_date, max_date):
+        # type: (int, datetime, datetime) -> numpy.ndarray
+        """Returns the open times of the trading days of the exchange between min_date and max_date, to align
+           resampled bars to sessions (see algotrader_com.domain.resampling). Makes one call per day.
+
+           Arguments:
+               exchange_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+           Returns:
+               numpy.ndarray of int64: epoch milliseconds, sorted
+        """
+        opens = []
+        day = min_date
+        while day <= max_date:
+            open_time = self.get_open_time_on_date(exchange_id, day)
+            if open_time is not None:
+                opens.append(Conversions.python_datetime_to_millis(open_time))
+            day += timedelta(days=1)
+        return numpy.unique(numpy.array(opens, dtype="int64"))
+
     def get_open_time(self, exchange_id):
         # type: (int) -> datetime
         """Gets the time the exchange opens on the current date or None if the exchange is closed on that day
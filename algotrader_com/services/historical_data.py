@@ -1,10 +1,77 @@
-from datetime import datetime
-from typing import List, Dict
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Iterator, Callable, Any, Tuple
 
 from py4j.clientserver import ClientServer
 
 from algotrader_com.domain.conversions import Conversions
 from algotrader_com.domain.market_data import Tick, Bar, Ask, Bid, BidAskQuote, Trade
+from algotrader_com.domain.resampling import resample_bars
+from algotrader_com.domain.series import TickSeries, BarSeries
+
+
+def _windows(min_date, max_date, window):
+    # type: (datetime, datetime, timedelta) -> List[Tuple[datetime, datetime]]
+    windows = []
+    start = min_date
+    while start < max_date:
+        end = min(start + window, max_date)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+def _check_prefetch_windows(prefetch_windows):
+    # type: (int) -> None
+    # a queue of maxsize 0 is unbounded
+    if prefetch_windows < 1:
+        raise ValueError("prefetch_windows must be at least 1, got " + str(prefetch_windows) + ".")
+
+
+def _iter_prefetched(windows, fetch_window, prefetch_windows):
+    # type: (List[Tuple[datetime, datetime]], Callable[[datetime, datetime], List[Any]], int) -> Iterator[Any]
+    """Yields the items of each window in order. A background thread fetches the following windows while the current
+       one is consumed, holding at most prefetch_windows fetched windows besides the current one."""
+    fetched = queue.Queue()  # type: queue.Queue
+    # a window is fetched only after a slot frees up, so windows fetching or fetched and not yet consumed are at most
+    #  prefetch_windows
+    slots = threading.Semaphore(prefetch_windows)
+    stopped = threading.Event()
+
+    def acquire_slot():
+        # type: () -> bool
+        while not slots.acquire(timeout=0.1):
+            if stopped.is_set():
+                return False
+        return not stopped.is_set()
+
+    def fetch_all():
+        try:
+            for start, end in windows:
+                if not acquire_slot():
+                    return
+                fetched.put((fetch_window(start, end), None))
+        except Exception as e:
+            fetched.put((None, e))
+        fetched.put((None, None))
+
+    thread = threading.Thread(target=fetch_all, name="HistoricalDataPrefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            items, error = fetched.get()
+            # the previous window is consumed
+            slots.release()
+            if error is not None:
+                raise error
+            if items is None:
+                return
+            for item in items:
+                yield item
+    finally:
+        # the caller may stop iterating early
+        stopped.set()
 
 
 class HistoricalDataService:
@@ -86,6 +153,42 @@ class HistoricalDataService:
             ticks.append(tick)
         return ticks
 
+    def get_tick_series_by_max_date(self, security_id, max_date, interval_days):
+        # type: (int, datetime, int) -> TickSeries
+        """Gets all ticks of the defined security for the specified time period as columns, see get_ticks_by_max_date.
+
+           Arguments:
+               security_id (int):
+               max_date (datetime): Ticks will be loaded before this date.
+               interval_days (int): Number of days before max_date ticks will be loaded.
+           Returns:
+               algotrader_com.domain.series.TickSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        max_date_converted = Conversions.python_datetime_to_zoneddatetime(max_date, self._gateway)
+        vos = self._service.getTicksByMaxDate(security_id, max_date_converted,
+                                              interval_days)
+        return TickSeries.from_json(vos)
+
+    def get_tick_series_by_min_date(self, security_id, min_date, interval_days):
+        # type: (int, datetime, int) -> TickSeries
+        """Gets all ticks of the defined security for the specified time period as columns, see get_ticks_by_min_date.
+
+           Arguments:
+               security_id (int):
+               min_date (datetime): Ticks will be loaded after this date.
+               interval_days (int): Number of days after min_date ticks will be loaded.
+           Returns:
+               algotrader_com.domain.series.TickSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        min_date_converted = Conversions.python_datetime_to_zoneddatetime(min_date, self._gateway)
+        vos = self._service.getTicksByMinDate(security_id, min_date_converted,
+                                              interval_days)
+        return TickSeries.from_json(vos)
+
     # noinspection PyIncorrectDocstring
     def get_last_n_bars_by_security_and_bar_size(self, n, security_id, bar_size):
         # type: (int, int, str) -> List[Bar]
@@ -164,6 +267,157 @@ class HistoricalDataService:
             bars.append(bar)
         return bars
 
+    # noinspection PyIncorrectDocstring
+    def get_last_n_bar_series_by_security_and_bar_size(self, n, security_id, bar_size):
+        # type: (int, int, str) -> BarSeries
+        """ Returns the last 'n' bars of the specified security as columns
+
+           Arguments:
+               n (int): number of bars to load
+               security_id (int): &nbsp;
+               .. include:: ../bar_sizes.txt
+           Returns:
+               algotrader_com.domain.series.BarSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        bar_size_enum = self._gateway.jvm.Duration.valueOf(bar_size)
+        vos = self._service \
+            .getLastNBarsBySecurityAndBarSize(n, security_id, bar_size_enum)
+        return BarSeries.from_json(vos)
+
+    # noinspection PyIncorrectDocstring
+    def get_bar_series_by_security_min_date_and_bar_size(self, security_id, min_date, bar_size):
+        # type: (int, datetime, str) -> BarSeries
+        """Returns bars of the specified security security_id after the specified min_date as columns.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               .. include:: ../bar_sizes.txt
+           Returns:
+               algotrader_com.domain.series.BarSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        min_date_converted = Conversions.python_datetime_to_zoneddatetime(min_date, self._gateway)
+        bar_size_enum = self._gateway.jvm.Duration.valueOf(bar_size)
+
+        vos = self._service.getBarsBySecurityMinDateAndBarSize(security_id, min_date_converted,
+                                                               bar_size_enum)
+        return BarSeries.from_json(vos)
+
+    # noinspection PyIncorrectDocstring
+    def get_bar_series_by_security_min_date_max_date_and_bar_size(self, security_id, min_date, max_date, bar_size):
+        # type: (int, datetime, datetime, str) -> BarSeries
+        """Returns bars of the specified security security_id between min_date and max_date as columns.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               .. include:: ../bar_sizes.txt
+           Returns:
+               algotrader_com.domain.series.BarSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        min_date_converted = Conversions.python_datetime_to_zoneddatetime(min_date, self._gateway)
+        max_date_converted = Conversions.python_datetime_to_zoneddatetime(max_date, self._gateway)
+        bar_size_enum = self._gateway.jvm.Duration.valueOf(bar_size)
+
+        vos = self._service.getBarsBySecurityMinDateMaxDateAndBarSize(security_id, min_date_converted,
+                                                                      max_date_converted, bar_size_enum)
+        return BarSeries.from_json(vos)
+
+    # noinspection PyIncorrectDocstring
+    def get_resampled_bar_series(self, security_id, min_date, max_date, base_bar_size, bar_sizes,
+                                 session_opens=None):
+        # type: (int, datetime, datetime, str, List[str], numpy.ndarray) -> Dict[str, BarSeries]
+        """Loads bars of base_bar_size once and resamples them to each of bar_sizes,
+           see algotrader_com.domain.resampling.resample_bars.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               base_bar_size (str): finest bar size loaded, e.g. MIN_1
+               bar_sizes (List of str): coarser bar sizes, e.g. ["MIN_5", "MIN_15", "HOUR_1"]
+               session_opens (numpy.ndarray of int64): see CalendarService.get_session_opens
+           Returns:
+               Dict of str to algotrader_com.domain.series.BarSeries: resampled bars by bar size
+        """
+        bars = self.get_bar_series_by_security_min_date_max_date_and_bar_size(security_id, min_date, max_date,
+                                                                             base_bar_size)
+        return {bar_size: resample_bars(bars, bar_size, session_opens) for bar_size in bar_sizes}
+
+    def iter_ticks(self, security_id, min_date, max_date, window=timedelta(days=1), prefetch_windows=1):
+        # type: (int, datetime, datetime, timedelta, int) -> Iterator[Tick]
+        """Iterates over the ticks of the defined security with min_date <= date_time < max_date, loading them window
+           by window. The next windows are loaded on a background thread while the current one is consumed, so at most
+           prefetch_windows + 1 windows are held in memory.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               window (timedelta): time span loaded per call, a whole number of days
+               prefetch_windows (int): number of windows loaded ahead, at least 1
+           Returns:
+               Iterator of algotrader_com.domain.market_data.Tick
+        """
+        _check_prefetch_windows(prefetch_windows)
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        if window.days < 1 or window % timedelta(days=1):
+            raise Exception("Tick window must be a whole number of days.")
+
+        def fetch_window(start, end):
+            start_converted = Conversions.python_datetime_to_zoneddatetime(start, self._gateway)
+            vos = self._service.getTicksByMinDate(security_id, start_converted, window.days)
+            start_millis = Conversions.python_datetime_to_millis(start)
+            end_millis = Conversions.python_datetime_to_millis(end)
+            # windows overlap at their bounds and the last one may end before the loaded interval
+            return [Tick.convert_from_json_object(_dict) for _dict in Conversions.unmarshall("[" + ",".join(vos) + "]")
+                    if start_millis <= _dict["dateTime"] < end_millis]
+
+        return _iter_prefetched(_windows(min_date, max_date, window), fetch_window, prefetch_windows)
+
+    # noinspection PyIncorrectDocstring
+    def iter_bars(self, security_id, min_date, max_date, bar_size, window=timedelta(days=7), prefetch_windows=1):
+        # type: (int, datetime, datetime, str, timedelta, int) -> Iterator[Bar]
+        """Iterates over the bars of the specified security with min_date <= date_time < max_date, loading them window
+           by window. The next windows are loaded on a background thread while the current one is consumed, so at most
+           prefetch_windows + 1 windows are held in memory.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               .. include:: ../bar_sizes.txt
+               window (timedelta): time span loaded per call
+               prefetch_windows (int): number of windows loaded ahead, at least 1
+           Returns:
+               Iterator of algotrader_com.domain.market_data.Bar
+        """
+        _check_prefetch_windows(prefetch_windows)
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        bar_size_enum = self._gateway.jvm.Duration.valueOf(bar_size)
+
+        def fetch_window(start, end):
+            start_converted = Conversions.python_datetime_to_zoneddatetime(start, self._gateway)
+            end_converted = Conversions.python_datetime_to_zoneddatetime(end, self._gateway)
+            vos = self._service.getBarsBySecurityMinDateMaxDateAndBarSize(security_id, start_converted,
+                                                                          end_converted, bar_size_enum)
+            start_millis = Conversions.python_datetime_to_millis(start)
+            end_millis = Conversions.python_datetime_to_millis(end)
+            # a bar at the bound of two windows is only kept by the window starting there
+            return [Bar.convert_from_json_object(_dict) for _dict in Conversions.unmarshall("[" + ",".join(vos) + "]")
+                    if start_millis <= _dict["dateTime"] < end_millis]
+
+        return _iter_prefetched(_windows(min_date, max_date, window), fetch_window, prefetch_windows)
+
     def get_asks_by_max_date(self, security_id, max_date, interval_days):
         # type: (int, datetime, int) -> List[Ask]
         """Arguments:
@@ -402,6 +656,37 @@ class HistoricalDataService:
             bars.append(bar)
         return bars
 
+    # noinspection PyIncorrectDocstring
+    def download_historical_bar_series(self, security_id, min_date, max_date, bar_size, historical_data_type,
+                                       properties):
+        # type: (int, datetime, datetime, str, str, Dict[str,str]) -> BarSeries
+        """Downloads historical bars for the specified security as columns, see download_historical_bars.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               .. include:: ../bar_sizes.txt
+               historical_data_type (str): One of the values: TICK, BAR, BID, ASK, BIDASK, TRADE, ORDERBOOK, CUSTOM, DIVIDENDS.
+               properties (Dict[str]): Arbitrary properties that should be added to the request.
+           Returns:
+               algotrader_com.domain.series.BarSeries
+        """
+        if self._service is None:
+            raise Exception("AlgoTrader historical data service not loaded.")
+        min_date_converted = Conversions.python_datetime_to_zoneddatetime(min_date, self._gateway)
+        max_date_converted = Conversions.python_datetime_to_zoneddatetime(max_date, self._gateway)
+        bar_size_enum = self._gateway.jvm.Duration.valueOf(bar_size)
+        historical_data_type_enum = self._gateway.jvm.HistoricalDataType.valueOf(historical_data_type)
+
+        _map = self._gateway.jvm.HashMap()
+        for key in properties:
+            _map.put(key, properties[key])
+
+        vos = self._service.downloadHistoricalBars(security_id, min_date_converted, max_date_converted,
+                                                   bar_size_enum, historical_data_type_enum, _map)
+        return BarSeries.from_json(vos)
+
     def download_historical_ticks(self, security_id, min_date, max_date, historical_data_type, properties):
         # type: (int, datetime, datetime, str, Dict[str,str]) -> List[Tick]
         """Retrieves historical ticks for the specified security.
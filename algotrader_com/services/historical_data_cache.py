@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.resampling import bar_size_to_millis
+from algotrader_com.domain.series import BarSeries
+from algotrader_com.services.historical_data import HistoricalDataService
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# data type of bars loaded from the AlgoTrader database instead of downloaded from a provider
+DATABASE = "DATABASE"
+
+# longest duration of the calendar based bar size units, bar_size_to_millis does not support them
+_CALENDAR_UNIT_MAX_MILLIS = {"WEEK": 7 * 86400000, "MONTH": 31 * 86400000, "YEAR": 366 * 86400000}
+
+
+def _max_bar_millis(bar_size):
+    # type: (str) -> int
+    """Returns the longest duration of a bar of the bar size, e.g. 31 days for MONTH_1."""
+    unit, _, count = bar_size.partition("_")
+    if unit in _CALENDAR_UNIT_MAX_MILLIS and count.isdigit():
+        return _CALENDAR_UNIT_MAX_MILLIS[unit] * int(count)
+    return bar_size_to_millis(bar_size)
+
+
+def _missing_ranges(covered, start, end):
+    # type: (List[List[int]], int, int) -> List[Tuple[int, int]]
+    """Returns the parts of [start, end) not in the sorted, disjoint covered ranges."""
+    missing = []
+    for covered_start, covered_end in covered:
+        if covered_end <= start:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > start:
+            missing.append((start, covered_start))
+        start = max(start, covered_end)
+    if start < end:
+        missing.append((start, end))
+    return missing
+
+
+def _add_range(covered, start, end):
+    # type: (List[List[int]], int, int) -> List[List[int]]
+    """Returns the sorted, disjoint covered ranges including [start, end), merging adjacent ranges."""
+    merged = []  # type: List[List[int]]
+    for covered_start, covered_end in sorted(covered + [[start, end]]):
+        if merged and covered_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], covered_end)
+        else:
+            merged.append([covered_start, covered_end])
+    return merged
+
+
+class HistoricalDataCache:
+    """On-disk cache of historical bars in front of HistoricalDataService.
+
+       Bars are stored per (security_id, data type, bar_size) in a directory holding one segment directory per range
+       loaded, with one .npy file per BarSeries column, and an index.json file with the time ranges already loaded and
+       the time span of each segment. A query only loads the missing parts of its range through the
+       HistoricalDataService and writes them as new segments, a query within covered ranges does not call the JVM.
+       Segments are never rewritten: a result within one segment is a memory-mapped view of it, a result spanning
+       several segments is a copy. Requires NumPy.
+
+       Attributes:
+           historical_data_service (algotrader_com.services.historical_data.HistoricalDataService): &nbsp;
+           directory (str): root directory of the cache
+    """
+
+    def __init__(self, historical_data_service, directory):
+        # type: (HistoricalDataService, str) -> None
+        if numpy is None:
+            raise Exception("NumPy is required for HistoricalDataCache.")
+        self.historical_data_service = historical_data_service
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    # noinspection PyIncorrectDocstring
+    def get_bar_series(self, security_id, min_date, max_date, bar_size, historical_data_type=DATABASE,
+                       properties=None):
+        # type: (int, datetime, datetime, str, str, Dict[str,str]) -> BarSeries
+        """Returns bars of the specified security with min_date <= date_time < max_date, loading only the parts of
+           the range not cached yet. The last bar size before now is never cached: bars may still be added there.
+           A recent range is cached up to its last bar, and not at all if it returned no bars. For calendar based
+           bar sizes (WEEK_1, MONTH_1, YEAR_1, ...) the last 7, 31 or 366 days per unit are not cached.
+
+           Arguments:
+               security_id (int): &nbsp;
+               min_date (datetime): &nbsp;
+               max_date (datetime): &nbsp;
+               .. include:: ../bar_sizes.txt
+               historical_data_type (str): DATABASE to load stored bars (get_bar_series_by_security_min_date_max_date_and_bar_size),
+                   otherwise the type of bars to download (download_historical_bar_series): TRADES, MIDPOINT, BID, ASK, ...
+               properties (Dict[str]): Arbitrary properties that should be added to download requests.
+           Returns:
+               algotrader_com.domain.series.BarSeries
+        """
+        start = Conversions.python_datetime_to_millis(min_date)
+        end = Conversions.python_datetime_to_millis(max_date)
+        path = os.path.join(self.directory, str(security_id), historical_data_type + "_" + bar_size)
+        with self._lock:
+            covered, segments = self._read_index(path)
+            missing = _missing_ranges(covered, start, end)
+            if missing:
+                recent = int(time.time() * 1000) - _max_bar_millis(bar_size)
+                for missing_start, missing_end in missing:
+                    part = self._fetch(security_id, missing_start, missing_end, bar_size, historical_data_type,
+                                       properties or {})
+                    if len(part):
+                        segments.append(self._write_segment(path, segments, part))
+                    covered_end = min(missing_end, recent)
+                    if missing_end > recent:
+                        # bars of a recent range may still be persisted or completed: the last bar is loaded again
+                        covered_end = min(covered_end, int(part.timestamp_ms[-1])) if len(part) else missing_start
+                    if covered_end > missing_start:
+                        covered = _add_range(covered, missing_start, covered_end)
+                self._write_index(path, covered, segments)
+            parts = [self._load_segment(path, name, bar_size).between(start, end)
+                     for name, first, last in segments if first < end and last >= start]
+        series = self._merge([part for part in parts if len(part)], bar_size)
+        series.security_id = security_id
+        return series
+
+    def _fetch(self, security_id, start, end, bar_size, historical_data_type, properties):
+        # type: (int, int, int, str, str, Dict[str,str]) -> BarSeries
+        min_date = Conversions.epoch_millis_to_python_datetime(start)
+        max_date = Conversions.epoch_millis_to_python_datetime(end)
+        if historical_data_type == DATABASE:
+            series = self.historical_data_service.get_bar_series_by_security_min_date_max_date_and_bar_size(
+                security_id, min_date, max_date, bar_size)
+        else:
+            series = self.historical_data_service.download_historical_bar_series(
+                security_id, min_date, max_date, bar_size, historical_data_type, properties)
+        return series.between(start, end)
+
+    @staticmethod
+    def _read_index(path):
+        # type: (str) -> Tuple[List[List[int]], List[List]]
+        """Returns the covered ranges and the segments as [name, first timestamp, last timestamp], oldest first."""
+        index_file = os.path.join(path, "index.json")
+        if not os.path.exists(index_file):
+            return [], []
+        with open(index_file) as f:
+            index = json.load(f)
+        return index["ranges"], index["segments"]
+
+    @staticmethod
+    def _write_index(path, covered, segments):
+        # type: (str, List[List[int]], List[List]) -> None
+        temporary_file = os.path.join(path, "index.tmp.json")
+        with open(temporary_file, "w") as f:
+            json.dump({"ranges": covered, "segments": segments}, f)
+        os.replace(temporary_file, os.path.join(path, "index.json"))
+
+    @staticmethod
+    def _write_segment(path, segments, part):
+        # type: (str, List[List], BarSeries) -> List
+        # a segment left by an interrupted write is not in the index and is overwritten
+        name = "segment_" + str(len(segments))
+        segment_path = os.path.join(path, name)
+        os.makedirs(segment_path, exist_ok=True)
+        for column_name, _key, _dtype in BarSeries.COLUMNS:
+            numpy.save(os.path.join(segment_path, column_name + ".npy"), getattr(part, column_name))
+        return [name, int(part.timestamp_ms[0]), int(part.timestamp_ms[-1])]
+
+    @staticmethod
+    def _load_segment(path, name, bar_size):
+        # type: (str, str, str) -> BarSeries
+        segment_path = os.path.join(path, name)
+        columns = {column_name: numpy.load(os.path.join(segment_path, column_name + ".npy"), mmap_mode="r")
+                   for column_name, _key, _dtype in BarSeries.COLUMNS}
+        return BarSeries(None, bar_size, **columns)
+
+    @staticmethod
+    def _merge(parts, bar_size):
+        # type: (List[BarSeries], str) -> BarSeries
+        if not parts:
+            return BarSeries(None, bar_size)
+        if len(parts) == 1:
+            return parts[0]
+        # the segments written last come first: a bar loaded again replaces the stored one
+        parts = parts[::-1]
+        # sorted positions of the first bar of each timestamp
+        _timestamps, order = numpy.unique(numpy.concatenate([part.timestamp_ms for part in parts]), return_index=True)
+        columns = {name: numpy.concatenate([getattr(part, name) for part in parts])[order]
+                   for name, _key, _dtype in BarSeries.COLUMNS}
+        return BarSeries(None, bar_size, **columns)
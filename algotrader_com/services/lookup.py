@@ -3,11 +3,16 @@ from algotrader_com.domain.entity import SecurityFamily, Exchange, Component, Su
     Transaction, Account, CashBalance
 from algotrader_com.domain.order import Order
 from algotrader_com.domain.security import Security, Stock, Option, Future, Combination, IntrestRate
+from algotrader_com.domain.utils import is_missing_java_method
 from datetime import datetime
 from py4j.clientserver import ClientServer
 from py4j.java_collections import ListConverter
+from py4j.protocol import Py4JError
 from typing import List, Optional, Any, Dict, Tuple, Type
 
+# returned by LookupService._call_json when AlgoTrader has no JSON variant of a method
+_NO_JSON = object()
+
 
 class LookupService:
     """Delegates to pythonLookupService object in PythonPortfolioService on the Java side.
@@ -20,6 +25,38 @@ class LookupService:
         self._gateway = gateway
         if gateway is not None:
             self._service = self._gateway.entry_point.getPythonLookupService()
+        # securities are fetched as JSON (one string per call) unless AlgoTrader does not provide the Json methods
+        self._security_json = True
+
+    def _call_json(self, method_name, *args):
+        """Calls the <method_name>Json variant of a Java method returning the value objects as a JSON string,
+           returns _NO_JSON if AlgoTrader does not provide it."""
+        if not self._security_json:
+            return _NO_JSON
+        try:
+            return getattr(self._service, method_name + "Json")(*args)
+        except Py4JError as error:
+            if not is_missing_java_method(error):
+                raise
+            self._security_json = False
+            return _NO_JSON
+
+    def _get_security(self, method_name, *args):
+        # type: (str, Any) -> Optional[Security]
+        vo_json = self._call_json(method_name, *args)
+        if vo_json is not _NO_JSON:
+            return Security.convert_from_json_object(Conversions.unmarshall(vo_json))
+        vo = getattr(self._service, method_name)(*args)
+        return Security.convert_from_vo(vo, self._gateway)
+
+    def _get_securities(self, security_class, method_name, *args):
+        # type: (Type[Security], str, Any) -> List[Security]
+        vo_json = self._call_json(method_name, *args)
+        if vo_json is not _NO_JSON:
+            vo_dicts = Conversions.unmarshall(vo_json) or []
+            return [security_class.convert_from_json_object(vo_dict) for vo_dict in vo_dicts]
+        vos = getattr(self._service, method_name)(*args)
+        return [security_class.convert_from_vo(vo, self._gateway) for vo in vos]
 
     def get_security(self, _id):
         # type: (int) -> Security
@@ -30,9 +67,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service.getSecurity(_id)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurity", _id)
 
     def get_securities_by_isin(self, isin):
         # type: (str) -> List[Security]
@@ -42,12 +77,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getSecuritiesByIsin(isin)
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSecuritiesByIsin", isin)
 
     def get_security_by_isin_exchange_and_currency(self, isin, exchange_id, quote_currency):
         # type: (str, int, str) -> Security
@@ -59,9 +89,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service.getSecurityByIsinExchangeAndCurrency(isin, exchange_id, quote_currency)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurityByIsinExchangeAndCurrency", isin, exchange_id, quote_currency)
 
     def get_securities_by_symbol(self, symbol):
         # type: (str) -> List[Security]
@@ -71,12 +99,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getSecuritiesBySymbol(symbol)
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSecuritiesBySymbol", symbol)
 
     def get_security_by_bbgid(self, bbgid):
         # type: (str) -> Security
@@ -86,9 +109,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service.getSecurityByBbgid(bbgid)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurityByBbgid", bbgid)
 
     def get_security_by_ric(self, ric):
         # type: (str) -> Security
@@ -98,9 +119,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service.getSecurityByRic(ric)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurityByRic", ric)
 
     def get_securities_by_conid(self, conid):
         # type: (str) -> List[Security]
@@ -111,12 +130,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getSecuritiesByConid(conid)
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSecuritiesByConid", conid)
 
     def get_security_by_conid_and_exchange(self, conid, exchange_id):
         # type: (str, int) -> Security
@@ -127,9 +141,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service.getSecurityByConidAndExchange(conid, exchange_id)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurityByConidAndExchange", conid, exchange_id)
 
     def get_securities_by_ids(self, ids_list):
         # type: (List[int]) -> List[Security]
@@ -141,12 +153,7 @@ class LookupService:
         """
         # noinspection PyProtectedMember
         ids_java = ListConverter().convert(ids_list, self._gateway._gateway_client)
-        vos = self._service.getSecuritiesByIds(ids_java)
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSecuritiesByIds", ids_java)
 
     def get_securities_by_security_family(self, security_family_id):
         # type: (int) -> List[Security]
@@ -156,12 +163,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getSecuritiesBySecurityFamily(security_family_id)
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSecuritiesBySecurityFamily", security_family_id)
 
     def get_all_securities(self):
         # type: () -> List[Security]
@@ -169,12 +171,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getAllSecurities()
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getAllSecurities")
 
     def get_all_security_families(self):
         # type: () -> List[SecurityFamily]
@@ -239,10 +236,7 @@ class LookupService:
            Returns:
                algotrader_com.domain.security.Security
         """
-        vo = self._service \
-            .getSecurityReferenceTargetByOwnerAndName(security_id, name)
-        security = Security.convert_from_vo(vo, self._gateway)
-        return security
+        return self._get_security("getSecurityReferenceTargetByOwnerAndName", security_id, name)
 
     def get_subscribed_securities_for_auto_activate_strategies(self):
         # type: () -> List[Security]
@@ -260,12 +254,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Security
         """
-        vos = self._service.getSubscribedSecuritiesForAutoActivatePortfolios()
-        securities = []
-        for vo in vos:
-            security = Security.convert_from_vo(vo, self._gateway)
-            securities.append(security)
-        return securities
+        return self._get_securities(Security, "getSubscribedSecuritiesForAutoActivatePortfolios")
 
     def get_stocks_by_sector(self, code):
         # type: (str) -> List[Stock]
@@ -273,12 +262,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Stock
         """
-        vos = self._service.getStocksBySector(code)
-        stocks = []
-        for vo in vos:
-            stock = Stock.convert_from_vo(vo, self._gateway)
-            stocks.append(stock)
-        return stocks
+        return self._get_securities(Stock, "getStocksBySector", code)
 
     def get_stocks_by_industry_group(self, code):
         # type: (str) -> List[Stock]
@@ -288,12 +272,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Stock
         """
-        vos = self._service.getStocksByIndustryGroup(code)
-        stocks = []
-        for vo in vos:
-            stock = Stock.convert_from_vo(vo, self._gateway)
-            stocks.append(stock)
-        return stocks
+        return self._get_securities(Stock, "getStocksByIndustryGroup", code)
 
     def get_stocks_by_industry(self, code):
         # type: (str) -> List[Stock]
@@ -303,12 +282,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Stock
         """
-        vos = self._service.getStocksByIndustry(code)
-        stocks = []
-        for vo in vos:
-            stock = Stock.convert_from_vo(vo, self._gateway)
-            stocks.append(stock)
-        return stocks
+        return self._get_securities(Stock, "getStocksByIndustry", code)
 
     def get_stocks_by_sub_industry(self, code):
         # type: (str) -> List[Stock]
@@ -318,12 +292,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Stock
         """
-        vos = self._service.getStocksBySubIndustry(code)
-        stocks = []
-        for vo in vos:
-            stock = Stock.convert_from_vo(vo, self._gateway)
-            stocks.append(stock)
-        return stocks
+        return self._get_securities(Stock, "getStocksBySubIndustry", code)
 
     def get_subscribed_options(self):
         # type: () -> List[Option]
@@ -332,12 +301,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Option
         """
-        vos = self._service.getSubscribedOptions()
-        options = []
-        for vo in vos:
-            option = Option.convert_from_vo(vo, self._gateway)
-            options.append(option)
-        return options
+        return self._get_securities(Option, "getSubscribedOptions")
 
     def get_subscribed_futures(self):
         # type: () -> List[Future]
@@ -346,12 +310,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Future
         """
-        vos = self._service.getSubscribedFutures()
-        futures = []
-        for vo in vos:
-            future = Future.convert_from_vo(vo, self._gateway)
-            futures.append(future)
-        return futures
+        return self._get_securities(Future, "getSubscribedFutures")
 
     def get_subscribed_combinations_by_strategy(self, strategy_name):
         # type: (str) -> List[Combination]
@@ -369,12 +328,7 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Combination
         """
-        vos = self._service.getSubscribedCombinationsByPortfolio(portfolio_name)
-        combinations = []
-        for vo in vos:
-            combination = Combination.convert_from_vo(vo, self._gateway)
-            combinations.append(combination)
-        return combinations
+        return self._get_securities(Combination, "getSubscribedCombinationsByPortfolio", portfolio_name)
 
     def get_subscribed_combinations_by_strategy_and_underlying(self, strategy_name, underlying_id):
         # type: (str, int) -> List[Combination]
@@ -400,13 +354,8 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Combination
         """
-        vos = self._service.getSubscribedCombinationsByPortfolioAndUnderlying(
-            portfolio_name, underlying_id)
-        combinations = []
-        for vo in vos:
-            combination = Combination.convert_from_vo(vo, self._gateway)
-            combinations.append(combination)
-        return combinations
+        return self._get_securities(Combination, "getSubscribedCombinationsByPortfolioAndUnderlying", portfolio_name,
+                                    underlying_id)
 
     def get_subscribed_combinations_by_strategy_and_component(self, strategy_name, security_id):
         # type: (str, int) -> List[Combination]
@@ -432,13 +381,8 @@ class LookupService:
            Returns:
                List of algotrader_com.domain.security.Combination
          """
-        vos = self._service.getSubscribedCombinationsByPortfolioAndComponent(
-            portfolio_name, security_id)
-        combinations = []
-        for vo in vos:
-            combination = Combination.convert_from_vo(vo, self._gateway)
-            combinations.append(combination)
-        return combinations
+        return self._get_securities(Combination, "getSubscribedCombinationsByPortfolioAndComponent", portfolio_name,
+                                    security_id)
 
     def get_subscribed_components_by_strategy(self, strategy_name):
         # type: (str) -> List[Component]
@@ -0,0 +1,215 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from algotrader_com.domain.security import Security
+from algotrader_com.services.lookup import LookupService
+
+# cached LookupService methods by entity type, the other methods are delegated to the LookupService on each call
+CACHED_METHODS = {
+    "security": ("get_security", "get_securities_by_isin", "get_security_by_isin_exchange_and_currency",
+                 "get_securities_by_symbol", "get_security_by_bbgid", "get_security_by_ric", "get_securities_by_conid",
+                 "get_security_by_conid_and_exchange", "get_securities_by_security_family", "get_all_securities"),
+    "security_family": ("get_security_family", "get_security_family_by_name", "get_security_family_by_symbol_root",
+                        "get_option_family_by_underlying", "get_future_family_by_underlying",
+                        "get_security_family_by_security", "get_all_security_families",
+                        "get_all_security_families_of_type"),
+    "exchange": ("get_exchange_by_id", "get_exchange_by_name", "get_exchange_by_security", "get_all_exchanges"),
+    "account": ("get_account", "get_account_by_name", "get_all_accounts"),
+    "portfolio": ("get_strategy", "get_portfolio", "get_strategy_by_name", "get_portfolio_by_name",
+                  "get_all_strategies", "get_all_portfolios"),
+}
+
+
+class CacheStats:
+    """Statistics of the cache of one entity type.
+
+       Attributes:
+           hits (int): &nbsp;
+           misses (int): &nbsp;
+           evictions (int): entries removed because of max_size
+           expirations (int): entries found older than the time to live
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def hit_ratio(self):
+        # type: () -> float
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __str__(self):
+        return "%d hits, %d misses (%.1f%% hits), %d evictions, %d expirations" % (
+            self.hits, self.misses, 100 * self.hit_ratio(), self.evictions, self.expirations)
+
+
+class _EntityCache:
+    """Least recently used entries of one entity type with an optional time to live."""
+
+    def __init__(self, ttl_seconds, max_size):
+        # type: (Optional[float], Optional[int]) -> None
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self.entries = OrderedDict()  # type: OrderedDict[Tuple, Tuple[float, object]]
+
+    def get(self, key):
+        # type: (Tuple) -> Tuple[bool, object]
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return False, None
+        stored, value = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored > self.ttl_seconds:
+            del self.entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+        return True, value
+
+    def put(self, key, value):
+        # type: (Tuple, object) -> None
+        self.entries[key] = (time.monotonic(), value)
+        self.entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats.evictions += 1
+
+
+class CachedLookupService:
+    """Read-through cache in front of LookupService for reference data: securities, security families, exchanges,
+       accounts and strategies (portfolios), see CACHED_METHODS. Each entity type has its own time to live and
+       maximum number of entries (least recently used entries are evicted first), None for no limit.
+       Other LookupService methods, e.g. positions and transactions, call AlgoTrader on each call.
+
+       Lookups finding nothing (None or an empty list) are not cached.
+       Cached objects are shared between calls and must not be modified. Call invalidate after reference data
+       changes, e.g. after ReferenceDataService.retrieve. Accounts are invalidated on account events and all
+       entries when the strategy is re-instantiated between optimization runs.
+
+       Initialized by <i>PythonToAlgoTraderInterface</i> as its <i>cached_lookup_service</i>.
+
+       Attributes:
+           lookup_service (algotrader_com.services.lookup.LookupService): set by
+               <i>PythonToAlgoTraderInterface.prepare_services</i>
+    """
+
+    def __init__(self, lookup_service, ttl_seconds=None, max_size=10000):
+        # type: (LookupService, Dict[str, Optional[float]], Optional[int]) -> None
+        """
+           Arguments:
+               lookup_service (algotrader_com.services.lookup.LookupService): &nbsp;
+               ttl_seconds (Dict of str to float): time to live by entity type, entity types not given never expire
+               max_size (int): maximum number of entries of each entity type
+        """
+        self.lookup_service = lookup_service
+        ttl_seconds = ttl_seconds or {}
+        self._caches = {entity_type: _EntityCache(ttl_seconds.get(entity_type), max_size)
+                        for entity_type in CACHED_METHODS}
+        self._entity_types = {method: entity_type for entity_type, methods in CACHED_METHODS.items()
+                              for method in methods}
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # only called for methods not defined here: cached methods are created on first access
+        if name == "lookup_service" or name.startswith("_"):
+            # not set yet, e.g. while copying or unpickling before __init__ ran
+            raise AttributeError(name)
+        entity_type = self._entity_types.get(name)
+        method = getattr(self.lookup_service, name)
+        if entity_type is None:
+            return method
+        cache = self._caches[entity_type]
+
+        def cached(*args, **kwargs):
+            key = (name,) + args + tuple(sorted(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)
+            with self._lock:
+                found, value = cache.get(key)
+            if not found:
+                value = method(*args, **kwargs)
+                # entities not found are looked up again on the next call, they may be created meanwhile
+                if value is not None and value != []:
+                    with self._lock:
+                        cache.put(key, value)
+            return value
+
+        cached.__name__ = name
+        cached.__doc__ = method.__doc__
+        setattr(self, name, cached)
+        return cached
+
+    def get_securities_by_ids(self, ids_list):
+        # type: (List[int]) -> List[Security]
+        """Returns the securities, loading the ones not cached with a single call.
+
+           Arguments:
+               ids_list (List of int): &nbsp;
+           Returns:
+               List of algotrader_com.domain.security.Security
+        """
+        cache = self._caches["security"]
+        securities = {}
+        with self._lock:
+            for security_id in ids_list:
+                found, security = cache.get(("get_security", security_id))
+                if found:
+                    securities[security_id] = security
+        missing = [security_id for security_id in ids_list if security_id not in securities]
+        if missing:
+            loaded = self.lookup_service.get_securities_by_ids(missing)
+            with self._lock:
+                for security in loaded:
+                    securities[security.id] = security
+                    cache.put(("get_security", security.id), security)
+        return [securities[security_id] for security_id in ids_list if security_id in securities]
+
+    def get_stats(self):
+        # type: () -> Dict[str, CacheStats]
+        """
+           Returns:
+               Dict of str to CacheStats: statistics by entity type
+        """
+        return {entity_type: cache.stats for entity_type, cache in self._caches.items()}
+
+    def invalidate(self, entity_type=None):
+        # type: (Optional[str]) -> None
+        """Removes the cached entries of an entity type.
+
+           Arguments:
+               entity_type (str): "security", "security_family", "exchange", "account" or "portfolio", None for all
+        """
+        with self._lock:
+            for _entity_type, cache in self._caches.items():
+                if entity_type is None or _entity_type == entity_type:
+                    cache.entries.clear()
+
+    def invalidate_security(self, security_id):
+        # type: (int) -> None
+        """Removes the cached entries returning the security, e.g. after its definition changed.
+
+           Arguments:
+               security_id (int): &nbsp;
+        """
+        with self._lock:
+            entries = self._caches["security"].entries
+            for key in [key for key, (_stored, value) in entries.items() if _contains_security(value, security_id)]:
+                del entries[key]
+
+
+def _contains_security(value, security_id):
+    # type: (object, int) -> bool
+    if isinstance(value, list):
+        return any(security.id == security_id for security in value)
+    return value is not None and value.id == security_id
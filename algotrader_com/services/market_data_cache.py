@@ -1,12 +1,14 @@
+import time
 from decimal import Decimal
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Type, Union
 
 from py4j.clientserver import ClientServer
 from py4j.java_collections import ListConverter
 
 from algotrader_com.domain.conversions import Conversions
-from algotrader_com.domain.market_data import MarketDataEvent
+from algotrader_com.domain.market_data import Ask, Bar, Bid, BidAskQuote, MarketDataEvent, Tick, Trade
 from algotrader_com.domain.market_data import SubscriptionRequest
+from algotrader_com.domain.series import MarketDataSnapshot
 
 
 class MarketDataCacheService:
@@ -54,6 +56,26 @@ class MarketDataCacheService:
             values.append(event)
         return values
 
+    def get_snapshot(self, security_ids, fields=None, market_data_event_class=None):
+        # type: (List[int], List[str], Type[MarketDataEvent]) -> MarketDataSnapshot
+        """Returns the current market data of many securities in columns with a single call to AlgoTrader.
+           The last events are decoded as one JSON array without creating event objects.
+
+           Arguments:
+               security_ids (List of int): &nbsp;
+               fields (List of str): columns from MarketDataSnapshot.FIELDS, None for all
+               market_data_event_class (Class of algotrader_com.domain.market_data.MarketDataEvent): type of the
+                   events used, None for the last event of any type
+           Returns:
+               algotrader_com.domain.series.MarketDataSnapshot
+        """
+        if market_data_event_class is None:
+            vo_jsons = self._service.getCurrentMarketDataEvents()
+        else:
+            vo_jsons = self._service.getCurrentMarketDataEvents(market_data_event_class.JAVA_CLASS)
+        vo_dicts = Conversions.unmarshall("[" + ",".join(vo_jsons) + "]")
+        return MarketDataSnapshot.from_json_objects(security_ids, vo_dicts, fields)
+
     def get_current_market_data_event(self, security_id):
         # type: (int) -> Optional[MarketDataEvent]
         """Returns last market event of the specified security.
@@ -309,3 +331,238 @@ class MarketDataCacheService:
         # noinspection PyProtectedMember
         requests_list = ListConverter().convert(_requests, self._gateway._gateway_client)
         self._service.ensureMarketDataAvailable(requests_list, timeout, timeout_unit)
+
+
+class _SecurityEntry:
+    """Last market data events of one security."""
+
+    __slots__ = ("last", "by_class", "bid_event", "ask_event", "received")
+
+    def __init__(self):
+        self.last = None  # type: Optional[MarketDataEvent]
+        self.by_class = {}  # type: Dict[type, MarketDataEvent]
+        self.bid_event = None  # type: Optional[MarketDataEvent]
+        self.ask_event = None  # type: Optional[MarketDataEvent]
+        self.received = 0.0
+
+
+def _to_decimal(number):
+    # type: (Union[Decimal, float, int]) -> Optional[Decimal]
+    """Converts a price or volume of an event in any numeric mode to the Decimal returned by MarketDataCacheService."""
+    if number is None or isinstance(number, Decimal):
+        return number
+    if isinstance(number, int) and Conversions.get_numeric_mode() == "scaled":
+        return Conversions.scaled_int_to_decimal(number)
+    return Conversions.float_to_decimal(number)
+
+
+def _mid(bid, ask):
+    # type: (Union[Decimal, float, int], Union[Decimal, float, int]) -> Decimal
+    return (_to_decimal(bid) + _to_decimal(ask)) / 2
+
+
+def _bid(event):
+    # type: (MarketDataEvent) -> tuple
+    if isinstance(event, Tick):
+        return event.bid, event.vol_bid
+    if isinstance(event, BidAskQuote):
+        return event.bid_price, event.bid_size
+    return event.price, event.size
+
+
+def _ask(event):
+    # type: (MarketDataEvent) -> tuple
+    if isinstance(event, Tick):
+        return event.ask, event.vol_ask
+    if isinstance(event, BidAskQuote):
+        return event.ask_price, event.ask_size
+    return event.price, event.size
+
+
+def _current_value(event):
+    # type: (MarketDataEvent) -> Optional[Decimal]
+    if isinstance(event, Tick):
+        if event.bid is not None and event.ask is not None:
+            return _mid(event.bid, event.ask)
+        return _to_decimal(event.last)
+    if isinstance(event, Bar):
+        return _to_decimal(event.close)
+    if isinstance(event, Trade):
+        return _to_decimal(event.last_price)
+    if isinstance(event, BidAskQuote):
+        if event.bid_price is not None and event.ask_price is not None:
+            return _mid(event.bid_price, event.ask_price)
+        return None
+    return _to_decimal(event.price)
+
+
+class LocalMarketDataCache:
+    """Python side mirror of the last market data events, updated from the ticks, bars, trades and quotes delivered
+       to the strategy. Answers the getters of MarketDataCacheService without a call to AlgoTrader for the securities
+       it received events of, other securities are delegated to market_data_cache_service, as are bid and ask getters
+       of securities without tick or quote events.
+       Values are Decimal like those of MarketDataCacheService in every numeric mode (see
+       Conversions.set_numeric_mode), the events keep the number type of the mode.
+       The current value is the mid price of ticks and bid/ask quotes with both sides (the last price otherwise),
+       the close of bars, the last price of trades and the price of bid or ask quotes.
+
+       Initialized by <i>PythonToAlgoTraderInterface</i> as its <i>local_market_data_cache</i>.
+
+       Attributes:
+           market_data_cache_service (algotrader_com.services.market_data_cache.MarketDataCacheService): set by
+               <i>PythonToAlgoTraderInterface.prepare_services</i>
+    """
+
+    def __init__(self, market_data_cache_service):
+        # type: (MarketDataCacheService) -> None
+        self.market_data_cache_service = market_data_cache_service
+        self._entries = {}  # type: Dict[int, _SecurityEntry]
+
+    def on_event(self, event):
+        # type: (MarketDataEvent) -> None
+        """Records a tick, bar, trade or quote, called by AlgoTraderToPythonInterface before the strategy receives it.
+
+           Arguments:
+               event (algotrader_com.domain.market_data.MarketDataEvent): &nbsp;
+        """
+        entry = self._entries.get(event.security_id)
+        if entry is None:
+            entry = self._entries[event.security_id] = _SecurityEntry()
+        entry.last = event
+        entry.by_class[type(event)] = event
+        if isinstance(event, (Tick, Bid, BidAskQuote)):
+            entry.bid_event = event
+        if isinstance(event, (Tick, Ask, BidAskQuote)):
+            entry.ask_event = event
+        entry.received = time.monotonic()
+
+    def is_local(self, security_id):
+        # type: (int) -> bool
+        """
+           Returns:
+               bool: True if events of the security were received, so its getters are answered locally
+        """
+        return security_id in self._entries
+
+    def get_age_seconds(self, security_id):
+        # type: (int) -> Optional[float]
+        """
+           Returns:
+               float: seconds since the last event of the security was received, None if none was
+        """
+        entry = self._entries.get(security_id)
+        if entry is None:
+            return None
+        return time.monotonic() - entry.received
+
+    def get_stale_security_ids(self, max_age_seconds):
+        # type: (float) -> List[int]
+        """
+           Arguments:
+               max_age_seconds (float): &nbsp;
+           Returns:
+               List of int: securities whose last event was received more than max_age_seconds ago
+        """
+        oldest = time.monotonic() - max_age_seconds
+        return [security_id for security_id, entry in self._entries.items() if entry.received < oldest]
+
+    def get_current_market_data_events(self):
+        # type: () -> List[MarketDataEvent]
+        """
+           Returns:
+               List of algotrader_com.domain.market_data.MarketDataEvent: last event of each security received
+        """
+        return [entry.last for entry in self._entries.values()]
+
+    def get_current_market_data_event(self, security_id):
+        # type: (int) -> Optional[MarketDataEvent]
+        entry = self._entries.get(security_id)
+        if entry is None:
+            return self.market_data_cache_service.get_current_market_data_event(security_id)
+        return entry.last
+
+    def get_current_market_data_event_by_event_class(self, market_data_event_class, security_id):
+        # type: (Type[MarketDataEvent], int) -> Optional[MarketDataEvent]
+        entry = self._entries.get(security_id)
+        if entry is None:
+            return self.market_data_cache_service.get_current_market_data_event_by_event_class(
+                market_data_event_class, security_id)
+        for event_class, event in entry.by_class.items():
+            if issubclass(event_class, market_data_event_class):
+                return event
+        return None
+
+    def get_snapshot(self, security_ids, fields=None):
+        # type: (List[int], List[str]) -> MarketDataSnapshot
+        """Returns the current market data of many securities in columns, from the local events if events of all
+           securities were received, otherwise with a single call to AlgoTrader, see
+           MarketDataCacheService.get_snapshot.
+
+           Arguments:
+               security_ids (List of int): &nbsp;
+               fields (List of str): columns from MarketDataSnapshot.FIELDS, None for all
+           Returns:
+               algotrader_com.domain.series.MarketDataSnapshot
+        """
+        entries = self._entries
+        if not all(security_id in entries for security_id in security_ids):
+            return self.market_data_cache_service.get_snapshot(security_ids, fields)
+        return MarketDataSnapshot.from_events(security_ids, {security_id: entries[security_id].last
+                                                             for security_id in security_ids}, fields)
+
+    def get_current_value(self, security_id):
+        # type: (int) -> Decimal
+        entry = self._entries.get(security_id)
+        if entry is None:
+            return self.market_data_cache_service.get_current_value(security_id)
+        return _current_value(entry.last)
+
+    def get_current_value_by_event_class(self, market_data_event_class, security_id):
+        # type: (Type[MarketDataEvent], int) -> Optional[Decimal]
+        if security_id not in self._entries:
+            return self.market_data_cache_service.get_current_value_by_event_class(market_data_event_class,
+                                                                                   security_id)
+        event = self.get_current_market_data_event_by_event_class(market_data_event_class, security_id)
+        return None if event is None else _current_value(event)
+
+    def get_current_bid_price(self, security_id):
+        # type: (int) -> Decimal
+        entry = self._entries.get(security_id)
+        if entry is None or entry.bid_event is None:
+            return self.market_data_cache_service.get_current_bid_price(security_id)
+        return _to_decimal(_bid(entry.bid_event)[0])
+
+    def get_current_bid_volume(self, security_id):
+        # type: (int) -> Decimal
+        entry = self._entries.get(security_id)
+        if entry is None or entry.bid_event is None:
+            return self.market_data_cache_service.get_current_bid_volume(security_id)
+        return _to_decimal(_bid(entry.bid_event)[1])
+
+    def get_current_ask_price(self, security_id):
+        # type: (int) -> Decimal
+        entry = self._entries.get(security_id)
+        if entry is None or entry.ask_event is None:
+            return self.market_data_cache_service.get_current_ask_price(security_id)
+        return _to_decimal(_ask(entry.ask_event)[0])
+
+    def get_current_ask_volume(self, security_id):
+        # type: (int) -> Decimal
+        entry = self._entries.get(security_id)
+        if entry is None or entry.ask_event is None:
+            return self.market_data_cache_service.get_current_ask_volume(security_id)
+        return _to_decimal(_ask(entry.ask_event)[1])
+
+    def flush(self):
+        # type: () -> None
+        """Clears the local events of all securities, AlgoTrader's cache is not affected."""
+        self._entries.clear()
+
+    def flush_security(self, security_id):
+        # type: (int) -> None
+        """Clears the local events of the security, e.g. after unsubscribing it, so its getters call AlgoTrader again.
+
+           Arguments:
+               security_id (int): &nbsp;
+        """
+        self._entries.pop(security_id, None)
@@ -1,12 +1,48 @@
-from typing import Dict, Optional, Type
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Type
 
 from py4j.clientserver import ClientServer
 from py4j.java_collections import MapConverter
 from py4j.java_gateway import JavaObject
+from py4j.protocol import Py4JError
 
 from algotrader_com.domain.conversions import Conversions
 from algotrader_com.domain.order import Order, MarketOrder, LimitOrder, StopOrder, StopLimitOrder, \
     TargetPositionOrder, TrailingLimitOrder, TWAPOrder, VWAPOrder
+from algotrader_com.domain.utils import is_missing_java_method
+from algotrader_com.services.order_ids import OrderIdAllocator
+from algotrader_com.services.order_store import LocalOrderStore
+
+
+def _copy_result(source, target):
+    # type: (Future, Future) -> None
+    error = source.exception()
+    if error is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
+
+
+class OrderResult:
+    """Result of one order of send_orders, modify_orders or cancel_orders.
+
+       Attributes:
+           order (algotrader_com.domain.order.Order): the sent order returned by AlgoTrader for send_orders,
+               the order passed in for modify_orders and cancel_orders
+           error (str): error message if the order failed, None on success
+    """
+
+    def __init__(self, order, error=None):
+        # type: (Optional[Order], Optional[str]) -> None
+        self.order = order
+        self.error = error
+
+    @property
+    def ok(self):
+        # type: () -> bool
+        return self.error is None
 
 
 class OrderService:
@@ -15,11 +51,235 @@ class OrderService:
        Initialized by <i>connect_to_algotrader</i> function
        and a property of <i>python_to_at_entry_point (PythonToAlgoTraderInterface)</i> object set on connect."""
 
+    # orders sent are tracked by the order store, set by PythonToAlgoTraderInterface.prepare_services
+    order_store = None  # type: Optional[LocalOrderStore]
+    # reserves the ids of get_next_order_id in blocks, set by PythonToAlgoTraderInterface.prepare_services
+    order_id_allocator = None  # type: Optional[OrderIdAllocator]
+    # worker threads of the *_async methods and maximum number of their calls not completed yet,
+    # to be set before the first *_async call
+    async_workers = 4
+    max_orders_in_flight = 64
+
     def __init__(self, gateway):
         # type: (ClientServer) -> None
         self._gateway = gateway
         if gateway is not None:
             self._service = self._gateway.entry_point.getPythonOrderService()
+        # orders are batched in one call unless AlgoTrader does not provide the batch methods
+        self._batch_orders = True
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._in_flight = None  # type: Optional[threading.BoundedSemaphore]
+        # last call not completed yet by order int_id, calls of the same order run in the order they were made
+        self._last_calls = {}  # type: Dict[str, Future]
+        self._async_lock = threading.Lock()
+
+    def _sent_order(self, result):
+        # type: (Optional[str]) -> Optional[Order]
+        if result is None:
+            return None
+        return self._sent_order_object(Conversions.unmarshall(result))
+
+    def _sent_order_object(self, _dict):
+        # type: (Dict) -> Order
+        order = Order.convert_from_json_object(_dict)
+        if self.order_store is not None:
+            # the order object tracked first for the int_id, e.g. the one passed to send_order_async
+            return self.order_store.track(order).order
+        return order
+
+    def _call_batch(self, method_name, orders, call_single):
+        # type: (str, List[Order], Callable[[Order], Optional[Order]]) -> List[OrderResult]
+        """Passes the orders as one JSON array to the Java batch method, which returns a JSON array with the sent
+           order value object or {"error": message} per order, orders missing in the array fail. If AlgoTrader does
+           not provide the batch method the orders are passed one call per order."""
+        if self._batch_orders:
+            vo_jsons = "[" + ",".join(Conversions.marshall(order, order.get_java_class()) for order in orders) + "]"
+            try:
+                result = getattr(self._service, method_name)(vo_jsons)
+            except Py4JError as error:
+                if not is_missing_java_method(error):
+                    raise
+                self._batch_orders = False
+            else:
+                dicts = Conversions.unmarshall(result) or []
+                # orders without a result are reported as failed so that the results stay in the order of orders
+                missing = "AlgoTrader returned " + str(len(dicts)) + " results for " + str(len(orders)) + " orders."
+                results = []
+                for order, _dict in zip(orders, dicts + [{"error": missing}] * (len(orders) - len(dicts))):
+                    if _dict is not None and "error" in _dict:
+                        results.append(OrderResult(order, _dict["error"]))
+                    elif _dict is not None and "@class" in _dict:
+                        results.append(OrderResult(self._sent_order_object(_dict)))
+                    else:
+                        results.append(OrderResult(order))
+                return results
+        results = []
+        for order in orders:
+            try:
+                results.append(OrderResult(call_single(order) or order))
+            except Exception as error:
+                results.append(OrderResult(order, str(error)))
+        return results
+
+    def send_orders(self, orders):
+        # type: (List[Order]) -> List[OrderResult]
+        """Sends the orders with a single call to AlgoTrader, e.g. the legs of a pair or basket.
+           An order failing does not prevent sending the others.
+
+           Arguments:
+               orders (List of algotrader_com.domain.order.Order): &nbsp;
+           Returns:
+               List of OrderResult: one per order, in the order of orders
+        """
+        return self._call_batch("sendOrders", orders, self.send_order)
+
+    def modify_orders(self, orders):
+        # type: (List[Order]) -> List[OrderResult]
+        """Modifies the orders with a single call to AlgoTrader, see modify_order.
+
+           Arguments:
+               orders (List of algotrader_com.domain.order.Order): &nbsp;
+           Returns:
+               List of OrderResult: one per order, in the order of orders
+        """
+        return self._call_batch("modifyOrders", orders, self.modify_order)
+
+    def cancel_orders(self, orders):
+        # type: (List[Order]) -> List[OrderResult]
+        """Cancels the orders with a single call to AlgoTrader, see cancel_order.
+
+           Arguments:
+               orders (List of algotrader_com.domain.order.Order): &nbsp;
+           Returns:
+               List of OrderResult: one per order, in the order of orders
+        """
+        return self._call_batch("cancelOrders", orders, self.cancel_order)
+
+    def send_order_async(self, order, order_preference_name=None):
+        # type: (Order, Optional[str]) -> Future
+        """Sends an order on a worker thread without waiting for AlgoTrader, see send_order.
+           An order without int_id gets a reserved one from get_next_order_id before this method returns,
+           normally without calling AlgoTrader, so it can be modified or canceled by int_id while it is being sent.
+
+           Arguments:
+               order (algotrader_com.domain.order.Order): &nbsp;
+               order_preference_name (str): &nbsp;
+           Returns:
+               concurrent.futures.Future: result is the sent order, the order passed in updated by the order store if
+                   it is set (see send_order). If sending fails or is canceled the order is REJECTED in the order store.
+        """
+        if order.int_id is None:
+            order.int_id = self.get_next_order_id(type(order), order.account_id)
+        order_store = self.order_store
+        if order_store is None:
+            return self._submit(order.int_id, self.send_order, order, order_preference_name)
+        order_store.track(order)
+        future = self._submit(order.int_id, self.send_order, order, order_preference_name)
+
+        def sent(_future):
+            if _future.cancelled() or _future.exception() is not None:
+                order_store.on_send_failed(order.int_id)
+
+        future.add_done_callback(sent)
+        return future
+
+    def modify_order_async(self, order, properties=None, order_preference_name=None):
+        # type: (Order, Optional[Dict[str, str]], Optional[str]) -> Future
+        """Modifies an order on a worker thread without waiting for AlgoTrader, see modify_order, or
+           modify_order_with_fix_properties if properties or order_preference_name are given.
+           Calls for the same order int_id are passed to AlgoTrader in the order they were made.
+
+           Arguments:
+               order (algotrader_com.domain.order.Order): &nbsp;
+               properties (Optional[Dict[str, str]]): &nbsp;
+               order_preference_name (Optional[str]): &nbsp;
+           Returns:
+               concurrent.futures.Future: result is None
+        """
+        if properties is None and order_preference_name is None:
+            return self._submit(order.int_id, self.modify_order, order)
+        return self._submit(order.int_id, self.modify_order_with_fix_properties, order, properties,
+                            order_preference_name)
+
+    def cancel_order_async(self, order):
+        # type: (Order) -> Future
+        """Cancels an order on a worker thread without waiting for AlgoTrader, see cancel_order.
+           Calls for the same order int_id are passed to AlgoTrader in the order they were made.
+
+           Arguments:
+               order (algotrader_com.domain.order.Order): &nbsp;
+           Returns:
+               concurrent.futures.Future: result is None
+        """
+        return self._submit(order.int_id, self.cancel_order, order)
+
+    @staticmethod
+    def awaitable(future, loop=None):
+        # type: (Future, Optional[asyncio.AbstractEventLoop]) -> Awaitable
+        """Wraps a future of the *_async methods for asyncio, e.g. order = await service.awaitable(future).
+
+           Arguments:
+               future (concurrent.futures.Future): &nbsp;
+               loop (asyncio.AbstractEventLoop): None for the current event loop
+           Returns:
+               asyncio.Future
+        """
+        return asyncio.wrap_future(future, loop=loop)
+
+    def shutdown_async(self, wait=True):
+        # type: (bool) -> None
+        """Stops the worker threads of the *_async methods, after the calls made so far if wait is True."""
+        with self._async_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait)
+
+    def _submit(self, int_id, method, *args):
+        # type: (Optional[str], Callable, object) -> Future
+        """Runs the call on the worker threads. Py4J connects each Python thread to AlgoTrader with its own
+           connection, so the calls don't wait for the callback thread's connection or each other.
+           A call for an int_id with a call not completed yet is queued until that call completes, without
+           occupying a worker. Waits while max_orders_in_flight calls are not completed."""
+        with self._async_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.async_workers, thread_name_prefix="OrderService")
+                self._in_flight = threading.BoundedSemaphore(self.max_orders_in_flight)
+            executor = self._executor
+            in_flight = self._in_flight
+        in_flight.acquire()
+        future = Future()  # type: Future
+
+        def start(_previous=None):
+            # a queued call canceled before it started is skipped
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                call = executor.submit(method, *args)
+            except BaseException as error:
+                future.set_exception(error)
+                return
+            call.add_done_callback(lambda _call: _copy_result(_call, future))
+
+        future.add_done_callback(lambda _future: self._completed(int_id, _future, in_flight))
+        with self._async_lock:
+            previous = self._last_calls.get(int_id) if int_id is not None else None
+            if int_id is not None:
+                self._last_calls[int_id] = future
+        if previous is None:
+            start()
+        else:
+            # called right away if the previous call completed in the meantime
+            previous.add_done_callback(start)
+        return future
+
+    def _completed(self, int_id, future, in_flight):
+        # type: (Optional[str], Future, threading.BoundedSemaphore) -> None
+        in_flight.release()
+        if int_id is not None:
+            with self._async_lock:
+                if self._last_calls.get(int_id) is future:
+                    del self._last_calls[int_id]
 
     def create_order_by_order_preference(self, name):
         # type: (str) -> Order
@@ -65,10 +325,7 @@ class OrderService:
             result = self._service.sendOrder(vo_json)
         else:
             result = self._service.sendOrder(vo_json, order_preference_name)
-        if result is None:
-            return None
-        _dict = Conversions.unmarshall(result)
-        return Order.convert_from_json_object(_dict)
+        return self._sent_order(result)
 
     def send_order_with_fix_properties(self, order, properties=None, order_preference_name=None):
         # type: (Order, Optional[Dict[str, str]], Optional[str]) -> Optional[Order]
@@ -91,10 +348,7 @@ class OrderService:
             # noinspection PyProtectedMember
             property_map_java = MapConverter().convert(properties, self._gateway._gateway_client)
         result = self._service.sendOrderWithFixProperties(vo_json, order_preference_name, property_map_java)
-        if result is None:
-            return None
-        _dict = Conversions.unmarshall(result)
-        return Order.convert_from_json_object(_dict)
+        return self._sent_order(result)
 
     def send_order_with_properties(self, order, properties=None, order_preference_name=None):
         # type: (Order, Optional[Dict[str, str]], Optional[str]) -> Optional[Order]
@@ -116,10 +370,7 @@ class OrderService:
             # noinspection PyProtectedMember
             property_map_java = MapConverter().convert(properties, self._gateway._gateway_client)
         result = self._service.sendOrderWithProperties(vo_json, order_preference_name, property_map_java)
-        if result is None:
-            return None
-        _dict = Conversions.unmarshall(result)
-        return Order.convert_from_json_object(_dict)
+        return self._sent_order(result)
 
     def modify_order_with_fix_properties(self, order, properties=None, order_preference_name=None):
         # type: (Order, Optional[Dict[str, str]], Optional[str]) -> None
@@ -227,6 +478,7 @@ class OrderService:
     def get_next_order_id(self, order_class, account_id):
         # type: (Type[Order], int) -> str
         """Generates next order intId for the given account.
+           Ids are handed out from blocks reserved in advance by the order_id_allocator if it is set.
 
            Arguments:
                order_class (Class of algotrader_com.domain.order.Order): Subclass of Order class
@@ -253,6 +505,8 @@ class OrderService:
         else:
             raise Exception("Unsupported class: " + str(order_class))
 
+        if self.order_id_allocator is not None:
+            return self.order_id_allocator.next_id(java_class, account_id)
         return self._service.getNextOrderId(java_class, account_id)
 
     def is_trading_session_logged_on(self, order):
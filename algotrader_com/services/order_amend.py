@@ -0,0 +1,197 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from algotrader_com.domain.entity import OrderStatus
+from algotrader_com.domain.order import Order
+from algotrader_com.services.order_store import TERMINAL_STATUSES
+
+
+class AmendStats:
+    """Counters of OrderAmendCoalescer.
+
+       Attributes:
+           requested (int): calls of modify_order
+           sent (int): modifications passed to AlgoTrader
+           suppressed (int): modifications replaced by a newer one of the same order before being sent
+           dropped (int): modifications not sent because the order completed
+           acknowledged (int): modifications acknowledged by an order status
+           timed_out (int): modifications not acknowledged within ack_timeout_seconds
+           failed (int): modifications raising an error in AlgoTrader
+    """
+
+    def __init__(self):
+        self.requested = 0
+        self.sent = 0
+        self.suppressed = 0
+        self.dropped = 0
+        self.acknowledged = 0
+        self.timed_out = 0
+        self.failed = 0
+
+    def __str__(self):
+        return "%d requested, %d sent, %d suppressed, %d dropped, %d acknowledged, %d timed out, %d failed" % (
+            self.requested, self.sent, self.suppressed, self.dropped, self.acknowledged, self.timed_out, self.failed)
+
+
+class OrderAmendCoalescer:
+    """Modifies orders at most once per acknowledgement, e.g. when chasing the top of book on every tick.
+       A modification is sent right away if no earlier modification of the same int_id is waiting for its
+       acknowledgement, the next order status of the order. Otherwise it is kept until the acknowledgement arrives
+       and replaces any modification kept before, so only the newest price and quantity are sent.
+
+       Modifications are sent with OrderService.modify_order_async: modify_order does not wait for AlgoTrader.
+       The onOrderStatus event must not be excluded with subscribe_to_only_some_event_handler_methods.
+
+       Initialized by <i>PythonToAlgoTraderInterface</i> as its <i>order_amend_coalescer</i>.
+
+       Attributes:
+           order_service (algotrader_com.services.order.OrderService): service sending the modifications, set by
+               <i>PythonToAlgoTraderInterface.prepare_services</i>
+           ack_timeout_seconds (float): a modification not acknowledged after this time no longer holds back the next
+               one, None to wait for the acknowledgement indefinitely. Expired modifications are found by
+               modify_order, on_order_status and check_timeouts calls, which send the modifications they kept.
+           clock (Callable[[], float]): current time in seconds for ack_timeout_seconds, time.monotonic by default,
+               e.g. a function returning the time of the current market data event in a backtest
+           stats (AmendStats): &nbsp;
+    """
+
+    def __init__(self, order_service, ack_timeout_seconds=5.0, clock=time.monotonic):
+        # type: (object, Optional[float], Callable[[], float]) -> None
+        self.order_service = order_service
+        self.ack_timeout_seconds = ack_timeout_seconds
+        self.clock = clock
+        self.stats = AmendStats()
+        # token of the modification waiting for its acknowledgement by int_id
+        self._in_flight = {}  # type: Dict[str, object]
+        # newest modification not sent yet by int_id: order, properties and order preference name
+        self._pending = {}  # type: Dict[str, Tuple[Order, Optional[Dict[str, str]], Optional[str]]]
+        # heap of acknowledgement deadlines: time, sequence number, int_id and token of the modification,
+        #  entries of modifications acknowledged or failed meanwhile are skipped
+        self._deadlines = []  # type: List[Tuple[float, int, str, object]]
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def modify_order(self, order, properties=None, order_preference_name=None):
+        # type: (Order, Optional[Dict[str, str]], Optional[str]) -> bool
+        """Modifies the order now or after the acknowledgement of its previous modification,
+           see OrderService.modify_order_with_fix_properties.
+
+           Arguments:
+               order (algotrader_com.domain.order.Order): order with an int_id
+               properties (Optional[Dict[str, str]]): &nbsp;
+               order_preference_name (Optional[str]): &nbsp;
+           Returns:
+               bool: True if the modification was sent, False if it waits for the acknowledgement
+        """
+        int_id = order.int_id
+        with self._lock:
+            self.stats.requested += 1
+            if int_id in self._pending:
+                self.stats.suppressed += 1
+            self._pending[int_id] = (order, properties, order_preference_name)
+            to_send = self._release(int_id) if int_id not in self._in_flight else []
+            # the previous modification of the order may have timed out as well
+            to_send += self._expire()
+            sent = int_id not in self._pending
+        self._send_all(to_send)
+        return sent
+
+    def on_order_status(self, order_status):
+        # type: (OrderStatus) -> None
+        """Acknowledges the modification of the order in flight and sends the one kept, if any."""
+        int_id = order_status.int_id
+        with self._lock:
+            to_send = []
+            if self._stop(int_id):
+                self.stats.acknowledged += 1
+                if order_status.status in TERMINAL_STATUSES:
+                    if self._pending.pop(int_id, None) is not None:
+                        self.stats.dropped += 1
+                elif int_id in self._pending:
+                    to_send = self._release(int_id)
+            to_send += self._expire()
+        self._send_all(to_send)
+
+    def check_timeouts(self):
+        # type: () -> None
+        """Sends the modifications kept for orders whose modification in flight timed out, e.g. from on_tick when
+           no other modify_order or on_order_status call may come."""
+        with self._lock:
+            to_send = self._expire()
+        self._send_all(to_send)
+
+    def get_pending_count(self):
+        # type: () -> int
+        """
+           Returns:
+               int: number of orders with a modification waiting to be sent
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        # type: () -> None
+        """Forgets the modifications in flight and discards the ones not sent."""
+        with self._lock:
+            self._in_flight.clear()
+            self._pending.clear()
+            del self._deadlines[:]
+
+    def _release(self, int_id):
+        # type: (str) -> List[Tuple[object, Tuple[Order, Optional[Dict[str, str]], Optional[str]]]]
+        # called with the lock held: marks the modification kept for the order as in flight
+        token = object()
+        self._in_flight[int_id] = token
+        self.stats.sent += 1
+        if self.ack_timeout_seconds is not None:
+            heapq.heappush(self._deadlines, (self.clock() + self.ack_timeout_seconds, next(self._sequence), int_id,
+                                             token))
+        return [(token, self._pending.pop(int_id))]
+
+    def _stop(self, int_id):
+        # type: (str) -> bool
+        # called with the lock held, returns False if no modification of the order is in flight
+        return self._in_flight.pop(int_id, None) is not None
+
+    def _expire(self):
+        # type: () -> List[Tuple[object, Tuple[Order, Optional[Dict[str, str]], Optional[str]]]]
+        # called with the lock held: forgets the modifications in flight past their deadline, returns the kept ones
+        deadlines = self._deadlines
+        if not deadlines:
+            return []
+        now = self.clock()
+        to_send = []
+        while deadlines and deadlines[0][0] <= now:
+            _deadline, _sequence, int_id, token = heapq.heappop(deadlines)
+            if self._in_flight.get(int_id) is not token:
+                continue
+            del self._in_flight[int_id]
+            self.stats.timed_out += 1
+            if int_id in self._pending:
+                to_send += self._release(int_id)
+        return to_send
+
+    def _send_all(self, to_send):
+        # type: (List[Tuple[object, Tuple[Order, Optional[Dict[str, str]], Optional[str]]]]) -> None
+        for token, (order, properties, order_preference_name) in to_send:
+            future = self.order_service.modify_order_async(order, properties, order_preference_name)
+            future.add_done_callback(lambda _future, _int_id=order.int_id, _token=token:
+                                     self._sent(_int_id, _token, _future))
+
+    def _sent(self, int_id, token, future):
+        # type: (str, object, Future) -> None
+        if future.exception() is None:
+            return
+        # a modification that failed is not acknowledged: the one kept is sent instead
+        with self._lock:
+            self.stats.failed += 1
+            # unless the modification timed out or was acknowledged meanwhile
+            if self._in_flight.get(int_id) is not token:
+                return
+            self._stop(int_id)
+            to_send = self._release(int_id) if int_id in self._pending else []
+        self._send_all(to_send)
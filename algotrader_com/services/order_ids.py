@@ -0,0 +1,135 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+
+from py4j.protocol import Py4JError
+
+from algotrader_com.domain.utils import is_missing_java_method
+
+
+class OrderIdAllocator:
+    """Hands out order int_ids reserved from AlgoTrader in blocks, one block per order class and account.
+       A block is reserved with a single call. When the ids left of a block reach low_water_mark the next block is
+       reserved on a background thread, so get_next_order_id calls after the first one don't call AlgoTrader.
+
+       Reserved ids not used are skipped: ids of orders sent later are not consecutive.
+
+       Initialized by <i>PythonToAlgoTraderInterface</i> as its <i>order_id_allocator</i>, set as the
+       <i>order_id_allocator</i> of its <i>order_service</i> by <i>prepare_services</i>.
+
+       Attributes:
+           order_service (algotrader_com.services.order.OrderService): service calling AlgoTrader, set by
+               <i>PythonToAlgoTraderInterface.prepare_services</i>
+           block_size (int): number of ids reserved per call
+           low_water_mark (int): number of ids left at which the next block is reserved
+    """
+
+    def __init__(self, order_service, block_size=100, low_water_mark=20):
+        # type: (object, int, int) -> None
+        """
+           Arguments:
+               order_service (algotrader_com.services.order.OrderService): &nbsp;
+               block_size (int): &nbsp;
+               low_water_mark (int): &nbsp;
+        """
+        self.order_service = order_service
+        self.block_size = block_size
+        self.low_water_mark = low_water_mark
+        self._ids = {}  # type: Dict[Tuple[str, int], Deque[str]]
+        self._refilling = set()  # type: Set[Tuple[str, int]]
+        self._lock = threading.Lock()
+        self._refilled = threading.Condition(self._lock)
+        # blocks are reserved with one call unless AlgoTrader does not provide getNextOrderIds
+        self._reserve_blocks = True
+        # incremented by flush, blocks reserved before are discarded
+        self._generation = 0
+
+    def next_id(self, java_class, account_id):
+        # type: (str, int) -> str
+        """
+           Arguments:
+               java_class (str): Java order entity class, e.g. "ch.algotrader.entity.trade.MarketOrder"
+               account_id (int): &nbsp;
+           Returns:
+               str: next order id
+        """
+        key = (java_class, account_id)
+        with self._refilled:
+            # a block being reserved in the background is waited for rather than reserving another one
+            while not self._ids.get(key) and key in self._refilling:
+                self._refilled.wait()
+            ids = self._ids.get(key)
+            if ids:
+                int_id = ids.popleft()
+                self._refill_if_low(key, ids)
+                return int_id
+            # concurrent callers wait for the block reserved below
+            self._refilling.add(key)
+            generation = self._generation
+        # no id left, e.g. on the first call: reserved on the calling thread
+        try:
+            reserved = self._reserve(java_class, account_id, self.block_size if self._reserve_blocks else 1)
+        except BaseException:
+            with self._lock:
+                self._refilling.discard(key)
+                self._refilled.notify_all()
+            raise
+        with self._lock:
+            ids = self._ids.setdefault(key, deque())
+            if generation == self._generation:
+                ids.extend(reserved[1:])
+            self._refilling.discard(key)
+            self._refilled.notify_all()
+            self._refill_if_low(key, ids)
+        return reserved[0]
+
+    def get_available(self, java_class, account_id):
+        # type: (str, int) -> int
+        """
+           Returns:
+               int: number of reserved ids left for the order class and account
+        """
+        with self._lock:
+            return len(self._ids.get((java_class, account_id), ()))
+
+    def flush(self):
+        # type: () -> None
+        """Discards the reserved ids, e.g. when the strategy is re-instantiated between optimization runs."""
+        with self._lock:
+            self._ids.clear()
+            self._generation += 1
+
+    def _refill_if_low(self, key, ids):
+        # type: (Tuple[str, int], Deque[str]) -> None
+        # called with the lock held
+        if len(ids) > self.low_water_mark or key in self._refilling:
+            return
+        self._refilling.add(key)
+        thread = threading.Thread(target=self._refill, args=(key, self._generation), name="OrderIdRefill",
+                                  daemon=True)
+        thread.start()
+
+    def _refill(self, key, generation):
+        # type: (Tuple[str, int], int) -> None
+        try:
+            reserved = self._reserve(key[0], key[1], self.block_size)
+            with self._lock:
+                if generation == self._generation:
+                    self._ids.setdefault(key, deque()).extend(reserved)
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+                self._refilled.notify_all()
+
+    def _reserve(self, java_class, account_id, count):
+        # type: (str, int, int) -> List[str]
+        # noinspection PyProtectedMember
+        service = self.order_service._service
+        if self._reserve_blocks:
+            try:
+                return list(service.getNextOrderIds(java_class, account_id, count))
+            except Py4JError as error:
+                if not is_missing_java_method(error):
+                    raise
+                self._reserve_blocks = False
+        return [service.getNextOrderId(java_class, account_id) for _ in range(count)]
@@ -0,0 +1,308 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from algotrader_com.domain.entity import Fill, OrderCompletion, OrderStatus
+from algotrader_com.domain.order import Order
+from algotrader_com.services.order_lookup import OrderLookupService
+
+# statuses after which an order receives no more executions
+TERMINAL_STATUSES = frozenset(["EXECUTED", "CANCELED", "REJECTED", "TARGET_REACHED", "EXPIRED"])
+
+
+class OrderState:
+    """Current state of an order known to LocalOrderStore.
+
+       Attributes:
+           int_id (str): &nbsp;
+           order (algotrader_com.domain.order.Order): the order, None until on_order or track, its last_status is
+               kept up to date
+           status (str): "OPEN", "SUBMITTED", "PARTIALLY_EXECUTED", "EXECUTED", "CANCELED", "REJECTED",
+               "CANCEL_FAILED", ...
+           filled_quantity (Decimal): &nbsp;
+           remaining_quantity (Decimal): &nbsp;
+           avg_price (Decimal): average price of the filled quantity
+           date_time (datetime): time of the last status, fill or completion
+    """
+
+    __slots__ = ("int_id", "order", "status", "filled_quantity", "remaining_quantity", "avg_price", "date_time",
+                 "_fill_quantity", "_fill_value")
+
+    def __init__(self, int_id):
+        # type: (str) -> None
+        self.int_id = int_id
+        self.order = None  # type: Optional[Order]
+        self.status = None  # type: Optional[str]
+        self.filled_quantity = Decimal(0)
+        self.remaining_quantity = None  # type: Optional[Decimal]
+        self.avg_price = None  # type: Optional[Decimal]
+        self.date_time = None  # type: Optional[datetime]
+        self._fill_quantity = Decimal(0)
+        self._fill_value = Decimal(0)
+
+    @property
+    def active(self):
+        # type: () -> bool
+        return self.status not in TERMINAL_STATUSES
+
+    def _set_status(self, status):
+        # type: (str) -> None
+        self.status = status
+        if self.order is not None:
+            self.order.last_status = status
+
+
+class LocalOrderStore:
+    """Python side state of the orders of the strategy, driven by the on_order, on_order_status, on_fill and
+       on_order_completion events. Answers active order queries of OrderLookupService from indexes by security,
+       strategy (portfolio) and account without calling AlgoTrader, in time proportional to the number of orders
+       returned.
+
+       Orders sent through OrderService.send_order are tracked when sent, so the returned order objects have an
+       up-to-date last_status. Orders active before connecting can be loaded with load_active_orders.
+       Completed orders are kept up to max_completed_orders, as are the states of statuses and fills of orders not
+       tracked, e.g. received before send_order returned or after the order was forgotten.
+       The events must not be excluded with subscribe_to_only_some_event_handler_methods.
+       The methods are thread safe: orders are tracked on OrderService worker threads while events arrive.
+
+       Initialized by <i>PythonToAlgoTraderInterface</i> as its <i>order_store</i>.
+    """
+
+    def __init__(self, max_completed_orders=1000):
+        # type: (int) -> None
+        """
+           Arguments:
+               max_completed_orders (int): number of orders kept after reaching a terminal status, the ones completed
+                   first are forgotten first
+        """
+        self.max_completed_orders = max_completed_orders
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self):
+        # type: () -> None
+        self._states = {}  # type: Dict[str, OrderState]
+        # active order states by int_id, per security id, portfolio id and account id
+        self._active = {}  # type: Dict[str, OrderState]
+        self._active_by_security = {}  # type: Dict[int, Dict[str, OrderState]]
+        self._active_by_portfolio = {}  # type: Dict[int, Dict[str, OrderState]]
+        self._active_by_account = {}  # type: Dict[int, Dict[str, OrderState]]
+        # int_ids of the orders in a terminal status, in the order they completed
+        self._completed = OrderedDict()  # type: OrderedDict[str, None]
+        # int_ids of the active states without an order, in the order they were created
+        self._untracked = OrderedDict()  # type: OrderedDict[str, None]
+
+    def track(self, order):
+        # type: (Order) -> OrderState
+        """Adds an order or updates its attributes, e.g. after it was sent or modified.
+           The first order object tracked for an int_id is kept: the attributes of later objects with the same int_id
+           (e.g. from on_order or the order returned by send_order) are copied onto it, so it stays up to date.
+
+           Arguments:
+               order (algotrader_com.domain.order.Order): order with an int_id
+           Returns:
+               OrderState
+        """
+        with self._lock:
+            state = self._state(order.int_id)
+            if state.order is None:
+                state.order = order
+                self._untracked.pop(order.int_id, None)
+            elif state.order is not order:
+                self._unindex(state)
+                vars(state.order).update((name, value) for name, value in vars(order).items() if value is not None)
+            # the status of the order is newer unless the order already completed
+            if order.last_status is not None and state.active:
+                state.status = order.last_status
+            state.order.last_status = state.status
+            if state.remaining_quantity is None and state.order.quantity is not None:
+                state.remaining_quantity = state.order.quantity - state.filled_quantity
+            if state.active:
+                self._index(state)
+            else:
+                self._complete(state)
+            return state
+
+    def load_active_orders(self, order_lookup_service):
+        # type: (OrderLookupService) -> None
+        """Tracks the active orders of AlgoTrader with a single call, e.g. in on_start."""
+        orders = order_lookup_service.get_all_active_orders()
+        with self._lock:
+            for order in orders:
+                self.track(order)
+
+    def on_order(self, order):
+        # type: (Order) -> None
+        self.track(order)
+
+    def on_order_status(self, order_status):
+        # type: (OrderStatus) -> None
+        with self._lock:
+            state = self._state(order_status.int_id)
+            if not state.active:
+                # late statuses of a completed order are ignored
+                return
+            state.date_time = order_status.date_time
+            if order_status.filled_quantity is not None and order_status.filled_quantity >= state.filled_quantity:
+                state.filled_quantity = order_status.filled_quantity
+                state.avg_price = order_status.avg_price
+            if order_status.remaining_quantity is not None:
+                state.remaining_quantity = order_status.remaining_quantity
+            state._set_status(order_status.status)
+            if not state.active:
+                self._complete(state)
+
+    def on_fill(self, fill):
+        # type: (Fill) -> None
+        with self._lock:
+            state = self._state(fill.order_int_id)
+            state.date_time = fill.date_time
+            state._fill_quantity += fill.quantity
+            state._fill_value += fill.quantity * fill.price
+            # fills arriving before their order status update the quantities first
+            if state._fill_quantity > state.filled_quantity:
+                state.filled_quantity = state._fill_quantity
+                state.avg_price = state._fill_value / state._fill_quantity
+                if state.order is not None and state.order.quantity is not None:
+                    state.remaining_quantity = state.order.quantity - state.filled_quantity
+
+    def on_order_completion(self, order_completion):
+        # type: (OrderCompletion) -> None
+        with self._lock:
+            state = self._state(order_completion.order_int_id)
+            state.date_time = order_completion.date_time
+            if order_completion.filled_quantity is not None:
+                state.filled_quantity = order_completion.filled_quantity
+                state.avg_price = order_completion.avg_price
+            state.remaining_quantity = order_completion.remaining_quantity
+            state._set_status(order_completion.status)
+            if not state.active:
+                self._complete(state)
+
+    def on_send_failed(self, int_id):
+        # type: (str) -> None
+        """Marks an order tracked before it was sent as REJECTED when sending it failed, e.g. by
+           OrderService.send_order_async."""
+        with self._lock:
+            state = self._states.get(int_id)
+            if state is None or not state.active:
+                return
+            state._set_status("REJECTED")
+            self._complete(state)
+
+    def get_order_state(self, int_id):
+        # type: (str) -> Optional[OrderState]
+        with self._lock:
+            return self._states.get(int_id)
+
+    def get_order_by_int_id(self, int_id):
+        # type: (str) -> Optional[Order]
+        with self._lock:
+            state = self._states.get(int_id)
+            return None if state is None else state.order
+
+    def get_active_order_by_int_id(self, int_id):
+        # type: (str) -> Optional[Order]
+        with self._lock:
+            state = self._active.get(int_id)
+            return None if state is None else state.order
+
+    def get_status_by_int_id(self, int_id):
+        # type: (str) -> Optional[str]
+        with self._lock:
+            state = self._states.get(int_id)
+            return None if state is None else state.status
+
+    def get_all_active_orders(self):
+        # type: () -> List[Order]
+        with self._lock:
+            return [state.order for state in self._active.values()]
+
+    def get_active_orders_by_security(self, security_id):
+        # type: (int) -> List[Order]
+        with self._lock:
+            return [state.order for state in self._active_by_security.get(security_id, {}).values()]
+
+    def get_active_orders_by_strategy(self, strategy_id):
+        # type: (int) -> List[Order]
+        return self.get_active_orders_by_portfolio(strategy_id)
+
+    def get_active_orders_by_portfolio(self, portfolio_id):
+        # type: (int) -> List[Order]
+        with self._lock:
+            return [state.order for state in self._active_by_portfolio.get(portfolio_id, {}).values()]
+
+    def get_active_orders_by_strategy_and_security(self, strategy_id, security_id):
+        # type: (int, int) -> List[Order]
+        return self.get_active_orders_by_portfolio_and_security(strategy_id, security_id)
+
+    def get_active_orders_by_portfolio_and_security(self, portfolio_id, security_id):
+        # type: (int, int) -> List[Order]
+        with self._lock:
+            by_portfolio = self._active_by_portfolio.get(portfolio_id, {})
+            by_security = self._active_by_security.get(security_id, {})
+            if len(by_portfolio) <= len(by_security):
+                return [state.order for int_id, state in by_portfolio.items() if int_id in by_security]
+            return [state.order for int_id, state in by_security.items() if int_id in by_portfolio]
+
+    def get_all_active_orders_by_account_id(self, account_id):
+        # type: (int) -> List[Order]
+        with self._lock:
+            return [state.order for state in self._active_by_account.get(account_id, {}).values()]
+
+    def flush(self):
+        # type: () -> None
+        """Forgets all orders."""
+        with self._lock:
+            self._clear()
+
+    def _state(self, int_id):
+        # type: (str) -> OrderState
+        # called with the lock held
+        state = self._states.get(int_id)
+        if state is None:
+            state = self._states[int_id] = OrderState(int_id)
+            # an event of an order not tracked, dropped unless the order is tracked or completes
+            self._untracked[int_id] = None
+            while len(self._untracked) > self.max_completed_orders:
+                oldest, _ = self._untracked.popitem(last=False)
+                self._states.pop(oldest, None)
+        return state
+
+    def _complete(self, state):
+        # type: (OrderState) -> None
+        # called with the lock held
+        self._unindex(state)
+        self._untracked.pop(state.int_id, None)
+        if state.int_id in self._completed:
+            return
+        self._completed[state.int_id] = None
+        while len(self._completed) > self.max_completed_orders:
+            int_id, _ = self._completed.popitem(last=False)
+            self._states.pop(int_id, None)
+
+    def _index(self, state):
+        # type: (OrderState) -> None
+        if not state.active:
+            return
+        order = state.order
+        self._active[state.int_id] = state
+        self._active_by_security.setdefault(order.security_id, {})[state.int_id] = state
+        self._active_by_portfolio.setdefault(order.portfolio_id, {})[state.int_id] = state
+        self._active_by_account.setdefault(order.account_id, {})[state.int_id] = state
+
+    def _unindex(self, state):
+        # type: (OrderState) -> None
+        if self._active.pop(state.int_id, None) is None:
+            return
+        order = state.order
+        for index, key in ((self._active_by_security, order.security_id),
+                           (self._active_by_portfolio, order.portfolio_id),
+                           (self._active_by_account, order.account_id)):
+            orders = index.get(key)
+            if orders is not None:
+                orders.pop(state.int_id, None)
+                if not orders:
+                    del index[key]
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional, Sequence
 
+from algotrader_com.domain.aggregation import BarAggregator
 from algotrader_com.domain.entity import LifecycleEvent, OrderStatus, Fill, Transaction, PositionMutation, \
     SessionEvent, AccountEvent, CashBalance, OrderCompletion, ReconciliationEvent, OrderRequestStatusEvent, RfqQuote, \
     LogEvent, HealthStatus, RfqQuoteRequestReject, TradedVolume, ExternalBalance, Transfer
@@ -23,10 +24,26 @@ class StrategyService:
        """
 
     python_to_at_entry_point = None  # type: Optional[PythonToAlgoTraderInterface]
+    bar_aggregators = ()  # type: Sequence[BarAggregator]
 
     def __init__(self):
         self.test_mode = False
 
+    def add_bar_aggregator(self, bar_sizes, price="last"):
+        # type: (List[str], str) -> BarAggregator
+        """Builds bars of the bar sizes from the ticks and trades received and calls on_bar when a bar closes,
+        see algotrader_com.domain.aggregation.BarAggregator.
+
+        Arguments:
+            bar_sizes (List of str): e.g. ["MIN_1", "MIN_5"]
+            price (str): tick price used: "last", "bid", "ask" or "mid"
+        Returns:
+            algotrader_com.domain.aggregation.BarAggregator
+        """
+        aggregator = BarAggregator(bar_sizes, self.on_bar, price)
+        self.bar_aggregators = list(self.bar_aggregators) + [aggregator]
+        return aggregator
+
     def on_init(self, lifecycle_event):
         # type: (LifecycleEvent) -> None
         """
@@ -96,6 +113,20 @@ class StrategyService:
         """
         return
 
+    def on_ticks(self, ticks):
+        # type: (List[Tick]) -> None
+        """
+        Called with a batch of ticks delivered by AlgoTrader in a single callback (onTicks).
+        By default calls on_tick for each tick in order, override to process the whole batch at once.
+        With bar aggregators the batch is split at the ticks closing bars: on_bar is called with the bars closed by
+        a tick after on_ticks with the ticks before it, as with single ticks.
+
+        Arguments:
+            ticks (List of algotrader_com.domain.market_data.Tick): &nbsp;
+        """
+        for tick in ticks:
+            self.on_tick(tick)
+
     def on_bar(self, bar):
         # type: (Bar) -> None
         """
@@ -104,6 +135,18 @@ class StrategyService:
         """
         return
 
+    def on_bars(self, bars):
+        # type: (List[Bar]) -> None
+        """
+        Called with a batch of bars delivered by AlgoTrader in a single callback (onBars).
+        By default calls on_bar for each bar in order, override to process the whole batch at once.
+
+        Arguments:
+            bars (List of algotrader_com.domain.market_data.Bar): &nbsp;
+        """
+        for bar in bars:
+            self.on_bar(bar)
+
     def on_trade(self, trade):
         # type: (Trade) -> None
         """
@@ -0,0 +1,28 @@
+"""Sample TickVO, BarVO, OrderVO and TransactionVO JSON payloads as sent by the Java side of AlgoTrader,
+   shared by the benchmark scripts in this package."""
+
+TICK_JSON = '{"objectType": "Tick", "dateTime": 1646136000123, "connectorDescriptor": {"descriptor": "DRB"}, ' \
+            '"securityId": 14330, "last": 43512.5, "lastDateTime": 1646136000101, "bid": 43510.0, ' \
+            '"ask": 43510.5, "volBid": 12560.0, "volAsk": 4210.0, "vol": 1.0e7}'
+
+BAR_JSON = '{"objectType": "Bar", "dateTime": 1646136000000, "connectorDescriptor": {"descriptor": "DRB"}, ' \
+           '"securityId": 14330, "barSize": "MIN_1", "open": 43498.5, "high": 43533.0, "low": 43490.0, ' \
+           '"close": 43512.5, "vol": 895310.0, "vwap": 43508.27}'
+
+ORDER_JSON = '{"@class": "ch.algotrader.entity.trade.LimitOrderVO", "id": 8812, "intId": "drb1.17.0", ' \
+             '"extId": "9823712311", "parentIntId": null, "dateTime": 1646136000150, "side": "BUY", ' \
+             '"quantity": 1000.0, "tif": "GTC", "tifDateTime": null, "exchangeOrder": false, "exchangeId": 21, ' \
+             '"parentOrderId": null, "securityId": 14330, "accountId": 57, "portfolioId": 3, ' \
+             '"lastStatus": "SUBMITTED", "limit": 43510.0}'
+
+TRANSACTION_JSON = '{"id": 40112, "uuid": "5b1e0d8e-0c1f-4f55-9d0e-3f6c2d6c9a11", "dateTime": 1646136000410, ' \
+                   '"settlementDate": 1646092800000, "extId": "trd-771245", "intOrderId": "drb1.17.0", ' \
+                   '"extOrderId": "9823712311", "quantity": 1000.0, "price": 43510.0, ' \
+                   '"executionCommission": 0.0, "clearingCommission": 0.0, "fee": 0.01149, "currency": "BTC", ' \
+                   '"type": "BUY", "accountId": 57, "securityId": 14330, "portfolioId": 3}'
+
+
+def json_array(vo_json, count):
+    # type: (str, int) -> str
+    """Returns a JSON array string with count copies of the given JSON object string."""
+    return "[" + ",".join([vo_json] * count) + "]"
@@ -0,0 +1,61 @@
+"""Compares per-event (onTick / onBar) and batched (onTicks / onBars) callback throughput of
+   AlgoTraderToPythonInterface. Measures the Python side only, i.e. decoding and dispatching to the strategy;
+   the Py4J socket round trip saved per batched event comes on top of this.
+
+   Run from the repository root:
+       python -m benchmarks.bench_batched_callbacks [events] [batch_size]
+"""
+import sys
+import time
+
+from algotrader_com.interfaces.at2py import AlgoTraderToPythonInterface
+from algotrader_com.interfaces.py2at import PythonToAlgoTraderInterface
+from algotrader_com.services.strategy import StrategyService
+from benchmarks._payloads import TICK_JSON, BAR_JSON, json_array
+
+
+class _CountingStrategy(StrategyService):
+
+    def __init__(self):
+        StrategyService.__init__(self)
+        self.ticks = 0
+        self.bars = 0
+
+    def on_tick(self, tick):
+        self.ticks += 1
+
+    def on_bar(self, bar):
+        self.bars += 1
+
+
+def _create_interface():
+    at_to_python = AlgoTraderToPythonInterface(_CountingStrategy())
+    python_to_at = PythonToAlgoTraderInterface(None)
+    python_to_at.portfolio_value_service = object()  # marks services as prepared, no AlgoTrader needed
+    at_to_python.with_python_to_at_entry_point(python_to_at)
+    return at_to_python
+
+
+def _run(label, callback, payloads, events):
+    start = time.perf_counter()
+    for payload in payloads:
+        callback(payload)
+    elapsed = time.perf_counter() - start
+    print("%-22s %10.0f events/s  %6.2f us/event" % (label, events / elapsed, elapsed / events * 1e6))
+
+
+def main(events=200000, batch_size=500):
+    interface = _create_interface()
+    batches = events // batch_size
+    events = batches * batch_size
+    tick_batch = json_array(TICK_JSON, batch_size)
+    bar_batch = json_array(BAR_JSON, batch_size)
+    print("%d events, batch size %d" % (events, batch_size))
+    _run("onTick (per event)", interface.onTick, [TICK_JSON] * events, events)
+    _run("onTicks (batched)", interface.onTicks, [tick_batch] * batches, events)
+    _run("onBar (per event)", interface.onBar, [BAR_JSON] * events, events)
+    _run("onBars (batched)", interface.onBars, [bar_batch] * batches, events)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
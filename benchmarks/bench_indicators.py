@@ -0,0 +1,109 @@
+"""Compares the streaming indicators of algotrader_com.indicators with the code of the sample strategies:
+   the EMA of ema-python-strategy.py (lists with pop(0) and _numpy_ewma_vectorized_v2 over the window on every bar)
+   and the SMA of simple-test.py (statistics.mean over a deque of Decimals on every tick).
+   The sample EMA restarts from the oldest value of its window on every bar, so its last value differs from the
+   streaming EMA over all values.
+
+   Run from the repository root:
+       python -m benchmarks.bench_indicators [updates]
+"""
+import sys
+import time
+from collections import deque
+from decimal import Decimal
+from statistics import mean
+
+import numpy as np
+
+from algotrader_com.indicators import EMA, SMA
+
+EMA_PERIOD_SHORT = 10
+EMA_PERIOD_LONG = 20
+SMA_PERIOD = 1000
+
+
+def _numpy_ewma_vectorized_v2(data, window):
+    """Copy of ema-python-strategy.py."""
+    alpha = 2 / (window + 1.0)
+    alpha_rev = 1 - alpha
+    n = data.shape[0]
+    pows = alpha_rev ** (np.arange(n + 1))
+    scale_arr = 1 / pows[:-1]
+    offset = data[0] * pows[1:]
+    pw0 = alpha * alpha_rev ** (n - 1)
+    mult = data * pw0 * scale_arr
+    cumsums = mult.cumsum()
+    out = offset + cumsums * scale_arr[::-1]
+    return out
+
+
+def _sample_ema_difference(closes):
+    window1 = []
+    window2 = []
+    difference = None
+    for close in closes:
+        window1.append(float(close))
+        window2.append(float(close))
+        if len(window1) > EMA_PERIOD_SHORT + 1:
+            window1.pop(0)
+        if len(window2) > EMA_PERIOD_LONG + 1:
+            window2.pop(0)
+        if len(window2) >= EMA_PERIOD_LONG:
+            window1.pop(0)
+            ema1 = _numpy_ewma_vectorized_v2(np.array(window1), EMA_PERIOD_SHORT)
+            ema2 = _numpy_ewma_vectorized_v2(np.array(window2), EMA_PERIOD_LONG)
+            difference = ema1[-1] - ema2[-1]
+    return difference
+
+
+def _streaming_ema_difference(closes):
+    ema1 = EMA(EMA_PERIOD_SHORT)
+    ema2 = EMA(EMA_PERIOD_LONG)
+    difference = None
+    for close in closes:
+        difference = ema1.update(close) - ema2.update(close)
+    return difference
+
+
+def _sample_sma(spreads):
+    window = deque(maxlen=SMA_PERIOD)
+    value = Decimal("0")
+    for spread in spreads:
+        window.append(spread)
+        value = mean(window)
+    return value
+
+
+def _streaming_sma(spreads):
+    sma = SMA(SMA_PERIOD)
+    value = None
+    for spread in spreads:
+        value = sma.update(spread)
+    return value
+
+
+def _run(name, function, values):
+    started = time.perf_counter()
+    result = function(values)
+    seconds = time.perf_counter() - started
+    print("%-36s %8.2f us/update   last=%.6f" % (name, seconds / len(values) * 1e6, float(result)))
+
+
+def main(updates=20000):
+    rng = np.random.default_rng(0)
+    closes = [Decimal(str(round(price, 2))) for price in 100 + np.cumsum(rng.normal(0, 0.1, updates))]
+    spreads = [Decimal(str(round(spread, 2))) for spread in rng.normal(0, 5, updates)]
+    _run("EMA cross, ema-python-strategy.py", _sample_ema_difference, closes)
+    _run("EMA cross, indicators.EMA", _streaming_ema_difference, closes)
+    _run("SMA(1000), simple-test.py", _sample_sma, spreads)
+    _run("SMA(1000), indicators.SMA", _streaming_sma, spreads)
+    started = time.perf_counter()
+    SMA(SMA_PERIOD).update_many(np.array(spreads, dtype="float64"))
+    print("%-36s %8.2f us/update" % ("SMA(1000) warmup, update_many", (time.perf_counter() - started) / updates * 1e6))
+    started = time.perf_counter()
+    EMA(EMA_PERIOD_LONG).update_many(np.array(closes, dtype="float64"))
+    print("%-36s %8.2f us/update" % ("EMA(20) warmup, update_many", (time.perf_counter() - started) / updates * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,41 @@
+"""Micro-benchmark of the JSON decoder backends of Conversions.unmarshall against the former jsonpickle.decode
+   path, over recorded TickVO, BarVO, OrderVO and TransactionVO payloads. Also checks that all backends return
+   identical dictionaries.
+
+   Run from the repository root:
+       python -m benchmarks.bench_json_decoding [iterations]
+"""
+import json
+import sys
+import timeit
+
+import jsonpickle
+
+from algotrader_com.domain.conversions import Conversions
+from benchmarks._payloads import TICK_JSON, BAR_JSON, ORDER_JSON, TRANSACTION_JSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PAYLOADS = [("Tick", TICK_JSON), ("Bar", BAR_JSON), ("Order", ORDER_JSON), ("Transaction", TRANSACTION_JSON)]
+
+
+def main(iterations=100000):
+    decoders = [("jsonpickle.decode", jsonpickle.decode), ("json.loads", json.loads)]
+    if orjson is not None:
+        decoders.append(("orjson.loads", orjson.loads))
+    decoders.append(("unmarshall (%s)" % Conversions.get_json_decoder(), Conversions.unmarshall))
+
+    for name, payload in PAYLOADS:
+        expected = jsonpickle.decode(payload)
+        print("%s (%d bytes)" % (name, len(payload)))
+        for label, decoder in decoders:
+            assert decoder(payload) == expected, label + " output differs from jsonpickle.decode"
+            seconds = timeit.timeit(lambda: decoder(payload), number=iterations)
+            print("    %-24s %8.3f us/decode" % (label, seconds / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
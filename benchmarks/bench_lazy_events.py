@@ -0,0 +1,49 @@
+"""Measures the per-event cost of decoding a Tick and a Bar and reading a few of their fields, with eager events and with
+   lazy events (Conversions.set_lazy_market_data_events), as well as the cost of reading every field.
+
+   Run from the repository root:
+       python -m benchmarks.bench_lazy_events [iterations]
+"""
+import sys
+import timeit
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import Tick, Bar
+from benchmarks._payloads import TICK_JSON, BAR_JSON
+
+
+def _read_tick_quote(tick_dict):
+    tick = Tick.convert_from_json_object(tick_dict)
+    return tick.security_id, tick.bid, tick.ask
+
+
+def _read_tick_all(tick_dict):
+    tick = Tick.convert_from_json_object(tick_dict)
+    return (tick.date_time, tick.connector_descriptor, tick.security_id, tick.last, tick.last_date_time, tick.bid,
+            tick.ask, tick.vol_bid, tick.vol_ask, tick.vol)
+
+
+def _read_bar_close(bar_dict):
+    bar = Bar.convert_from_json_object(bar_dict)
+    return bar.security_id, bar.close
+
+
+def main(iterations=100000):
+    tick_dict = Conversions.unmarshall(TICK_JSON)
+    bar_dict = Conversions.unmarshall(BAR_JSON)
+    cases = (("tick: security_id, bid, ask", _read_tick_quote, tick_dict),
+             ("tick: all fields", _read_tick_all, tick_dict),
+             ("bar: security_id, close", _read_bar_close, bar_dict))
+    for name, handler, vo_dict in cases:
+        results = []
+        for lazy in (False, True):
+            Conversions.set_lazy_market_data_events(lazy)
+            results.append(handler(vo_dict))
+            seconds = timeit.timeit(lambda: handler(vo_dict), number=iterations)
+            print("%-28s %-6s %6.2f us/event" % (name, "lazy" if lazy else "eager", seconds / iterations * 1e6))
+        assert results[0] == results[1], "lazy and eager events differ"
+    Conversions.set_lazy_market_data_events(False)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,49 @@
+"""Measures the per-tick decode cost (JSON string to Tick object) in each numeric mode of
+   Conversions.set_numeric_mode, with eager and with lazy datetimes (Conversions.set_lazy_date_times).
+   Checks that a TickRingBuffer stores the same values for eager and lazy ticks in each mode.
+
+   Run from the repository root:
+       python -m benchmarks.bench_numeric_modes [iterations]
+"""
+import sys
+import timeit
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import Tick
+from algotrader_com.domain.ring_buffer import TickRingBuffer
+from benchmarks._payloads import TICK_JSON
+
+
+def _decode_tick():
+    return Tick.convert_from_json_object(Conversions.unmarshall(TICK_JSON))
+
+
+def _check_ring_buffer(mode):
+    # eager and lazy (JSON backed) events take different paths into the buffer
+    buffer = TickRingBuffer(2)
+    for lazy_events in (False, True):
+        Conversions.set_lazy_market_data_events(lazy_events)
+        buffer.append_event(_decode_tick())
+    Conversions.set_lazy_market_data_events(False)
+    bid = buffer.view("bid")
+    if bid[0] != bid[1]:
+        raise Exception("TickRingBuffer stores eager bid %r and lazy bid %r in numeric mode %s." % (
+            bid[0], bid[1], mode))
+
+
+def main(iterations=100000):
+    for lazy_date_times in (False, True):
+        Conversions.set_lazy_date_times(lazy_date_times)
+        for mode in ("decimal", "float", "scaled"):
+            Conversions.set_numeric_mode(mode)
+            tick = _decode_tick()
+            _check_ring_buffer(mode)
+            seconds = timeit.timeit(_decode_tick, number=iterations)
+            print("%-8s %-14s %6.2f us/tick   bid=%r" % (
+                mode, "lazy datetimes" if lazy_date_times else "", seconds / iterations * 1e6, tick.bid))
+    Conversions.set_numeric_mode("decimal")
+    Conversions.set_lazy_date_times(False)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
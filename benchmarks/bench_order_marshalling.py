@@ -0,0 +1,79 @@
+"""Benchmarks Conversions.marshall against the former jsonpickle + string-replace implementation for every
+   order type in algotrader_com.domain.order, checking that both produce the same JSON and that marshalling
+   leaves the order unmodified.
+
+   Run from the repository root:
+       python -m benchmarks.bench_order_marshalling [iterations]
+"""
+import inspect
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+import jsonpickle
+import stringcase
+
+from algotrader_com.domain import order as order_module
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.entity import RoutingTarget
+
+_PRICE_FIELDS = ["limit", "stop", "trailing_amount", "increment", "target", "max_offset", "min_offset",
+                 "initial_offset"]
+
+
+def _jsonpickle_marshall(obj, class_name=None):
+    """The implementation Conversions.marshall replaced, kept here as the baseline."""
+    if class_name is not None:
+        obj._class_name = class_name
+    json_value = jsonpickle.dumps(obj, unpicklable=False)
+    if class_name is not None:
+        delattr(obj, "_class_name")
+    if class_name is not None:
+        json_value = json_value.replace("_class_name", "@class")
+    if hasattr(obj, "__dict__"):
+        for _property in obj.__dict__:
+            camel_cased = stringcase.camelcase(_property)
+            json_value = json_value.replace("\"" + _property + "\"", "\"" + camel_cased + "\"")
+    return json_value
+
+
+def _create_orders():
+    orders = []
+    for _, order_class in inspect.getmembers(order_module, inspect.isclass):
+        if order_class is order_module.Order or not issubclass(order_class, order_module.Order) \
+                or "get_java_class" not in order_class.__dict__:
+            continue
+        order = order_class()
+        order.int_id = "drb1.17.0"
+        order.date_time = datetime(2022, 3, 1, 12, 30)
+        order.side = "BUY"
+        order.quantity = Decimal("1000")
+        order.tif = "GTC"
+        order.exchange_order = False
+        order.security_id = 14330
+        order.account_id = 57
+        order.portfolio_id = 3
+        for field in _PRICE_FIELDS:
+            if hasattr(order, field):
+                setattr(order, field, Decimal("43510.5"))
+        if hasattr(order, "routing_candidates"):
+            order.routing_candidates = [RoutingTarget(14330, 57, 21), RoutingTarget(16172, 11227, 22)]
+        orders.append(order)
+    return orders
+
+
+def main(iterations=20000):
+    for order in _create_orders():
+        class_name = order.get_java_class()
+        before = dict(order.__dict__)
+        assert Conversions.marshall(order, class_name) == _jsonpickle_marshall(order, class_name), class_name
+        assert order.__dict__ == before, class_name + " modified by marshall"
+        old = timeit.timeit(lambda: _jsonpickle_marshall(order, class_name), number=iterations) / iterations
+        new = timeit.timeit(lambda: Conversions.marshall(order, class_name), number=iterations) / iterations
+        print("%-24s jsonpickle %7.2f us   field maps %7.2f us   %5.1fx" % (
+            order.__class__.__name__, old * 1e6, new * 1e6, old / new))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+"""Compares loading historical ticks as a list of Tick objects (HistoricalDataService.get_ticks_by_min_date) with
+   loading them as a TickSeries (get_tick_series_by_min_date): build time, memory held and a time range slice.
+
+   Run from the repository root:
+       python -m benchmarks.bench_series [count]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import Tick
+from algotrader_com.domain.series import TickSeries
+from benchmarks._payloads import TICK_JSON
+
+
+def _tick_jsons(count):
+    tick_dict = json.loads(TICK_JSON)
+    start = tick_dict["dateTime"]
+    tick_jsons = []
+    for i in range(count):
+        tick_dict["dateTime"] = start + i * 100
+        tick_dict["bid"] = 43510.0 + i % 50
+        tick_jsons.append(json.dumps(tick_dict))
+    return tick_jsons, start
+
+
+def _tick_list(tick_jsons):
+    return [Tick.convert_from_json_object(Conversions.unmarshall(vo_json)) for vo_json in tick_jsons]
+
+
+def _measure(build, tick_jsons):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(tick_jsons)
+    seconds = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, seconds, size
+
+
+def main(count=1000000):
+    tick_jsons, start = _tick_jsons(count)
+    for name, build in (("List[Tick]", _tick_list), ("TickSeries", TickSeries.from_json)):
+        result, seconds, size = _measure(build, tick_jsons)
+        print("%-10s %d ticks %7.2f s %8.1f MB held" % (name, count, seconds, size / 1e6))
+        del result
+    series = TickSeries.from_json(tick_jsons)
+    min_millis = start + count // 4 * 100
+    max_millis = start + count // 2 * 100
+    started = time.perf_counter()
+    window = series.between(min_millis, max_millis)
+    print("between    %d ticks %7.1f us, shares memory: %s" % (
+        len(window), (time.perf_counter() - started) * 1e6, window.bid.base is not None))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,55 @@
+"""Measures the memory held by a list of ticks, in bytes per event, for the slot-based Tick and for a dict-backed class
+   with the same attributes (the representation Tick had before using __slots__).
+   All ticks share the same field values, so the numbers only reflect the per-object overhead.
+
+   Run from the repository root (10M dict-backed ticks need several GB of memory):
+       python -m benchmarks.bench_tick_memory [count]
+"""
+import sys
+import tracemalloc
+
+from algotrader_com.domain.conversions import Conversions
+from algotrader_com.domain.market_data import Tick
+from benchmarks._payloads import TICK_JSON
+
+
+class _DictBackedTick:
+    def __init__(self, tick):
+        self._date_time = tick._date_time
+        self._date_time_millis = tick._date_time_millis
+        self.connector_descriptor = tick.connector_descriptor
+        self.security_id = tick.security_id
+        self.last = tick.last
+        self._last_date_time = tick._last_date_time
+        self._last_date_time_millis = tick._last_date_time_millis
+        self.bid = tick.bid
+        self.ask = tick.ask
+        self.vol_bid = tick.vol_bid
+        self.vol_ask = tick.vol_ask
+        self.vol = tick.vol
+
+
+def _slot_tick(tick):
+    copied = Tick.__new__(Tick)
+    for name in Tick.__slots__ + ("_date_time", "_date_time_millis", "connector_descriptor", "security_id"):
+        setattr(copied, name, getattr(tick, name))
+    return copied
+
+
+def _bytes_per_event(factory, tick, count):
+    tracemalloc.start()
+    events = [factory(tick) for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return size / count
+
+
+def main(count=10000000):
+    tick = Tick.convert_from_json_object(Conversions.unmarshall(TICK_JSON))
+    for name, factory in (("dict-backed", _DictBackedTick), ("__slots__", _slot_tick)):
+        print("%-12s %d ticks %8.1f bytes/event" % (name, count, _bytes_per_event(factory, tick, count)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -132,7 +132,8 @@ class PairedTestStrategyService(StrategyService):
             ))
             print(f'Created {side} order of {exchange} at price of {price}')
         else:
-            self.python_to_at_entry_point.order_service.modify_order_with_fix_properties(
+            # amends of an order not acknowledged yet are coalesced, only the newest one is sent
+            self.python_to_at_entry_point.order_amend_coalescer.modify_order(
                 self.orders[exchange],
                 properties={
                     'limit': str(price),
@@ -149,7 +150,7 @@ class PairedTestStrategyService(StrategyService):
     def __order_check(self) -> list:
         filled_orders = []
         for exchange in self.orders:
-            # FIXME: will this be updating?
+            # orders returned by send_order are tracked by the order store, which keeps last_status up to date
             if self.orders[exchange].last_status == 'EXECUTED':
                 filled_orders.append(exchange)
         print(f'Filled orders: {" ".join(filled_orders)}')
@@ -291,7 +292,7 @@ class PairedTestStrategyService(StrategyService):
 
 
 # an optional parameter. if not specified, all callback methods are subscribed
-only_subscribe_methods_list = ["onInit", "onStart", "onExit", "onTick"]
+only_subscribe_methods_list = ["onInit", "onStart", "onExit", "onTick", "onOrderStatus"]
 strategy = PairedTestStrategyService()
 _python_to_at_entry_point = connect_to_algotrader(strategy, only_subscribe_methods_list)
 try: